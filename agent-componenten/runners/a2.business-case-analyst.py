@@ -3,105 +3,38 @@
 business-case-analyst.py
 
 Runner script voor business-case-analyst agent.
+De uitvoering (prompt + charter + input -> LLM provider) zit in agent_runtime.py.
 
 Agent: std.a2.business-case-analyst
 Fase: a2
-Charter: C:\gitrepo\standard\artefacten\3-charters-agents\std.agent.charter.a2.business-case-analyst.md
-Gegenereerd: 2026-01-08
+Charter: governance/agent-charters/a2.business-case-analyst.agent.charter
+Gegenereerd: 2026-10-18
 """
 
 import argparse
-import json
 import sys
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Optional
 
+# agent_runtime.py staat naast de runners
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from agent_runtime import (AgentRuntime, ConfigurationError, EXIT_CONFIG_ERROR, add_runtime_arguments,
+                           log, write_result)
 
-class BusinessCaseAnalystAgent:
-    """Agent implementation for business-case-analyst."""
-    
-    def __init__(self, args):
-        """Initialize the agent."""
-        self.args = args
-        self.output_root = Path("<project-workspace>/artefacten")
-        self.charter_path = Path("C:\gitrepo\standard\artefacten\3-charters-agents\std.agent.charter.a2.business-case-analyst.md")
-    
-    def log(self, message: str, msg_type: str = "INFO"):
-        """Log a message."""
-        colors = {
-            "INFO": "\033[96m",
-            "SUCCESS": "\033[92m",
-            "WARNING": "\033[93m",
-            "ERROR": "\033[91m"
-        }
-        reset = "\033[0m"
-        color = colors.get(msg_type, "")
-        print(f"{color}[{msg_type}] {message}{reset}")
-    
-    def validate_inputs(self):
-        """Validate input files."""
-        valid_files = []
-        for file_path in self.args.input_files:
-            path = Path(file_path)
-            if path.exists():
-                valid_files.append(str(path.resolve()))
-                self.log(f"Input bestand toegevoegd: {file_path}")
-            else:
-                self.log(f"Bestand niet gevonden: {file_path}", "WARNING")
-        
-        if not valid_files:
-            raise ValueError("Geen geldige input bestanden gevonden")
-        
-        self.args.input_files = valid_files
-    
-    def run(self) -> Dict:
-        """Execute the agent logic."""
-        try:
-            self.log(f"Starten {agent_name} agent...")
-            
-            # Validate inputs
-            self.validate_inputs()
-            
-            # PLACEHOLDER: Hier zou de daadwerkelijke agent logic komen
-            # Dit zou typisch een LLM call zijn met de prompt uit C:\gitrepo\agent-capabilities\agent-componenten\prompts\a.business-case-analyst.prompt.md
-            
-            self.log("LET OP: Dit is een placeholder runner", "WARNING")
-            self.log("De daadwerkelijke agent-logica zou hier via LLM gebeuren", "WARNING")
-            
-            # Generate output
-            output_file = self.output_root / f"{agent_name}-{datetime.now().strftime('%Y%m%d-%H%M%S')}.md"
-            output_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            output_content = f"""# {agent_name} Output
-
-**Gegenereerd**: {datetime.now().isoformat()}
-**Input bestanden**: {', '.join(self.args.input_files)}
 
-## PLACEHOLDER
-
-Dit is placeholder output. De daadwerkelijke output zou gegenereerd worden
-door de LLM op basis van:
-- Charter: {self.charter_path}
-- Prompt: C:\gitrepo\agent-capabilities\agent-componenten\prompts\a.business-case-analyst.prompt.md
-- Input bestanden
-"""
-            
-            output_file.write_text(output_content, encoding='utf-8')
-            self.log(f"Output geschreven naar: {output_file}", "SUCCESS")
-            
-            return {
-                'status': 'Success',
-                'output_file': str(output_file),
-                'timestamp': datetime.now().isoformat()
-            }
-            
-        except Exception as e:
-            self.log(f"Fout tijdens agent uitvoering: {e}", "ERROR")
-            raise
+AGENT_CONFIG = {'agentId': 'std.a2.business-case-analyst',
+ 'agentName': 'business-case-analyst',
+ 'phase': 'a2',
+ 'prompt': 'a2.business-case-analyst.prompt.md',
+ 'charter': 'governance/agent-charters/a2.business-case-analyst.agent.charter',
+ 'outputRoot': '<project-workspace>/artefacten',
+ 'runtime': {'llmProvider': 'anthropic', 'model': 'claude-sonnet-4-5', 'adapter': 'agent_runtime'},
+ 'qualityGates': ['Nederlands B1',
+                  'Geen technische implementatiedetails in prompt',
+                  'Max 3 aannames (indien van toepassing)',
+                  'Output is Markdown']}
 
 
-def main():
+def main(argv=None):
     """Main entry point."""
     parser = argparse.ArgumentParser(
         description='Runner voor business-case-analyst agent',
@@ -117,10 +50,26 @@ def main():
     parser.add_argument('-v', '--verbose', action='store_true',
                        help='Uitgebreide output')
     
-    args = parser.parse_args()
+    add_runtime_arguments(parser)
+    
+    args = parser.parse_args(argv)
+    
+    runtime = AgentRuntime(AGENT_CONFIG, Path(__file__), provider=args.provider, model=args.model,
+                           use_cache=not args.no_cache)
+    try:
+        result = runtime.run(args.input_files, args.output_file)
+    except ConfigurationError as e:
+        log(f"Configuratiefout: {e}", "ERROR")
+        return EXIT_CONFIG_ERROR
+    except Exception as e:
+        log(f"Fout tijdens agent uitvoering: {e}", "ERROR")
+        return 1
+    
+    if args.result_file:
+        write_result(args.result_file, result)
     
-    agent = BusinessCaseAnalystAgent(args)
-    result = agent.run()
+    if args.verbose:
+        log(f"Resultaat: {result}")
     
     return 0 if result['status'] == 'Success' else 1
 
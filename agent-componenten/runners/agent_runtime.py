@@ -0,0 +1,507 @@
+#!/usr/bin/env python3
+"""
+agent_runtime.py
+
+Gedeelde runtime voor gegenereerde agent runners.
+
+Een runner bevat alleen zijn AGENT_CONFIG (afgeleid van het build plan) en roept
+deze runtime aan. De runtime laadt prompt en charter, bouwt het LLM request op
+uit de input bestanden en roept een provider adapter aan:
+
+  - anthropic: Anthropic Messages API (vereist ANTHROPIC_API_KEY)
+  - stub:      deterministische lokale backend, zonder netwerk; geschikt om
+               doorvoer en latency offline te meten en te testen
+
+Provider keuze (hoogste prioriteit eerst): --provider, AGENT_LLM_PROVIDER,
+runtime.llmProvider uit het build plan. Model idem via --model / AGENT_LLM_MODEL;
+korte namen als 'claude-sonnet' worden vertaald naar een model ID van de API.
+Komt de provider alleen uit het build plan en is hij niet bruikbaar (bv. geen
+ANTHROPIC_API_KEY), dan valt de runtime terug op stub. Een expliciet gekozen
+provider die niet bruikbaar is, is een configuratiefout: de runner stopt met exit
+code EXIT_CONFIG_ERROR (78) en orchestrators proberen het niet opnieuw.
+
+Resultaten worden gecached op een sleutel van prompt, charter, input bestanden en
+provider, model en generatie instellingen zoals AGENT_LLM_MAX_TOKENS (ResultCache,
+LRU met maximale grootte). Locatie en grootte via AGENT_CACHE_DIR (default
+~/.cache/agent-capabilities/runs) en AGENT_CACHE_MAX_MB (default 256).
+Uitschakelen met --no-cache of AGENT_NO_CACHE=1.
+
+Met --result-file schrijft een runner zijn resultaat metadata (o.a. output
+regels, tekens en bytes) als JSON, zodat orchestrators het output bestand niet
+opnieuw hoeven te lezen.
+
+Versie: 1.0
+Datum: 18-10-2026
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+# Directories (relative to the workspace root) where prompts can live:
+# agent-capabilities itself, or a project workspace after fetch-agents
+PROMPT_DIRS = [Path("agent-componenten") / "prompts", Path(".github") / "prompts"]
+
+PROJECT_WORKSPACE_PLACEHOLDER = "<project-workspace>"
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "agent-capabilities" / "runs"
+DEFAULT_CACHE_MAX_MB = 256
+
+# Exit code of a runner for configuration errors (sysexits EX_CONFIG); not worth a retry
+EXIT_CONFIG_ERROR = 78
+
+
+class ConfigurationError(ValueError):
+    """Provider/model configuration that can never succeed (unknown provider, missing API key)."""
+
+
+def log(message: str, prefix: str = "INFO"):
+    """Log a message with prefix."""
+    colors = {
+        "INFO": "\033[96m",
+        "SUCCESS": "\033[92m",
+        "WARNING": "\033[93m",
+        "ERROR": "\033[91m"
+    }
+    reset = "\033[0m"
+    color = colors.get(prefix, "")
+    print(f"{color}[{prefix}] {message}{reset}", flush=True)
+
+
+class ProviderAdapter:
+    """Base class voor LLM provider adapters."""
+
+    name = None
+
+    def __init__(self, model: str):
+        """Initialize the adapter for a model."""
+        self.model = model
+
+    def complete(self, request: Dict) -> Dict:
+        """Voer een request uit; geeft {'text': ..., 'usage': {...}} terug."""
+        raise NotImplementedError("Subclasses moeten complete() implementeren")
+
+    def request_params(self) -> Dict:
+        """Generation settings that change the response (part of the result cache key)."""
+        return {}
+
+    def configuration_error(self) -> Optional[str]:
+        """Why this adapter cannot be used in the current environment; None when it can."""
+        return None
+
+
+class StubAdapter(ProviderAdapter):
+    """Deterministische lokale backend (geen netwerk, geen API key)."""
+
+    name = "stub"
+
+    def __init__(self, model: str):
+        """Initialize the stub; AGENT_STUB_LATENCY_MS simulates provider latency."""
+        super().__init__(model)
+        self.latency_seconds = float(os.environ.get("AGENT_STUB_LATENCY_MS", "0")) / 1000.0
+
+    def complete(self, request: Dict) -> Dict:
+        """Return a response that only depends on the request content."""
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+
+        request_hash = hashlib.sha256(
+            json.dumps(request, sort_keys=True, ensure_ascii=False).encode('utf-8')
+        ).hexdigest()
+        user_content = request["messages"][0]["content"]
+
+        lines = [
+            f"# {request['metadata']['agentName']} Output",
+            "",
+            f"**Agent**: {request['metadata']['agentId']}",
+            f"**Backend**: stub ({self.model})",
+            f"**Request**: {request_hash[:16]}",
+            "",
+            "## Input samenvatting",
+            ""
+        ]
+        for input_file in request["metadata"]["inputFiles"]:
+            lines.append(f"- {input_file['name']} ({input_file['bytes']} bytes)")
+        lines.extend([
+            "",
+            "## Output",
+            "",
+            "Deterministische stub output. Een echte provider genereert hier de",
+            "output op basis van prompt, charter en input.",
+            ""
+        ])
+
+        return {
+            "text": '\n'.join(lines),
+            "usage": {
+                "input_chars": len(request["system"]) + len(user_content),
+                "output_chars": sum(len(line) + 1 for line in lines)
+            }
+        }
+
+
+class AnthropicAdapter(ProviderAdapter):
+    """Adapter voor de Anthropic Messages API (alleen stdlib, geen SDK nodig)."""
+
+    name = "anthropic"
+    api_url = "https://api.anthropic.com/v1/messages"
+    api_version = "2023-06-01"
+    default_model = "claude-sonnet-4-5"
+    # Short names used in build plans -> model IDs accepted by the API
+    model_aliases = {
+        "claude-sonnet": "claude-sonnet-4-5",
+        "claude-opus": "claude-opus-4-1",
+        "claude-haiku": "claude-haiku-4-5",
+    }
+
+    def __init__(self, model: str):
+        """Initialize the adapter; the API key comes from ANTHROPIC_API_KEY."""
+        super().__init__(self.model_aliases.get(model, model or self.default_model))
+        self.api_key = os.environ.get("ANTHROPIC_API_KEY")
+        self.max_tokens = int(os.environ.get("AGENT_LLM_MAX_TOKENS", "4096"))
+        self.timeout = float(os.environ.get("AGENT_LLM_TIMEOUT", "300"))
+
+    def request_params(self) -> Dict:
+        """Generation settings sent with every request."""
+        return {"max_tokens": self.max_tokens}
+
+    def configuration_error(self) -> Optional[str]:
+        """The Messages API needs an API key."""
+        if not self.api_key:
+            return "ANTHROPIC_API_KEY is niet gezet. Zet de key of gebruik --provider stub voor offline runs."
+        return None
+
+    def complete(self, request: Dict) -> Dict:
+        """Call the Messages API and return the concatenated text blocks."""
+        problem = self.configuration_error()
+        if problem:
+            raise ConfigurationError(problem)
+
+        body = json.dumps({
+            "model": self.model,
+            **self.request_params(),
+            "system": request["system"],
+            "messages": request["messages"]
+        }).encode('utf-8')
+        http_request = urllib.request.Request(
+            self.api_url,
+            data=body,
+            headers={
+                "content-type": "application/json",
+                "x-api-key": self.api_key,
+                "anthropic-version": self.api_version
+            },
+            method="POST"
+        )
+
+        try:
+            with urllib.request.urlopen(http_request, timeout=self.timeout) as response:
+                payload = json.loads(response.read().decode('utf-8'))
+        except urllib.error.HTTPError as e:
+            detail = e.read().decode('utf-8', 'replace')
+            raise RuntimeError(f"Anthropic API fout {e.code}: {detail}") from e
+
+        text = ''.join(block.get("text", "") for block in payload.get("content", [])
+                       if block.get("type") == "text")
+        return {"text": text, "usage": payload.get("usage", {})}
+
+
+PROVIDER_ADAPTERS = {
+    'stub': StubAdapter,
+    'anthropic': AnthropicAdapter,
+}
+
+
+def get_adapter(provider: str, model: str) -> ProviderAdapter:
+    """Instantiate the adapter registered for a provider name."""
+    if provider not in PROVIDER_ADAPTERS:
+        available = ', '.join(sorted(PROVIDER_ADAPTERS))
+        raise ConfigurationError(f"Onbekende LLM provider '{provider}' (beschikbaar: {available})")
+    return PROVIDER_ADAPTERS[provider](model)
+
+
+def sha256_text(text: str) -> str:
+    """Return the SHA-256 hex digest of a string."""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class ResultCache:
+    """Content-addressed cache of provider responses with size-bounded LRU eviction."""
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_bytes: Optional[int] = None):
+        """Initialize the cache directory and its size limit."""
+        self.cache_dir = Path(cache_dir or os.environ.get("AGENT_CACHE_DIR") or DEFAULT_CACHE_DIR)
+        if max_bytes is None:
+            max_bytes = int(float(os.environ.get("AGENT_CACHE_MAX_MB", DEFAULT_CACHE_MAX_MB)) * 1024 * 1024)
+        self.max_bytes = max_bytes
+
+    def entry_path(self, key: str) -> Path:
+        """Path of the cache entry for a key."""
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return the cached response, marking it as recently used; None on a miss."""
+        path = self.entry_path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            os.utime(path)  # LRU: mtime = last use
+            return entry
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: str, entry: Dict):
+        """Store a response atomically and evict least recently used entries."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=str(self.cache_dir), suffix=".tmp")
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_name, self.entry_path(key))
+        self.evict()
+
+    def evict(self):
+        """Remove the least recently used entries until the cache fits in max_bytes."""
+        entries = []
+        total = 0
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue  # Removed concurrently
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+                total -= size
+            except OSError:
+                pass
+
+
+def add_runtime_arguments(parser: argparse.ArgumentParser):
+    """Add the runtime options shared by all runners."""
+    parser.add_argument('--provider', choices=sorted(PROVIDER_ADAPTERS),
+                        help='LLM provider (default: AGENT_LLM_PROVIDER of runtime.llmProvider uit build plan)')
+    parser.add_argument('--model',
+                        help='Model naam (default: AGENT_LLM_MODEL of runtime.model uit build plan)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Gebruik en vul de result cache niet')
+    parser.add_argument('--result-file',
+                        help='Schrijf de resultaat metadata (status, cache, output statistieken) als JSON')
+
+
+def process_usage() -> Dict:
+    """CPU time and peak RSS of the current process so far."""
+    usage = {"cpu_seconds": round(time.process_time(), 3)}
+    if resource:
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in kilobytes on Linux, in bytes on macOS
+        usage["peak_rss_kb"] = max_rss // 1024 if sys.platform == "darwin" else max_rss
+    return usage
+
+
+def write_result(result_file: str, result: Dict):
+    """Write a runner's result metadata, plus its process usage, atomically for orchestrators."""
+    result = {**result, **process_usage()}
+    result_path = Path(result_file)
+    result_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = result_path.with_name(result_path.name + ".tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(result, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, result_path)
+
+
+class AgentRuntime:
+    """Voert een agent uit: prompt + charter + input -> provider -> output bestand."""
+
+    def __init__(self, config: Dict, runner_path: Path, provider: Optional[str] = None,
+                 model: Optional[str] = None, use_cache: bool = True,
+                 cache: Optional[ResultCache] = None):
+        """Initialize the runtime for a runner's AGENT_CONFIG."""
+        self.config = config
+        self.runner_path = Path(runner_path).resolve()
+        # <workspace>/agent-componenten/runners/<runner>.py
+        self.workspace_root = self.runner_path.parents[2]
+        runtime = config.get("runtime", {})
+        self.provider = provider or os.environ.get("AGENT_LLM_PROVIDER") or runtime.get("llmProvider", "stub")
+        # Only a provider that merely comes from the build plan may fall back to stub
+        self.provider_from_plan = not (provider or os.environ.get("AGENT_LLM_PROVIDER"))
+        self.model = model or os.environ.get("AGENT_LLM_MODEL") or runtime.get("model", "")
+        self.use_cache = use_cache and os.environ.get("AGENT_NO_CACHE", "") not in ("1", "true")
+        self.cache = cache or ResultCache()
+
+    def resolve_prompt_path(self) -> Path:
+        """Find the prompt file in agent-componenten/prompts/ or .github/prompts/."""
+        prompt_name = self.config["prompt"]
+        for prompt_dir in PROMPT_DIRS:
+            candidate = self.workspace_root / prompt_dir / prompt_name
+            if candidate.exists():
+                return candidate
+        searched = ', '.join(str(d / prompt_name) for d in PROMPT_DIRS)
+        raise FileNotFoundError(f"Prompt niet gevonden (gezocht: {searched})")
+
+    def resolve_charter_path(self) -> Optional[Path]:
+        """Charter path relative to the workspace; None when it is not available locally."""
+        charter = self.config.get("charter")
+        if not charter:
+            return None
+        candidate = self.workspace_root / charter
+        return candidate if candidate.exists() else None
+
+    def resolve_output_file(self, output_file: Optional[str]) -> Path:
+        """Use the requested output file, or a timestamped file in outputRoot."""
+        if output_file:
+            return Path(output_file)
+        output_root = self.config.get("outputRoot", "artefacten")
+        if output_root.startswith(PROJECT_WORKSPACE_PLACEHOLDER):
+            output_root = str(Path.cwd()) + output_root[len(PROJECT_WORKSPACE_PLACEHOLDER):]
+        timestamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+        return Path(output_root) / f"{self.config['agentName']}-{timestamp}.md"
+
+    def read_inputs(self, input_files: List[str]) -> List[Dict]:
+        """Read the input files; missing files are skipped with a warning."""
+        inputs = []
+        for file_path in input_files:
+            path = Path(file_path)
+            if not path.exists():
+                log(f"Bestand niet gevonden: {file_path}", "WARNING")
+                continue
+            content = path.read_text(encoding='utf-8')
+            inputs.append({
+                "name": path.name,
+                "path": str(path.resolve()),
+                "bytes": len(content.encode('utf-8')),
+                "content": content
+            })
+            log(f"Input bestand toegevoegd: {file_path}")
+
+        if not inputs:
+            raise ValueError("Geen geldige input bestanden gevonden")
+        return inputs
+
+    def load_sources(self) -> Dict:
+        """Read prompt and charter text (charter is None when not available locally)."""
+        charter_path = self.resolve_charter_path()
+        if not charter_path:
+            log(f"Charter niet lokaal gevonden: {self.config.get('charter')}", "WARNING")
+        return {
+            "prompt": self.resolve_prompt_path().read_text(encoding='utf-8'),
+            "charter": charter_path.read_text(encoding='utf-8') if charter_path else None
+        }
+
+    def create_adapter(self) -> ProviderAdapter:
+        """Adapter for the configured provider; the plan's default provider falls back to stub."""
+        adapter = get_adapter(self.provider, self.model)
+        problem = adapter.configuration_error()
+        if problem is None:
+            self.model = adapter.model
+            return adapter
+        if not self.provider_from_plan:
+            raise ConfigurationError(problem)
+        log(f"{problem} Provider '{self.provider}' uit het build plan; terugval op stub.", "WARNING")
+        self.provider = "stub"
+        return get_adapter(self.provider, self.model)
+
+    def cache_key(self, sources: Dict, inputs: List[Dict], adapter: ProviderAdapter) -> str:
+        """Cache key from prompt, charter, input contents and runtime/model/generation settings."""
+        key_material = {
+            "prompt": sha256_text(sources["prompt"]),
+            "charter": sha256_text(sources["charter"]) if sources["charter"] is not None else None,
+            "inputs": [[item["name"], sha256_text(item["content"])] for item in inputs],
+            "runtime": {
+                "provider": self.provider,
+                "model": self.model,
+                "params": adapter.request_params(),
+                "qualityGates": self.config.get("qualityGates") or []
+            }
+        }
+        return sha256_text(json.dumps(key_material, sort_keys=True, ensure_ascii=False))
+
+    def build_request(self, inputs: List[Dict], sources: Optional[Dict] = None) -> Dict:
+        """Build the provider-independent LLM request."""
+        sources = sources or self.load_sources()
+
+        system_parts = [sources["prompt"].strip()]
+        if sources["charter"] is not None:
+            system_parts.append("# Charter\n\n" + sources["charter"].strip())
+        quality_gates = self.config.get("qualityGates") or []
+        if quality_gates:
+            system_parts.append("# Quality gates\n\n" + '\n'.join(f"- {gate}" for gate in quality_gates))
+
+        user_content = '\n\n'.join(
+            f"## Input: {item['name']}\n\n{item['content']}" for item in inputs
+        )
+
+        return {
+            "system": '\n\n'.join(system_parts),
+            "messages": [{"role": "user", "content": user_content}],
+            "metadata": {
+                "agentId": self.config["agentId"],
+                "agentName": self.config["agentName"],
+                "inputFiles": [{"name": item["name"], "bytes": item["bytes"]} for item in inputs]
+            }
+        }
+
+    def run(self, input_files: List[str], output_file: Optional[str] = None) -> Dict:
+        """Execute the agent and write its output; returns result metadata."""
+        adapter = self.create_adapter()
+        log(f"Starten {self.config['agentName']} agent (provider: {self.provider}, model: {self.model})...")
+
+        inputs = self.read_inputs(input_files)
+        sources = self.load_sources()
+
+        started = time.perf_counter()
+        response = None
+        cache_status = "disabled"
+        if self.use_cache:
+            key = self.cache_key(sources, inputs, adapter)
+            response = self.cache.get(key)
+            cache_status = "hit" if response is not None else "miss"
+            if response is not None:
+                log(f"Resultaat uit cache ({key[:12]})", "SUCCESS")
+
+        if response is None:
+            request = self.build_request(inputs, sources)
+            response = adapter.complete(request)
+            if self.use_cache:
+                self.cache.put(key, response)
+        latency = time.perf_counter() - started
+
+        output_path = self.resolve_output_file(output_file)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        text = response["text"]
+        output_path.write_text(text, encoding='utf-8')
+        log(f"Output geschreven naar: {output_path}", "SUCCESS")
+
+        return {
+            'status': 'Success',
+            'output_file': str(output_path),
+            'timestamp': datetime.now().isoformat(),
+            'provider': self.provider,
+            'model': self.model,
+            'cache': cache_status,
+            'latency_seconds': round(latency, 6),
+            'input_bytes': sum(item["bytes"] for item in inputs),
+            'output_bytes': len(text.encode('utf-8')),
+            'output_lines': len(text.split('\n')),
+            'output_chars': len(text),
+            'usage': response.get("usage", {})
+        }
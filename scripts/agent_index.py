@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+agent_index.py
+
+Persistente index van agents: agent naam -> fase, charter en componenten.
+
+De index staat in agent-componenten/index.json en wordt alleen opnieuw opgebouwd
+als de mtime van een van de bekeken directories is veranderd (bestand toegevoegd,
+verwijderd of hernoemd). Scripts lossen agent namen daarna op met een dict lookup
+in plaats van per agent te globben.
+
+GEBRUIK (als module):
+  from agent_index import AgentIndex
+
+  index = AgentIndex(repo_root)
+  entry = index.lookup("cdm-architect")
+  charter_path = index.resolve(entry["charter"])
+
+GEBRUIK (command line):
+  python scripts/agent_index.py            # Toon index (herbouwt indien nodig)
+  python scripts/agent_index.py --rebuild  # Forceer herbouwen
+
+Versie: 1.0
+Datum: 18-10-2026
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+INDEX_VERSION = 2
+INDEX_RELATIVE_PATH = Path("agent-componenten") / "index.json"
+
+CHARTERS_DIR = Path("governance") / "agent-charters"
+COMPONENTS_DIR = Path("agent-componenten")
+GENERATED_PIPELINES_DIR = COMPONENTS_DIR / "pipelines" / "generated"
+
+# Component kind -> (directory, filename suffix after "<phase>.<name>")
+COMPONENT_DIRS = {
+    "prompt": (COMPONENTS_DIR / "prompts", ".prompt.md"),
+    "agent": (COMPONENTS_DIR / "agents", ".agent.md"),
+    "runner": (COMPONENTS_DIR / "runners", ".py"),
+    "orchestration": (COMPONENTS_DIR / "orchestrations", ".orchestration.yaml"),
+    "buildplan": (COMPONENTS_DIR / "buildplans", ".json"),
+}
+
+# Platform -> filename suffix of generated pipelines
+PIPELINE_SUFFIXES = {
+    "github-actions": ".workflow.yml",
+    "gitlab-ci": ".gitlab-ci.yml",
+}
+
+
+def split_component_name(filename: str, suffix: str) -> Optional[tuple]:
+    """Split '<phase>.<name><suffix>' into (phase, name); None if it does not match."""
+    if not filename.endswith(suffix):
+        return None
+    stem = filename[:-len(suffix)].lstrip('.')
+    if '.' not in stem:
+        return None
+    phase, name = stem.split('.', 1)
+    if not phase or not name:
+        return None
+    return phase, name
+
+
+def select_component_phase(kinds: Dict[str, List[tuple]], charter_phase: Optional[str]) -> str:
+    """
+    Phase prefix whose components are selected for an agent.
+
+    The charter phase when components exist for it; otherwise (no charter, e.g. in a
+    sparse checkout, or only legacy components) the phase present for most component
+    kinds, ties broken on the phase name.
+    """
+    counts: Dict[str, int] = {}
+    for options in kinds.values():
+        for phase in {option_phase for option_phase, _ in options}:
+            counts[phase] = counts.get(phase, 0) + 1
+    if charter_phase in counts:
+        return charter_phase
+    return min(counts, key=lambda phase: (-counts[phase], phase))
+
+
+class AgentIndex:
+    """Agent name -> phase/charter/component lookup backed by agent-componenten/index.json."""
+
+    def __init__(self, repo_root: Path, persist: bool = True):
+        """Load the index, rebuilding it when a watched directory changed."""
+        self.repo_root = Path(repo_root)
+        self.index_path = self.repo_root / INDEX_RELATIVE_PATH
+        self.persist = persist
+        self.data = self._load_or_rebuild()
+
+    def watched_dirs(self) -> List[Path]:
+        """Directories whose mtime invalidates the index."""
+        dirs = [CHARTERS_DIR] + [directory for directory, _ in COMPONENT_DIRS.values()]
+        dirs.append(GENERATED_PIPELINES_DIR)
+        generated = self.repo_root / GENERATED_PIPELINES_DIR
+        if generated.is_dir():
+            dirs.extend(sorted(p.relative_to(self.repo_root) for p in generated.iterdir() if p.is_dir()))
+        return dirs
+
+    def directory_mtimes(self) -> Dict[str, Optional[int]]:
+        """Current mtimes (ns) of the watched directories; None for missing ones."""
+        mtimes = {}
+        for rel_dir in self.watched_dirs():
+            try:
+                mtimes[rel_dir.as_posix()] = os.stat(self.repo_root / rel_dir).st_mtime_ns
+            except OSError:
+                mtimes[rel_dir.as_posix()] = None
+        return mtimes
+
+    def _load_or_rebuild(self) -> Dict:
+        """Return the stored index if still valid, else rebuild (and persist) it."""
+        mtimes = self.directory_mtimes()
+        if self.index_path.exists():
+            try:
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get("version") == INDEX_VERSION and data.get("directoryMtimes") == mtimes:
+                    return data
+            except (OSError, ValueError):
+                pass  # Corrupt or unreadable index: rebuild
+        return self.rebuild(mtimes)
+
+    def rebuild(self, mtimes: Optional[Dict] = None) -> Dict:
+        """Scan every watched directory once and rebuild the index."""
+        mtimes = mtimes if mtimes is not None else self.directory_mtimes()
+        agents: Dict[str, Dict] = {}
+        candidates: Dict[str, Dict[str, List[tuple]]] = {}
+
+        def entry_for(name: str) -> Dict:
+            return agents.setdefault(name, {
+                "phase": None,
+                "charter": None,
+                "prompt": None,
+                "agent": None,
+                "runner": None,
+                "orchestration": None,
+                "buildplan": None,
+                "pipelines": {}
+            })
+
+        charters_dir = self.repo_root / CHARTERS_DIR
+        if charters_dir.is_dir():
+            for charter_file in sorted(charters_dir.iterdir()):
+                parsed = split_component_name(charter_file.name, ".agent.charter")
+                if parsed:
+                    phase, name = parsed
+                    entry = entry_for(name)
+                    if entry["charter"] is None:
+                        entry["phase"] = phase
+                        entry["charter"] = (CHARTERS_DIR / charter_file.name).as_posix()
+
+        for kind, (rel_dir, suffix) in COMPONENT_DIRS.items():
+            directory = self.repo_root / rel_dir
+            if not directory.is_dir():
+                continue
+            for component_file in sorted(directory.iterdir()):
+                parsed = split_component_name(component_file.name, suffix)
+                if parsed:
+                    phase, name = parsed
+                    candidates.setdefault(name, {}).setdefault(kind, []).append(
+                        (phase, (rel_dir / component_file.name).as_posix())
+                    )
+
+        for platform, suffix in PIPELINE_SUFFIXES.items():
+            directory = self.repo_root / GENERATED_PIPELINES_DIR / platform
+            if not directory.is_dir():
+                continue
+            for pipeline_file in sorted(directory.iterdir()):
+                parsed = split_component_name(pipeline_file.name, suffix)
+                # Multi-agent workflow pipelines (workflow.*) are not tied to one agent
+                if parsed and parsed[0] != "workflow":
+                    phase, name = parsed
+                    candidates.setdefault(name, {}).setdefault(platform, []).append(
+                        (phase, (GENERATED_PIPELINES_DIR / platform / pipeline_file.name).as_posix())
+                    )
+
+        for name, kinds in candidates.items():
+            entry = entry_for(name)
+            # All components of an agent come from one phase: never mix e.g. u.* and u03.*
+            phase = select_component_phase(kinds, entry["phase"])
+            for kind, options in kinds.items():
+                chosen = next((path for option_phase, path in options if option_phase == phase), None)
+                if chosen is None:
+                    continue
+                if kind in PIPELINE_SUFFIXES:
+                    entry["pipelines"][kind] = chosen
+                else:
+                    entry[kind] = chosen
+            if entry["phase"] is None:
+                entry["phase"] = phase
+
+        data = {
+            "version": INDEX_VERSION,
+            "directoryMtimes": mtimes,
+            "agents": dict(sorted(agents.items()))
+        }
+        if self.persist:
+            self._write(data)
+        return data
+
+    def _write(self, data: Dict):
+        """Atomically write the index; a read-only workspace is not an error."""
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=str(self.index_path.parent), suffix=".tmp")
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_name, self.index_path)
+        except OSError:
+            pass
+
+    def names(self, with_charter: bool = False, with_component: Optional[str] = None) -> List[str]:
+        """Agent names in the index, optionally filtered on having a charter or component."""
+        result = []
+        for name, entry in self.data["agents"].items():
+            if with_charter and not entry["charter"]:
+                continue
+            if with_component and not entry.get(with_component):
+                continue
+            result.append(name)
+        return result
+
+    def lookup(self, agent_name: str) -> Optional[Dict]:
+        """Return the index entry for an agent name, or None."""
+        return self.data["agents"].get(agent_name)
+
+    def resolve(self, relative_path: Optional[str]) -> Optional[Path]:
+        """Turn a repo-relative index path into an absolute Path."""
+        if not relative_path:
+            return None
+        return self.repo_root / relative_path
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description='Toon of herbouw de agent index (agent-componenten/index.json)')
+    parser.add_argument('--repo-root', type=Path, default=None,
+                        help='Root directory van de repository (default: current directory)')
+    parser.add_argument('--rebuild', action='store_true', help='Forceer herbouwen van de index')
+
+    args = parser.parse_args()
+
+    index = AgentIndex(args.repo_root or Path.cwd())
+    if args.rebuild:
+        index.data = index.rebuild()
+
+    for name, entry in index.data["agents"].items():
+        print(f"{entry['phase'] or '?':>5}  {name:<32} charter={'ja' if entry['charter'] else 'nee'}")
+    print(f"\n{len(index.data['agents'])} agent(s) in {index.index_path}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
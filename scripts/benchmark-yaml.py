@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+benchmark-yaml.py
+
+Micro-benchmark van de YAML laag: pure-Python PyYAML tegenover libyaml (C), op de
+orchestration en pipeline bestanden van deze repository.
+
+Per pad worden alle bestanden --iterations keer geladen en weer gedumpt. Daarnaast
+wordt de gememoiseerde loader (yaml_utils.load_file) gemeten en gecontroleerd of
+beide dumpers dezelfde bytes opleveren (voorwaarde voor stabiele gegenereerde output).
+
+GEBRUIK:
+  python scripts/benchmark-yaml.py
+  python scripts/benchmark-yaml.py --iterations 200
+
+Versie: 1.0
+Datum: 18-10-2026
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+import yaml
+
+import yaml_utils
+
+
+BENCHMARK_GLOBS = [
+    "agent-componenten/orchestrations/*.orchestration.yaml",
+    "agent-componenten/pipelines/definitions/*.pipeline.yml",
+    "agent-componenten/pipelines/generated/*/*.yml",
+    "agent-componenten/workflows/*.workflow.yaml",
+]
+
+
+class YamlBenchmark:
+    """Compares the pure-Python and libyaml paths on a set of YAML files."""
+    
+    def __init__(self, repo_root: Path, iterations: int):
+        """Initialize the benchmark."""
+        self.repo_root = repo_root
+        self.iterations = iterations
+    
+    def log(self, message: str, prefix: str = "INFO"):
+        """Log a message with prefix."""
+        colors = {
+            "INFO": "\033[96m",
+            "SUCCESS": "\033[92m",
+            "WARNING": "\033[93m",
+            "ERROR": "\033[91m"
+        }
+        reset = "\033[0m"
+        color = colors.get(prefix, "")
+        print(f"{color}[{prefix}] {message}{reset}")
+    
+    def find_files(self) -> List[Path]:
+        """YAML files of the repository that are part of the benchmark."""
+        files = []
+        for pattern in BENCHMARK_GLOBS:
+            files.extend(sorted(self.repo_root.glob(pattern)))
+        return files
+    
+    def measure(self, action: Callable[[], None]) -> float:
+        """Milliseconds per iteration of action (best of three rounds)."""
+        best = float("inf")
+        for _ in range(3):
+            started = time.perf_counter()
+            for _ in range(self.iterations):
+                action()
+            best = min(best, time.perf_counter() - started)
+        return best * 1000 / self.iterations
+    
+    def run(self) -> int:
+        """Run the benchmark and print a comparison."""
+        files = self.find_files()
+        if not files:
+            self.log(f"Geen YAML bestanden gevonden in {self.repo_root}", "ERROR")
+            return 1
+        
+        texts = [path.read_text(encoding='utf-8') for path in files]
+        documents = [yaml.load(text, Loader=yaml.SafeLoader) for text in texts]
+        total_kb = sum(len(text.encode('utf-8')) for text in texts) / 1024
+        self.log(f"{len(files)} bestanden ({total_kb:.1f} KB), {self.iterations} iteraties")
+        
+        def load_all(loader):
+            return lambda: [yaml.load(text, Loader=loader) for text in texts]
+        
+        def dump_all(dumper):
+            return lambda: [yaml_utils.dump(document, Dumper=dumper) for document in documents]
+        
+        def load_files():
+            return [yaml_utils.load_file(path) for path in files]
+        
+        # (label, ms, ms of the pure-Python path of the same operation)
+        python_load = self.measure(load_all(yaml.SafeLoader))
+        python_dump = self.measure(dump_all(yaml.SafeDumper))
+        results = [
+            ("load  (Python SafeLoader)", python_load, python_load),
+            ("dump  (Python SafeDumper)", python_dump, python_dump),
+        ]
+        if yaml_utils.LIBYAML:
+            results += [
+                ("load  (libyaml CSafeLoader)", self.measure(load_all(yaml.CSafeLoader)), python_load),
+                ("dump  (libyaml CSafeDumper)", self.measure(dump_all(yaml.CSafeDumper)), python_dump),
+            ]
+        else:
+            self.log("PyYAML is zonder libyaml geïnstalleerd; alleen het Python pad gemeten", "WARNING")
+        
+        yaml_utils.clear_cache()
+        load_files()  # Warm the memoized loader
+        results.append(("load_file (gememoiseerd)", self.measure(load_files), python_load))
+        
+        self.log("Resultaat (ms per iteratie over alle bestanden, versnelling t.o.v. het Python pad):", "SUCCESS")
+        for label, ms, baseline in results:
+            print(f"  {label:<30} {ms:9.3f} ms   {baseline / ms:6.1f}x")
+        
+        if yaml_utils.LIBYAML:
+            different = [
+                path.relative_to(self.repo_root).as_posix()
+                for path, document in zip(files, documents)
+                if yaml_utils.dump(document, Dumper=yaml.SafeDumper) != yaml_utils.dump(document, Dumper=yaml.CSafeDumper)
+            ]
+            if different:
+                self.log(f"Dump output verschilt tussen Python en libyaml: {', '.join(different)}", "WARNING")
+            else:
+                self.log("Dump output van Python en libyaml is byte-identiek", "SUCCESS")
+        return 0
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Vergelijk pure-Python en libyaml YAML laden/dumpen op de bestanden van de repository'
+    )
+    
+    parser.add_argument('--repo-root', type=Path, default=None,
+                        help='Root directory van de repository (default: parent van scripts/)')
+    
+    parser.add_argument('--iterations', type=int, default=50,
+                        help='Aantal iteraties per meting (default: 50)')
+    
+    args = parser.parse_args()
+    
+    repo_root = (args.repo_root or Path(__file__).resolve().parent.parent).resolve()
+    return YamlBenchmark(repo_root, max(1, args.iterations)).run()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
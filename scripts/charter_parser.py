@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+charter_parser.py
+
+Gedeelde parser voor agent charters (*.agent.charter).
+
+Een charter wordt in één pass over de regels opgedeeld in secties (## koppen, met
+### subsecties). Daarna zijn de vaste onderdelen direct beschikbaar: genummerde
+secties, de SAFe Phase Alignment tabel, kwaliteitscommitments, metrics en de
+wijzigingshistorie. Resultaten worden per proces gecached op SHA-256 van de
+bestandsinhoud, zodat make-agent en alle builders hetzelfde object hergebruiken.
+
+GEBRUIK (als module):
+  from charter_parser import parse_charter
+
+  charter = parse_charter(Path("governance/agent-charters/b1.cdm-architect.agent.charter"))
+  charter.section("4").title            # 'SAFe Phase Alignment'
+  charter.supports_phase("B. Architectuur")
+
+Versie: 1.0
+Datum: 18-10-2026
+"""
+
+import hashlib
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+SECTION_NUMBER_PATTERN = re.compile(r'^(\d+(?:\.\d+)*)\.?\s+(.*)$')
+BOLD_FIELD_PATTERN = re.compile(r'^\*\*([^*]+)\*\*:?\s*(.*?)\s*$')
+
+# Lower-cased title fragments that identify the well-known sections
+PHASE_ALIGNMENT_TITLES = ("safe phase alignment", "safe fase-afstemming")
+QUALITY_TITLES = ("quality commitments", "kwaliteitscommitments", "kwaliteit")
+METRICS_TITLES = ("metrics",)
+CHANGE_HISTORY_TITLES = ("change log", "wijzigingslog", "wijzigingshistorie")
+
+# Parsed charters keyed on SHA-256 of the file content
+_charter_cache: Dict[str, "Charter"] = {}
+
+
+@dataclass
+class CharterSection:
+    """A '## ' section (or '### ' subsection) of a charter."""
+    title: str
+    level: int
+    number: Optional[str] = None
+    lines: List[str] = field(default_factory=list)
+    subsections: List["CharterSection"] = field(default_factory=list)
+
+    @property
+    def content(self) -> str:
+        """Section body including subsections, without its own header."""
+        parts = ['\n'.join(self.lines)]
+        for sub in self.subsections:
+            parts.append('#' * sub.level + ' ' + sub.title)
+            parts.append(sub.content)
+        return '\n'.join(parts).strip()
+
+    def all_lines(self) -> List[str]:
+        """Body lines of this section and its subsections, in document order."""
+        lines = list(self.lines)
+        for sub in self.subsections:
+            lines.extend(sub.all_lines())
+        return lines
+
+    def bullets(self) -> List[str]:
+        """List items ('- ' / '* ') in this section and its subsections."""
+        items = []
+        for line in self.all_lines():
+            stripped = line.strip()
+            if stripped.startswith(('- ', '* ')):
+                items.append(stripped[2:].strip())
+        return items
+
+    def tables(self) -> List[List[Dict[str, str]]]:
+        """Markdown tables in this section as lists of header->cell rows."""
+        tables = []
+        header = None
+        rows: List[Dict[str, str]] = []
+        for line in self.all_lines() + ['']:
+            stripped = line.strip()
+            if stripped.startswith('|'):
+                cells = [cell.strip() for cell in stripped.strip('|').split('|')]
+                if header is None:
+                    header = cells
+                elif all(set(cell) <= set('-: ') for cell in cells):
+                    continue  # Separator row
+                else:
+                    rows.append(dict(zip(header, cells)))
+            elif header is not None:
+                tables.append(rows)
+                header, rows = None, []
+        return tables
+
+
+@dataclass
+class Charter:
+    """Structured, parsed charter."""
+    text: str
+    sha256: str
+    title: Optional[str] = None
+    metadata: Dict[str, str] = field(default_factory=dict)
+    sections: List[CharterSection] = field(default_factory=list)
+    path: Optional[Path] = None
+
+    @property
+    def numbered_sections(self) -> Dict[str, CharterSection]:
+        """Top-level sections keyed on their number ('1', '2', ...)."""
+        return {s.number: s for s in self.sections if s.number}
+
+    def section(self, number: str) -> Optional[CharterSection]:
+        """Return a numbered top-level section."""
+        return self.numbered_sections.get(number)
+
+    def find_section(self, *title_fragments: str) -> Optional[CharterSection]:
+        """First top-level section whose lower-cased title contains one of the fragments."""
+        for s in self.sections:
+            title = s.title.lower()
+            if any(fragment in title for fragment in title_fragments):
+                return s
+        return None
+
+    @property
+    def phase_alignment(self) -> List[Dict[str, str]]:
+        """Rows of the SAFe Phase Alignment table."""
+        s = self.find_section(*PHASE_ALIGNMENT_TITLES)
+        if not s:
+            return []
+        tables = s.tables()
+        return tables[0] if tables else []
+
+    @property
+    def quality_commitments(self) -> List[str]:
+        """Quality principles and gates as listed in the quality commitments section."""
+        s = self.find_section(*QUALITY_TITLES)
+        return s.bullets() if s else []
+
+    @property
+    def metrics(self) -> List[str]:
+        """Items of the metrics section, if the charter has one."""
+        s = self.find_section(*METRICS_TITLES)
+        return s.bullets() if s else []
+
+    @property
+    def change_history(self) -> List[Dict[str, str]]:
+        """Rows of the change log table."""
+        s = self.find_section(*CHANGE_HISTORY_TITLES)
+        if not s:
+            return []
+        tables = s.tables()
+        return tables[0] if tables else []
+
+    def supports_phase(self, safe_phase: str) -> bool:
+        """True when the phase alignment table marks the phase with '✅ Ja'."""
+        for row in self.phase_alignment:
+            cells = list(row.values())
+            if cells and cells[0] == safe_phase and re.search(r'✅\s*Ja', ' '.join(cells[1:2])):
+                return True
+        return False
+
+    @property
+    def is_utility(self) -> bool:
+        """True when the charter declares itself a utility agent."""
+        return 'Utility (U) agent' in self.text or 'utility-agent' in self.text
+
+
+def parse_charter_text(text: str, path: Optional[Path] = None) -> Charter:
+    """Parse charter markdown in a single pass over its lines."""
+    charter = Charter(text=text, sha256=hashlib.sha256(text.encode('utf-8')).hexdigest(), path=path)
+    current: Optional[CharterSection] = None
+    target: Optional[CharterSection] = None
+    in_code_block = False
+
+    for line in text.split('\n'):
+        if line.lstrip().startswith('```'):
+            in_code_block = not in_code_block
+        elif not in_code_block and line.startswith('## '):
+            title = line[3:].strip()
+            match = SECTION_NUMBER_PATTERN.match(title)
+            number, title = (match.group(1), match.group(2).strip()) if match else (None, title)
+            current = CharterSection(title=title, level=2, number=number)
+            charter.sections.append(current)
+            target = current
+            continue
+        elif not in_code_block and line.startswith('### ') and current is not None:
+            target = CharterSection(title=line[4:].strip(), level=3)
+            current.subsections.append(target)
+            continue
+        elif not in_code_block and line.startswith('# ') and charter.title is None:
+            charter.title = line[2:].strip()
+            continue
+
+        if target is not None:
+            target.lines.append(line)
+        elif not in_code_block:
+            # Preamble: '**Key**: value' metadata lines
+            match = BOLD_FIELD_PATTERN.match(line.strip())
+            if match and match.group(2):
+                charter.metadata[match.group(1).strip().rstrip(':')] = match.group(2)
+
+    return charter
+
+
+def parse_charter(charter_path: Path) -> Charter:
+    """Parse a charter file, reusing an earlier result for identical content."""
+    charter_path = Path(charter_path)
+    if not charter_path.exists():
+        raise FileNotFoundError(f"Charter niet gevonden: {charter_path}")
+
+    data = charter_path.read_bytes()
+    digest = hashlib.sha256(data).hexdigest()
+    charter = _charter_cache.get(digest)
+    if charter is None:
+        charter = parse_charter_text(data.decode('utf-8'), path=charter_path)
+        _charter_cache[digest] = charter
+    return charter
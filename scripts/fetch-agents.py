@@ -19,8 +19,39 @@ GEBRUIK:
   # Haal specifieke agents op
   python fetch-agents.py --agents cdm-architect logisch-data-modelleur
   
-  # Gebruik een andere bron repository
+  # Gebruik een andere bron repository (of een lokale (bare) repository)
   python fetch-agents.py --source https://github.com/hans-blok/agent-capabilities.git
+  python fetch-agents.py --source /srv/git/agent-capabilities.git
+
+BRON MIRROR:
+  De bron wordt niet per run volledig gekloond. Per bron URL staat een lokale mirror
+  in ~/.cache/agent-capabilities/mirrors (of --mirror-dir / AGENT_MIRROR_DIR): een
+  shallow (--depth 1), blobless (--filter=blob:none) en sparse checkout van alleen
+  agent-componenten/, scripts/ en .github/copilot/. Volgende runs doen alleen een
+  git fetch van de laatste commit. Zonder netwerk wordt de bestaande mirror gebruikt.
+  --no-mirror kloont eenmalig naar een temp directory.
+
+RELEASE BUNDLE:
+  --bundle <pad of URL> haalt op uit een bundle van scripts/publish-bundle.py in
+  plaats van git. Een tar.gz bundle wordt als stream gelezen; alleen de gevraagde
+  agents en de gedeelde bestanden worden uitgepakt. Elk bestand wordt tegen de
+  SHA-256 in het manifest gecontroleerd en het archief tegen <bundle>.sha256.
+
+INCREMENTEEL:
+  .agent-capabilities.lock in de target workspace legt de bron commit en per
+  bestand de SHA-256 vast. Alleen gewijzigde bestanden worden gekopieerd.
+  Bestanden waarvan de bron verdwenen is (verwijderde agents) worden gemeld;
+  --prune verwijdert ze, tenzij ze lokaal gewijzigd zijn.
+  Componenten worden met een ingebouwde index (InlineAgentIndex) in één scan
+  gevonden, altijd uit één fase; code uit de bron wordt nooit uitgevoerd;
+  het kopiëren gebeurt parallel op een begrensde thread pool (--copy-workers).
+
+MEERDERE TARGETS:
+  Met meerdere --target opties of --targets-file (één pad per regel) wordt de bron
+  één keer opgehaald en het kopieerplan (inclusief SHA-256 per bronbestand) één keer
+  gemaakt. Dat plan wordt daarna parallel (--jobs) op alle targets toegepast, elk
+  met een eigen lock bestand en log. Per target volgt een samenvatting; de exit code
+  is 1 als één of meer targets niet volledig bijgewerkt zijn.
 
 Agent: u95.python-script-schrijver
 Versie: 2.0
@@ -28,38 +59,213 @@ Datum: 09-01-2026
 """
 
 import argparse
+import hashlib
+import json
 import logging
+import os
+import re
 import shutil
 import subprocess
 import sys
+import tarfile
 import tempfile
+import threading
+import urllib.error
+import urllib.request
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from pathlib import Path
-from typing import List, Optional
+from pathlib import Path, PurePosixPath
+from typing import Dict, List, Optional, Tuple
 
 
-class AgentFetcher:
-    """Fetches agent artifacts from a source repository."""
+# Paths of the source repository that fetch-agents uses; the mirror checks out only these.
+# Charters are not fetched, but their phase prefix decides which components belong to an agent.
+SPARSE_PATHS = ["agent-componenten", "scripts", ".github/copilot", "governance/agent-charters"]
+
+DEFAULT_MIRROR_DIR = Path.home() / ".cache" / "agent-capabilities" / "mirrors"
+
+# Sync manifest in the target workspace: source commit and hash per fetched file
+LOCK_FILE = ".agent-capabilities.lock"
+LOCK_VERSION = 1
+
+# Integrity manifest inside release bundles (see publish-bundle.py)
+BUNDLE_MANIFEST_NAME = "bundle-manifest.json"
+BUNDLE_MANIFEST_VERSION = 1
+
+# Threads for file copies, shared by all targets (same default as ThreadPoolExecutor)
+DEFAULT_COPY_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+
+def file_sha256(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file (copy of hash_utils.file_sha256; this script is standalone)."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def component_phase(path: Path) -> str:
+    """Phase prefix of a component file name ('u03.c4-modelleur.py' -> 'u03')."""
+    return path.name.lstrip('.').split('.', 1)[0]
+
+
+class InlineAgentIndex:
+    """
+    Single-scan agent lookup in a fetched source tree.
     
-    def __init__(
-        self, 
-        target_root: Path, 
-        source_url: str = "https://github.com/hans-blok/agent-capabilities.git",
-        dry_run: bool = False,
-        update_scripts: bool = False,
-        platform: str = 'github-actions'
-    ):
-        """Initialize the fetcher."""
+    Same interface and component selection as agent_index.AgentIndex (names, lookup,
+    resolve), without the persisted index file. Built in rather than imported from
+    the source: code from a fetched repository or bundle is never executed, and
+    fetch-agents.py stays standalone.
+    """
+    
+    COMPONENT_DIRS = {
+        "prompt": ("agent-componenten/prompts", ".prompt.md"),
+        "agent": ("agent-componenten/agents", ".agent.md"),
+        "runner": ("agent-componenten/runners", ".py"),
+        "orchestration": ("agent-componenten/orchestrations", ".orchestration.yaml"),
+        "buildplan": ("agent-componenten/buildplans", ".json"),
+    }
+    PIPELINE_SUFFIXES = {
+        "github-actions": ".workflow.yml",
+        "gitlab-ci": ".gitlab-ci.yml",
+    }
+    
+    def __init__(self, repo_root: Path):
+        """Scan the charter and component directories once."""
+        self.repo_root = Path(repo_root)
+        charter_phases = {}
+        for phase, name, _ in self.scan("governance/agent-charters", ".agent.charter"):
+            charter_phases.setdefault(name, phase)
+        
+        candidates: Dict[str, Dict[str, List[tuple]]] = {}
+        sources = list(self.COMPONENT_DIRS.items())
+        sources += [(platform, (f"agent-componenten/pipelines/generated/{platform}", suffix))
+                    for platform, suffix in self.PIPELINE_SUFFIXES.items()]
+        for kind, (rel_dir, suffix) in sources:
+            for phase, name, rel_path in self.scan(rel_dir, suffix):
+                if kind in self.PIPELINE_SUFFIXES and phase == "workflow":
+                    continue  # Multi-agent workflow pipelines
+                candidates.setdefault(name, {}).setdefault(kind, []).append((phase, rel_path))
+        
+        self.agents = {}
+        for name, kinds in sorted(candidates.items()):
+            phase = self.select_phase(kinds, charter_phases.get(name))
+            entry = {kind: None for kind in self.COMPONENT_DIRS}
+            entry["phase"] = phase
+            entry["pipelines"] = {}
+            for kind, options in kinds.items():
+                chosen = next((path for option_phase, path in options if option_phase == phase), None)
+                if chosen and kind in self.PIPELINE_SUFFIXES:
+                    entry["pipelines"][kind] = chosen
+                elif chosen:
+                    entry[kind] = chosen
+            self.agents[name] = entry
+    
+    def scan(self, rel_dir: str, suffix: str) -> List[tuple]:
+        """(phase, name, relative path) for every '<phase>.<name><suffix>' file in a directory."""
+        directory = self.repo_root / rel_dir
+        if not directory.is_dir():
+            return []
+        result = []
+        for path in sorted(directory.iterdir()):
+            stem = path.name[:-len(suffix)].lstrip('.') if path.name.endswith(suffix) else ""
+            phase, _, name = stem.partition('.')
+            if phase and name:
+                result.append((phase, name, f"{rel_dir}/{path.name}"))
+        return result
+    
+    @staticmethod
+    def select_phase(kinds: Dict[str, List[tuple]], charter_phase: Optional[str]) -> str:
+        """The charter phase if it has components, else the phase present for most kinds."""
+        counts: Dict[str, int] = {}
+        for options in kinds.values():
+            for phase in {option_phase for option_phase, _ in options}:
+                counts[phase] = counts.get(phase, 0) + 1
+        if charter_phase in counts:
+            return charter_phase
+        return min(counts, key=lambda phase: (-counts[phase], phase))
+    
+    def names(self, with_component: Optional[str] = None) -> List[str]:
+        """Agent names, optionally only those with a given component."""
+        return [name for name, entry in self.agents.items() if not with_component or entry.get(with_component)]
+    
+    def lookup(self, agent_name: str) -> Optional[Dict]:
+        """Entry for an agent name, or None."""
+        return self.agents.get(agent_name)
+    
+    def resolve(self, relative_path: Optional[str]) -> Optional[Path]:
+        """Turn a repo-relative path into an absolute Path."""
+        return self.repo_root / relative_path if relative_path else None
+
+
+def is_url(source: str) -> bool:
+    """True for http(s):// and file:// sources."""
+    return source.startswith(("http://", "https://", "file://"))
+
+
+def bundle_path_is_safe(name: str) -> bool:
+    """Archive member names must stay inside the extraction directory."""
+    path = PurePosixPath(name)
+    return bool(name) and not path.is_absolute() and ".." not in path.parts
+
+
+class HashingReader:
+    """Read-only stream wrapper that computes the SHA-256 of everything read through it."""
+    
+    def __init__(self, stream):
+        """Wrap a binary stream."""
+        self.stream = stream
+        self.digest = hashlib.sha256()
+    
+    def read(self, size: int = -1) -> bytes:
+        """Read from the wrapped stream and hash the data."""
+        data = self.stream.read(size)
+        self.digest.update(data)
+        return data
+    
+    def drain(self) -> str:
+        """Read the rest of the stream (e.g. tar padding) and return the digest."""
+        while self.read(65536):
+            pass
+        return self.digest.hexdigest()
+
+
+def source_to_git_url(source: str) -> str:
+    """Local paths become file:// URLs, so shallow and partial clone also apply to them."""
+    if "://" not in source and not re.match(r'^[\w.-]+@[\w.-]+:', source) and Path(source).exists():
+        return Path(source).resolve().as_uri()
+    return source
+
+
+class TargetSync:
+    """Applies the planned copy set to one target workspace, tracked by its sync manifest."""
+    
+    def __init__(self, fetcher: "AgentFetcher", target_root: Path):
+        """Initialize the sync state for one target."""
+        self.fetcher = fetcher
         self.target_root = target_root
-        self.source_url = source_url
-        self.dry_run = dry_run
-        self.update_scripts = update_scripts
-        self.platform = platform
+        self.lock = {}
+        self.lock_files = {}
         self.copied_files = []
-        self.temp_dir = None
-        self.source_root = None
+        self.unchanged_files = []
+        self.stale_files = []
+        self.failed_files = []
+        self.error = None
         self.logger = None
     
+    @property
+    def label(self) -> str:
+        """Short name of the target, used as log prefix when fetching to several targets."""
+        return self.target_root.name or str(self.target_root)
+    
+    @property
+    def ok(self) -> bool:
+        """True when the target was brought up to date without errors."""
+        return self.error is None and not self.failed_files
+    
     def setup_logging(self):
         """Setup file-based logging in target/logs directory."""
         log_dir = self.target_root / "logs"
@@ -68,9 +274,10 @@ class AgentFetcher:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         log_file = log_dir / f"fetch-agents_{timestamp}.log"
         
-        # Configure logging
-        self.logger = logging.getLogger('fetch-agents')
+        # Configure logging: one logger per target, so parallel targets keep separate log files
+        self.logger = logging.getLogger(f"fetch-agents[{self.target_root}]")
         self.logger.setLevel(logging.DEBUG)
+        self.logger.propagate = False
         
         # File handler
         file_handler = logging.FileHandler(log_file, encoding='utf-8')
@@ -82,7 +289,183 @@ class AgentFetcher:
         self.log(f"Logging naar: {log_file}", "INFO")
     
     def log(self, message: str, prefix: str = "INFO"):
-        """Log a message with prefix."""
+        """Log a message for this target."""
+        self.fetcher.log(message, prefix, sync=self)
+    
+    def load_lock(self) -> Dict:
+        """Load the sync manifest of the target workspace; empty when absent or unreadable."""
+        lock_path = self.target_root / LOCK_FILE
+        if lock_path.exists():
+            try:
+                with open(lock_path, 'r', encoding='utf-8') as f:
+                    lock = json.load(f)
+                if lock.get("version") == LOCK_VERSION:
+                    return lock
+            except (OSError, ValueError):
+                pass
+            self.log(f"{LOCK_FILE} onleesbaar of verouderd; alle bestanden worden vergeleken", "WARNING")
+        return {}
+    
+    def write_lock(self):
+        """Atomically write the sync manifest with the files fetched so far."""
+        lock = {
+            "version": LOCK_VERSION,
+            "source": self.fetcher.source_url,
+            "commit": self.fetcher.source_commit,
+            "platform": self.fetcher.platform,
+            "fetched": datetime.now().isoformat(),
+            "files": dict(sorted(self.lock_files.items()))
+        }
+        lock_path = self.target_root / LOCK_FILE
+        tmp_path = lock_path.with_name(lock_path.name + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(lock, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, lock_path)
+    
+    def target_is_current(self, target: Path, entry: Optional[Dict], source_hash: str) -> bool:
+        """True when the target already has the source content; trusts the lock if size and mtime match."""
+        if not target.exists():
+            return False
+        if entry and entry.get("sha256") == source_hash:
+            stat = target.stat()
+            if stat.st_size == entry.get("size") and stat.st_mtime_ns == entry.get("mtime_ns"):
+                return True
+        return file_sha256(target) == source_hash
+    
+    def copy_file(self, source: Path, target_rel: str, source_hash: str) -> Tuple[bool, Optional[Dict]]:
+        """
+        Copy a planned file to this target, unless the target already has the same content.
+        
+        Runs on the copy pool, so it only returns its outcome: (copied, lock entry).
+        """
+        target = self.target_root / target_rel
+        entry = self.lock.get("files", {}).get(target_rel)
+        
+        if self.target_is_current(target, entry, source_hash):
+            copied = False
+        elif self.fetcher.dry_run:
+            self.log(f"Would copy: {source.name} -> {target_rel}", "DRY-RUN")
+            copied = True
+        else:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(source, target)
+            self.log(f"Copied: {source.name} -> {target_rel}")
+            copied = True
+        
+        if self.fetcher.dry_run:
+            return copied, None
+        stat = target.stat()
+        return copied, {
+            "source": source.relative_to(self.fetcher.source_root).as_posix(),
+            "sha256": source_hash,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns
+        }
+    
+    def handle_stale_files(self):
+        """Report (or with --prune remove) fetched files whose source no longer exists."""
+        for target_rel, entry in self.lock.get("files", {}).items():
+            if target_rel in self.lock_files:
+                continue
+            if self.fetcher.source_exists(entry.get("source", "")):
+                # Not part of this run (e.g. --agents or a failed copy), but still present in the source
+                self.lock_files[target_rel] = entry
+                continue
+            
+            target = self.target_root / target_rel
+            if not target.exists():
+                continue
+            self.stale_files.append(target_rel)
+            if not self.fetcher.prune or self.fetcher.dry_run:
+                self.log(f"Verouderd (bron verwijderd): {target_rel}", "WARNING" if not self.fetcher.dry_run else "DRY-RUN")
+                # Keep tracking it, so a later --prune can still remove it
+                self.lock_files[target_rel] = entry
+            elif file_sha256(target) != entry.get("sha256"):
+                # Locally modified: never delete someone's changes
+                self.log(f"Verouderd maar lokaal gewijzigd, niet verwijderd: {target_rel}", "WARNING")
+                self.lock_files[target_rel] = entry
+            else:
+                target.unlink()
+                self.log(f"Verwijderd (bron verwijderd): {target_rel}")
+    
+    def apply(self, plan: List[Tuple[Path, str, str]]) -> bool:
+        """Apply the copy plan to this target; failures are recorded, not raised."""
+        if self.error:
+            return False
+        try:
+            self.lock = self.load_lock()
+            # Copies run on the shared, bounded copy pool; results are collected here
+            futures = {
+                self.fetcher.copy_pool.submit(self.copy_file, source, target_rel, source_hash): target_rel
+                for source, target_rel, source_hash in plan
+            }
+            for future in as_completed(futures):
+                target_rel = futures[future]
+                try:
+                    copied, entry = future.result()
+                except OSError as e:
+                    self.failed_files.append(target_rel)
+                    self.log(f"Kopiëren mislukt: {target_rel}: {e}", "ERROR")
+                    continue
+                (self.copied_files if copied else self.unchanged_files).append(target_rel)
+                if entry:
+                    self.lock_files[target_rel] = entry
+            
+            if not self.fetcher.dry_run:
+                self.handle_stale_files()
+                self.write_lock()
+        except Exception as e:
+            self.error = str(e)
+            self.log(f"Fout tijdens fetch: {e}", "ERROR")
+        return self.ok
+
+
+class AgentFetcher:
+    """Fetches agent artifacts from a source repository into one or more target workspaces."""
+    
+    def __init__(
+        self,
+        target_roots: List[Path],
+        source_url: str = "https://github.com/hans-blok/agent-capabilities.git",
+        dry_run: bool = False,
+        update_scripts: bool = False,
+        platform: str = 'github-actions',
+        mirror_dir: Optional[Path] = None,
+        use_mirror: bool = True,
+        prune: bool = False,
+        bundle: Optional[str] = None,
+        jobs: int = 8,
+        copy_workers: Optional[int] = None
+    ):
+        """Initialize the fetcher."""
+        self.targets = [TargetSync(self, target_root) for target_root in target_roots]
+        self.source_url = source_url
+        self.mirror_root = mirror_dir or Path(os.environ.get("AGENT_MIRROR_DIR", DEFAULT_MIRROR_DIR))
+        self.use_mirror = use_mirror
+        self.prune = prune
+        self.jobs = max(1, jobs)
+        self.copy_workers = max(1, copy_workers or DEFAULT_COPY_WORKERS)
+        self.copy_pool = None
+        self.source_commit = None
+        self.dry_run = dry_run
+        self.update_scripts = update_scripts
+        self.platform = platform
+        # Copy set shared by all targets: (source file, path relative to target, source SHA-256)
+        self.plan: List[Tuple[Path, str, str]] = []
+        self.planned_targets = set()
+        self.temp_dir = None
+        self.source_root = None
+        self.source_index = None
+        self.bundle = bundle
+        self.bundle_manifest = None
+        self.agent_names = None
+        if bundle:
+            # Recorded as source in the lock files of the targets
+            self.source_url = bundle
+        self.print_lock = threading.Lock()
+    
+    def log(self, message: str, prefix: str = "INFO", sync: Optional[TargetSync] = None):
+        """Log a message with prefix; without sync it goes to the log files of all targets."""
         colors = {
             "INFO": "\033[96m",
             "SUCCESS": "\033[92m",
@@ -92,49 +475,105 @@ class AgentFetcher:
         }
         reset = "\033[0m"
         color = colors.get(prefix, "")
-        print(f"{color}[{prefix}] {message}{reset}")
+        label = f"[{sync.label}] " if sync and len(self.targets) > 1 else ""
+        with self.print_lock:
+            print(f"{color}[{prefix}] {label}{message}{reset}")
         
         # Also log to file if logger is configured
-        if self.logger:
+        loggers = [sync.logger] if sync else [target.logger for target in self.targets]
+        for logger in loggers:
+            if not logger:
+                continue
             log_methods = {
-                "INFO": self.logger.info,
-                "SUCCESS": self.logger.info,
-                "WARNING": self.logger.warning,
-                "ERROR": self.logger.error,
-                "DRY-RUN": self.logger.info
+                "INFO": logger.info,
+                "SUCCESS": logger.info,
+                "WARNING": logger.warning,
+                "ERROR": logger.error,
+                "DRY-RUN": logger.info
             }
-            log_method = log_methods.get(prefix, self.logger.info)
+            log_method = log_methods.get(prefix, logger.info)
             log_method(message)
+
+    def run_git(self, *args: str, cwd: Optional[Path] = None) -> str:
+        """Run a git command and return its stdout; raises RuntimeError on failure."""
+        try:
+            result = subprocess.run(
+                ["git", *args],
+                cwd=str(cwd) if cwd else None,
+                capture_output=True,
+                text=True,
+                check=True
+            )
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"git {args[0]} mislukt: {e.stderr.strip()}")
+        return result.stdout.strip()
+    
+    def get_mirror_dir(self) -> Path:
+        """Mirror directory for the source URL: readable name plus a hash of the full URL."""
+        name = re.sub(r'[^A-Za-z0-9_.-]+', '-', self.source_url.rstrip('/').split('/')[-1]).strip('-') or "source"
+        digest = hashlib.sha256(self.source_url.encode('utf-8')).hexdigest()[:12]
+        return self.mirror_root / f"{name}-{digest}"
+    
+    def clone_into(self, directory: Path):
+        """Shallow, blobless, sparse clone: one commit, blobs only for SPARSE_PATHS."""
+        self.run_git("clone", "--depth", "1", "--filter=blob:none", "--sparse",
+                     source_to_git_url(self.source_url), str(directory))
+        self.run_git("sparse-checkout", "set", *SPARSE_PATHS, cwd=directory)
+    
+    def update_mirror(self, directory: Path):
+        """Fetch the latest commit of the remote HEAD into an existing mirror."""
+        self.run_git("remote", "set-url", "origin", source_to_git_url(self.source_url), cwd=directory)
+        self.run_git("sparse-checkout", "set", *SPARSE_PATHS, cwd=directory)
+        self.run_git("fetch", "--depth", "1", "--filter=blob:none", "origin", "HEAD", cwd=directory)
+        self.run_git("reset", "--hard", "--quiet", "FETCH_HEAD", cwd=directory)
     
     def clone_source(self) -> Path:
-        """Clone source repository to temporary location."""
-        self.log(f"Klonen van: {self.source_url}")
+        """Bring the local mirror of the source repository up to date (or create it) and return it."""
+        self.log(f"Bron: {self.source_url}")
         
         if self.dry_run:
-            self.log("Would clone source repository", "DRY-RUN")
+            self.log("Would extract bundle" if self.bundle else "Would update source mirror", "DRY-RUN")
             # Create fake temp dir for dry-run
             return Path(tempfile.mkdtemp())
         
-        temp_dir = Path(tempfile.mkdtemp())
-        self.temp_dir = temp_dir
+        if self.bundle:
+            return self.extract_bundle()
         
-        try:
-            result = subprocess.run(
-                ["git", "clone", self.source_url, str(temp_dir)],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            self.log(f"Repository gekloond naar: {temp_dir}")
-            return temp_dir
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"Git clone mislukt: {e.stderr}")
+        if not self.use_mirror:
+            # One-off checkout in a temp dir, removed again in cleanup()
+            temp_dir = Path(tempfile.mkdtemp())
+            self.temp_dir = temp_dir
+            self.clone_into(temp_dir / "source")
+            self.source_commit = self.run_git("rev-parse", "HEAD", cwd=temp_dir / "source")
+            self.log(f"Repository gekloond naar: {temp_dir / 'source'}")
+            return temp_dir / "source"
+        
+        mirror = self.get_mirror_dir()
+        if (mirror / ".git").is_dir():
+            try:
+                self.update_mirror(mirror)
+                self.log(f"Mirror bijgewerkt: {mirror}")
+            except RuntimeError as e:
+                if not (mirror / "agent-componenten").is_dir():
+                    # Unusable mirror: start over
+                    self.log(f"Mirror onbruikbaar, opnieuw klonen: {e}", "WARNING")
+                    self.remove_tree(mirror)
+                else:
+                    # Offline or remote unavailable: continue with the last fetched commit
+                    self.log(f"Mirror bijwerken mislukt, bestaande mirror wordt gebruikt: {e}", "WARNING")
+        if not (mirror / ".git").is_dir():
+            mirror.parent.mkdir(parents=True, exist_ok=True)
+            if mirror.exists():
+                self.remove_tree(mirror)
+            self.clone_into(mirror)
+            self.log(f"Mirror aangemaakt: {mirror}")
+        
+        self.source_commit = self.run_git("rev-parse", "HEAD", cwd=mirror)
+        self.log(f"Bron commit: {self.source_commit[:12]}")
+        return mirror
     
     def validate_workspaces(self):
-        """Validate target workspace."""
-        if not self.target_root.exists():
-            raise FileNotFoundError(f"Target workspace niet gevonden: {self.target_root}")
-        
+        """Validate source and target workspaces; a missing target fails only that target."""
         # Check if source has agent structure (for dry-run with real source)
         if self.source_root and not self.dry_run:
             source_prompts = self.source_root / "agent-componenten" / "prompts"
@@ -142,8 +581,144 @@ class AgentFetcher:
                 raise FileNotFoundError(f"Geen agent prompts gevonden in source: {source_prompts}")
         
         self.log(f"Source: {self.source_url}")
-        self.log(f"Target: {self.target_root}")
         self.log(f"Platform: {self.platform}")
+        for target in self.targets:
+            if not target.target_root.exists():
+                target.error = f"Target workspace niet gevonden: {target.target_root}"
+                target.log(target.error, "ERROR")
+            else:
+                target.log(f"Target: {target.target_root}")
+
+    def open_bundle(self):
+        """Open the bundle (local file or URL) as binary stream."""
+        if is_url(self.bundle):
+            return urllib.request.urlopen(self.bundle)
+        return open(self.bundle, 'rb')
+    
+    def bundle_checksum(self) -> Optional[str]:
+        """Expected SHA-256 of the archive from the <bundle>.sha256 file next to it, if present."""
+        try:
+            if is_url(self.bundle):
+                with urllib.request.urlopen(self.bundle + ".sha256") as response:
+                    content = response.read().decode('utf-8')
+            else:
+                checksum_path = Path(self.bundle + ".sha256")
+                if not checksum_path.exists():
+                    return None
+                content = checksum_path.read_text(encoding='utf-8')
+        except (urllib.error.URLError, OSError):
+            return None
+        return content.split()[0].lower() if content.strip() else None
+    
+    def select_bundle_files(self, manifest: Dict) -> set:
+        """Bundle paths needed for this run: the requested agents plus shared files."""
+        files = manifest.get("files", {})
+        agents = manifest.get("agents", {})
+        platform_pipelines = f"agent-componenten/pipelines/generated/{self.platform}/"
+        
+        selected = set()
+        for name in self.agent_names or agents:
+            for rel_path in agents.get(name, []):
+                # Pipelines of other platforms are not fetched
+                if rel_path.startswith("agent-componenten/pipelines/generated/") and \
+                        not rel_path.startswith(platform_pipelines):
+                    continue
+                selected.add(rel_path)
+        
+        shared_prefixes = ["agent-componenten/workflows/", platform_pipelines + "workflow."]
+        if self.update_scripts:
+            shared_prefixes.append("scripts/")
+        shared_files = {"agent-componenten/runners/agent_runtime.py", ".github/copilot/agents.yaml"}
+        for rel_path in files:
+            if rel_path in shared_files or rel_path.startswith(tuple(shared_prefixes)):
+                selected.add(rel_path)
+        
+        # Only files listed in the manifest can be selected, so unlisted members are never extracted
+        return {rel_path for rel_path in selected if rel_path in files and bundle_path_is_safe(rel_path)}
+    
+    def extract_bundle_member(self, stream, rel_path: str, expected: Dict, destination: Path):
+        """Stream one archive member to disk and verify it against the manifest."""
+        target = destination / rel_path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        digest = hashlib.sha256()
+        with open(target, 'wb') as f:
+            for chunk in iter(lambda: stream.read(65536), b''):
+                digest.update(chunk)
+                f.write(chunk)
+        if digest.hexdigest() != expected.get("sha256"):
+            raise RuntimeError(f"Integriteitsfout in bundle: {rel_path} wijkt af van het manifest")
+    
+    def read_bundle_manifest(self, data: bytes) -> Dict:
+        """Parse and check the bundle manifest."""
+        manifest = json.loads(data.decode('utf-8'))
+        if manifest.get("version") != BUNDLE_MANIFEST_VERSION:
+            raise RuntimeError(f"Onbekende bundle manifest versie: {manifest.get('version')}")
+        return manifest
+    
+    def extract_bundle(self) -> Path:
+        """
+        Extract the needed part of a release bundle into a temp directory and return it.
+        
+        tar.gz bundles are read as a stream: the manifest is the first member, after
+        which only the selected members are written. Every extracted file is checked
+        against the SHA-256 in the manifest and the archive itself against the
+        <bundle>.sha256 file when present. Nothing is copied to the targets before
+        the whole bundle has been verified.
+        """
+        self.temp_dir = Path(tempfile.mkdtemp())
+        source_root = self.temp_dir / "source"
+        (source_root / "agent-componenten" / "prompts").mkdir(parents=True)
+        expected_checksum = self.bundle_checksum()
+        extracted = set()
+        
+        with self.open_bundle() as raw:
+            reader = HashingReader(raw)
+            if self.bundle.split('?')[0].endswith(".zip"):
+                # Zip needs random access: spool the stream to a file first
+                archive_path = self.temp_dir / "bundle.zip"
+                with open(archive_path, 'wb') as f:
+                    shutil.copyfileobj(reader, f)
+                with zipfile.ZipFile(archive_path) as archive:
+                    self.bundle_manifest = self.read_bundle_manifest(archive.read(BUNDLE_MANIFEST_NAME))
+                    selected = self.select_bundle_files(self.bundle_manifest)
+                    for rel_path in sorted(selected):
+                        with archive.open(rel_path) as member:
+                            self.extract_bundle_member(member, rel_path, self.bundle_manifest["files"][rel_path], source_root)
+                        extracted.add(rel_path)
+            else:
+                with tarfile.open(fileobj=reader, mode='r|*') as archive:
+                    first = archive.next()
+                    if first is None or first.name != BUNDLE_MANIFEST_NAME:
+                        raise RuntimeError(f"{BUNDLE_MANIFEST_NAME} ontbreekt als eerste bestand in de bundle")
+                    self.bundle_manifest = self.read_bundle_manifest(archive.extractfile(first).read())
+                    selected = self.select_bundle_files(self.bundle_manifest)
+                    for member in archive:
+                        if member.isfile() and member.name in selected and member.name not in extracted:
+                            self.extract_bundle_member(archive.extractfile(member), member.name,
+                                                       self.bundle_manifest["files"][member.name], source_root)
+                            extracted.add(member.name)
+            archive_checksum = reader.drain()
+        
+        missing = selected - extracted
+        if missing:
+            raise RuntimeError(f"Bundle onvolledig, ontbrekende bestanden: {', '.join(sorted(missing)[:5])}")
+        if expected_checksum:
+            if archive_checksum != expected_checksum:
+                raise RuntimeError("Integriteitsfout: SHA-256 van de bundle wijkt af van het .sha256 bestand")
+            self.log("Bundle checksum geverifieerd", "SUCCESS")
+        else:
+            self.log("Geen .sha256 bestand bij de bundle; alleen bestanden zijn tegen het manifest gecontroleerd", "WARNING")
+        
+        self.source_commit = self.bundle_manifest.get("commit")
+        self.log(f"Bundle uitgepakt: {len(extracted)} van {len(self.bundle_manifest['files'])} bestanden"
+                 f" (commit: {(self.source_commit or 'onbekend')[:12]})")
+        return source_root
+    
+    def source_exists(self, rel_path: str) -> bool:
+        """True when a source path still exists; for bundles the manifest is leading, not the partial extraction."""
+        if self.bundle_manifest is not None:
+            return rel_path in self.bundle_manifest.get("files", {})
+        return (self.source_root / rel_path).exists()
     
     def get_available_agents(self) -> List[str]:
         """Get list of available agents from source."""
@@ -157,16 +732,13 @@ class AgentFetcher:
             self.log(f"Prompts directory niet gevonden: {prompts_dir}", "WARNING")
             return []
         
-        agents = []
-        for prompt_file in prompts_dir.glob("*.prompt.md"):
-            # Extract agent name (e.g., "b.cdm-architect.prompt.md" -> "cdm-architect")
-            name = prompt_file.stem.replace(".prompt", "")
-            # Remove phase prefix (e.g., "b.cdm-architect" -> "cdm-architect")
-            if '.' in name:
-                name = '.'.join(name.split('.')[1:])
-            agents.append(name)
-        
-        return sorted(agents)
+        return self.get_source_index().names(with_component='prompt')
+    
+    def get_source_index(self):
+        """Agent index of the source repository (built once per run)."""
+        if self.source_index is None:
+            self.source_index = InlineAgentIndex(self.source_root)
+        return self.source_index
     
     def find_agent_files(self, agent_name: str) -> dict:
         """
@@ -188,64 +760,49 @@ class AgentFetcher:
             self.log(f"Would find files for agent: {agent_name}", "DRY-RUN")
             return files
         
-        # Find prompt (pattern: *.<agent-name>.prompt.md)
-        prompts_dir = self.source_root / "agent-componenten" / "prompts"
-        for prompt_file in prompts_dir.glob(f"*.{agent_name}.prompt.md"):
-            files['prompt'] = prompt_file
-            break
-        
-        # Find agent definition (pattern: *.<agent-name>.agent.md)
-        # NOTE: Dit wordt deprecated - agent definitions (.agent.md) zijn verwijderd.
-        # Alleen charters (.agent.charter) blijven bestaan en die zijn lokaal in governance/agent-charters/.
-        agents_dir = self.source_root / "agent-componenten" / "agents"
-        if agents_dir.exists():
-            for agent_file in agents_dir.glob(f"*.{agent_name}.agent.md"):
-                files['agent'] = agent_file
-                break
-        
-        # Find runner (pattern: *.<agent-name>.py in runners/)
-        runners_dir = self.source_root / "agent-componenten" / "runners"
-        if runners_dir.exists():
-            for runner_file in runners_dir.glob(f"*.{agent_name}.py"):
-                files['runner'] = runner_file
-                break
-        
-        # Find orchestration (pattern: *.<agent-name>.orchestration.yaml in orchestrations/)
-        orch_dir = self.source_root / "agent-componenten" / "orchestrations"
-        if orch_dir.exists():
-            for orch_file in orch_dir.glob(f"*.{agent_name}.orchestration.yaml"):
-                files['orchestration'] = orch_file
-                break
-        
-        # Find buildplan (pattern: *.<agent-name>.json in buildplans/)
-        buildplans_dir = self.source_root / "agent-componenten" / "buildplans"
-        if buildplans_dir.exists():
-            for buildplan_file in buildplans_dir.glob(f"*.{agent_name}.json"):
-                files['buildplan'] = buildplan_file
-                break
-        
-        # Find pipeline (pattern: *.<agent-name>.* in pipelines/generated/<platform>/)
-        pipelines_dir = self.source_root / "agent-componenten" / "pipelines" / "generated" / self.platform
-        if pipelines_dir.exists():
-            for pipeline_file in pipelines_dir.glob(f"*.{agent_name}.*"):
-                files['pipeline'] = pipeline_file
-                break
+        # All components are resolved through the source index: one lookup per agent
+        # instead of a glob per component directory.
+        # NOTE: Agent definitions (.agent.md) zijn deprecated - alleen charters (.agent.charter)
+        # blijven bestaan en die zijn lokaal in governance/agent-charters/.
+        index = self.get_source_index()
+        entry = index.lookup(agent_name)
+        if not entry:
+            return files
+        
+        for kind in ('prompt', 'agent', 'runner', 'orchestration', 'buildplan'):
+            files[kind] = index.resolve(entry[kind])
+        files['pipeline'] = index.resolve(entry['pipelines'].get(self.platform))
+        
+        # Never fetch a mixed set (e.g. legacy u.* runner next to a u03.* orchestration)
+        phases = {component_phase(path) for path in files.values() if path}
+        if len(phases) > 1:
+            phase = component_phase(files['prompt']) if files['prompt'] else entry['phase']
+            self.log(f"Componenten van {agent_name} hebben verschillende fase prefixen "
+                     f"({', '.join(sorted(phases))}); alleen fase {phase} wordt opgehaald", "WARNING")
+            files = {kind: path if path and component_phase(path) == phase else None
+                     for kind, path in files.items()}
         
         return files
+    def pipeline_target_dir(self) -> str:
+        """Directory (relative to a target workspace) where pipelines of the platform belong."""
+        if self.platform == 'github-actions':
+            return ".github/workflows"
+        elif self.platform == 'gitlab-ci':
+            return ""  # GitLab CI files in root
+        return ".pipelines"
     
-    def copy_file(self, source: Path, target: Path):
-        """Copy a file from source to target."""
-        if self.dry_run:
-            self.log(f"Would copy: {source.name} -> {target.relative_to(self.target_root)}", "DRY-RUN")
-            self.copied_files.append(source)
-        else:
-            target.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(source, target)
-            self.log(f"Copied: {source.name} -> {target.relative_to(self.target_root)}")
-            self.copied_files.append(source)
+    def add_to_plan(self, source: Path, target_rel: Optional[str] = None):
+        """Add a source file to the copy plan; hashed once here, reused for every target."""
+        if target_rel is None:
+            target_rel = source.relative_to(self.source_root).as_posix()
+        if target_rel in self.planned_targets:
+            # E.g. an agent given twice with --agents; copying it twice would race on the pool
+            return
+        self.planned_targets.add(target_rel)
+        self.plan.append((source, target_rel, file_sha256(source)))
     
-    def fetch_agent(self, agent_name: str):
-        """Fetch a single agent to target workspace."""
+    def plan_agent(self, agent_name: str):
+        """Plan the files of a single agent."""
         self.log(f"Ophalen agent: {agent_name}")
         
         files = self.find_agent_files(agent_name)
@@ -256,68 +813,48 @@ class AgentFetcher:
         
         # Copy prompt
         if files['prompt']:
-            source_prompt = files['prompt']
-            target_prompt = self.target_root / ".github" / "prompts" / source_prompt.name
-            self.copy_file(source_prompt, target_prompt)
+            self.add_to_plan(files['prompt'], f".github/prompts/{files['prompt'].name}")
         
         # Copy agent definition if exists
         if files['agent']:
-            source_agent = files['agent']
-            rel_agent = source_agent.relative_to(self.source_root)
-            target_agent = self.target_root / rel_agent
-            self.copy_file(source_agent, target_agent)
+            self.add_to_plan(files['agent'])
         else:
             if not self.dry_run:
                 self.log(f"Geen agent definitie gevonden voor {agent_name}", "WARNING")
         
         # Copy buildplan if exists
         if files['buildplan']:
-            source_buildplan = files['buildplan']
-            rel_buildplan = source_buildplan.relative_to(self.source_root)
-            target_buildplan = self.target_root / rel_buildplan
-            self.copy_file(source_buildplan, target_buildplan)
+            self.add_to_plan(files['buildplan'])
         else:
             if not self.dry_run:
                 self.log(f"Geen buildplan gevonden voor {agent_name}", "WARNING")
         
         # Copy runner if exists
         if files['runner']:
-            source_runner = files['runner']
-            rel_runner = source_runner.relative_to(self.source_root)
-            target_runner = self.target_root / rel_runner
-            self.copy_file(source_runner, target_runner)
+            self.add_to_plan(files['runner'])
         else:
             if not self.dry_run:
                 self.log(f"Geen runner gevonden voor {agent_name}", "WARNING")
         
         # Copy orchestration if exists
         if files['orchestration']:
-            source_orch = files['orchestration']
-            rel_orch = source_orch.relative_to(self.source_root)
-            target_orch = self.target_root / rel_orch
-            self.copy_file(source_orch, target_orch)
+            self.add_to_plan(files['orchestration'])
         else:
             if not self.dry_run:
                 self.log(f"Geen orchestration gevonden voor {agent_name}", "WARNING")
         
         # Copy pipeline if exists
         if files['pipeline']:
-            if self.platform == 'github-actions':
-                target_pipeline_dir = self.target_root / ".github" / "workflows"
-            elif self.platform == 'gitlab-ci':
-                target_pipeline_dir = self.target_root  # GitLab CI files in root
-            else:
-                target_pipeline_dir = self.target_root / ".pipelines"
-            
-            self.copy_file(files['pipeline'], target_pipeline_dir / files['pipeline'].name)
+            target_rel = PurePosixPath(self.pipeline_target_dir()) / files['pipeline'].name
+            self.add_to_plan(files['pipeline'], target_rel.as_posix())
         else:
             if not self.dry_run:
                 self.log(f"Geen pipeline gevonden voor {agent_name} (platform: {self.platform})", "WARNING")
         
         return True
     
-    def fetch_scripts(self):
-        """Fetch scripts directory (including fetch-agents.py itself)."""
+    def plan_scripts(self):
+        """Plan the scripts directory (including fetch-agents.py itself)."""
         if not self.update_scripts:
             return
         
@@ -326,7 +863,6 @@ class AgentFetcher:
             return
         
         source_scripts = self.source_root / "scripts"
-        target_scripts = self.target_root / "scripts"
         
         if not source_scripts.exists():
             self.log("Geen scripts directory gevonden", "WARNING")
@@ -336,11 +872,22 @@ class AgentFetcher:
         
         # Copy all Python files from scripts directory
         for script_file in source_scripts.glob("*.py"):
-            target_file = target_scripts / script_file.name
-            self.copy_file(script_file, target_file)
+            self.add_to_plan(script_file)
     
-    def fetch_workflows(self):
-        """Fetch workflow pipelines (multi-agent compositions)."""
+    def plan_runtime(self):
+        """Plan the shared runner runtime (agent_runtime.py) used by all runners."""
+        if self.dry_run:
+            self.log("Would copy runner runtime", "DRY-RUN")
+            return
+        
+        source_runtime = self.source_root / "agent-componenten" / "runners" / "agent_runtime.py"
+        if source_runtime.exists():
+            self.add_to_plan(source_runtime)
+        else:
+            self.log("Geen agent_runtime.py gevonden", "WARNING")
+    
+    def plan_workflows(self):
+        """Plan workflow pipelines (multi-agent compositions)."""
         if self.dry_run:
             self.log("Would copy workflow pipelines", "DRY-RUN")
             return
@@ -353,69 +900,74 @@ class AgentFetcher:
         # Find all workflow pipelines (pattern: workflow.*.*)
         workflow_count = 0
         self.log("Ophalen workflows...")
+        target_pipeline_dir = PurePosixPath(self.pipeline_target_dir())
         for workflow_file in pipelines_dir.glob("workflow.*"):
-            if self.platform == 'github-actions':
-                target_pipeline_dir = self.target_root / ".github" / "workflows"
-            elif self.platform == 'gitlab-ci':
-                target_pipeline_dir = self.target_root  # GitLab CI files in root
-            else:
-                target_pipeline_dir = self.target_root / ".pipelines"
-            
-            self.copy_file(workflow_file, target_pipeline_dir / workflow_file.name)
+            self.add_to_plan(workflow_file, (target_pipeline_dir / workflow_file.name).as_posix())
             workflow_count += 1
         
+        # Workflow definitions for run-workflow.py (agent-componenten/workflows/*.workflow.yaml)
+        workflows_dir = self.source_root / "agent-componenten" / "workflows"
+        if workflows_dir.exists():
+            for definition_file in workflows_dir.glob("*.workflow.yaml"):
+                self.add_to_plan(definition_file)
+                workflow_count += 1
+        
         if workflow_count > 0:
             self.log(f"Workflows opgehaald: {workflow_count}", "SUCCESS")
         else:
             self.log("Geen workflows gevonden")
     
-    def fetch_agents_yaml(self):
-        """Fetch agents.yaml configuration."""
+    def plan_agents_yaml(self):
+        """Plan the agents.yaml configuration."""
         if self.dry_run:
             self.log("Would copy agents.yaml", "DRY-RUN")
             return
         
         source_yaml = self.source_root / ".github" / "copilot" / "agents.yaml"
-        target_yaml = self.target_root / ".github" / "copilot" / "agents.yaml"
         
         if source_yaml.exists():
-            self.copy_file(source_yaml, target_yaml)
+            self.add_to_plan(source_yaml)
         else:
             self.log("Geen agents.yaml gevonden", "WARNING")
+
+    def remove_tree(self, directory: Path):
+        """Remove a directory tree, including read-only git files (Windows)."""
+        def handle_remove_readonly(func, path, exc):
+            """Error handler for Windows readonly files."""
+            import stat
+            if not os.access(path, os.W_OK):
+                # Change file to be writable
+                os.chmod(path, stat.S_IWUSR | stat.S_IREAD)
+                func(path)
+            else:
+                raise
+        
+        shutil.rmtree(directory, onerror=handle_remove_readonly)
     
     def cleanup(self):
-        """Clean up temporary directory."""
+        """Clean up temporary directory (only used with --no-mirror)."""
         if self.temp_dir and self.temp_dir.exists():
             try:
-                # On Windows, git files can be read-only, so we need to handle permissions
-                def handle_remove_readonly(func, path, exc):
-                    """Error handler for Windows readonly files."""
-                    import stat
-                    import os
-                    if not os.access(path, os.W_OK):
-                        # Change file to be writable
-                        os.chmod(path, stat.S_IWUSR | stat.S_IREAD)
-                        func(path)
-                    else:
-                        raise
-                
-                shutil.rmtree(self.temp_dir, onerror=handle_remove_readonly)
+                self.remove_tree(self.temp_dir)
                 self.log(f"Temporary directory verwijderd")
             except Exception as e:
                 self.log(f"Kon temporary directory niet volledig verwijderen: {e}", "WARNING")
                 self.log(f"Je kunt handmatig verwijderen: {self.temp_dir}", "INFO")
     
     def run(self, agent_names: Optional[List[str]] = None):
-        """Run the fetch operation."""
+        """Run the fetch operation: resolve and plan once, then apply to all targets in parallel."""
         try:
             # Setup logging to file
             if not self.dry_run:
-                self.setup_logging()
+                for target in self.targets:
+                    if target.target_root.exists():
+                        target.setup_logging()
             
             if self.dry_run:
                 self.log("DRY-RUN MODE - geen bestanden worden gekopieerd", "DRY-RUN")
             
-            # Clone source repository
+            # Clone source repository (or extract the bundle)
+            self.agent_names = agent_names
             self.source_root = self.clone_source()
             
             self.validate_workspaces()
@@ -428,38 +980,68 @@ class AgentFetcher:
                 if agents:
                     self.log(f"Ophalen van alle {len(agents)} agents")
                 else:
-                    self.log("Geen agents gevonden" if not self.dry_run else "Would fetch all agents", 
+                    self.log("Geen agents gevonden" if not self.dry_run else "Would fetch all agents",
                             "WARNING" if not self.dry_run else "DRY-RUN")
                     if self.dry_run:
                         agents = []  # Continue with empty list for dry-run
             
-            # Fetch each agent
+            # Plan each agent
             success_count = 0
             for agent_name in agents:
-                if self.fetch_agent(agent_name):
+                if self.plan_agent(agent_name):
                     success_count += 1
             
-            # Fetch workflows (multi-agent pipelines)
-            self.fetch_workflows()
+            # Plan shared runner runtime
+            if success_count:
+                self.plan_runtime()
+            
+            # Plan workflows (multi-agent pipelines)
+            self.plan_workflows()
+            
+            # Plan agents.yaml
+            self.plan_agents_yaml()
             
-            # Fetch agents.yaml
-            self.fetch_agents_yaml()
+            # Plan scripts if requested
+            self.plan_scripts()
             
-            # Fetch scripts if requested
-            self.fetch_scripts()
+            # Apply the plan to all valid targets concurrently; file copies of all
+            # targets share one bounded pool, so --jobs does not multiply the I/O threads
+            targets = [target for target in self.targets if target.error is None]
+            if targets:
+                self.log(f"Kopieerplan: {len(self.plan)} bestanden naar {len(targets)} target(s)")
+                with ThreadPoolExecutor(max_workers=self.copy_workers) as copy_pool, \
+                        ThreadPoolExecutor(max_workers=min(self.jobs, len(targets))) as pool:
+                    self.copy_pool = copy_pool
+                    list(pool.map(lambda target: target.apply(self.plan), targets))
+                self.copy_pool = None
             
             # Summary
             self.log(f"\nSamenvatting:", "SUCCESS")
             self.log(f"  Agents opgehaald: {success_count}/{len(agents) if agents else 0}")
-            self.log(f"  Bestanden gekopieerd: {len(self.copied_files)}")
             if self.update_scripts:
                 self.log(f"  Scripts bijgewerkt: ja")
+            for target in self.targets:
+                self.log(f"  Target: {target.target_root}", "SUCCESS" if target.ok else "ERROR")
+                if target.error:
+                    self.log(f"    Fout: {target.error}", "ERROR")
+                    continue
+                self.log(f"    Bestanden gekopieerd: {len(target.copied_files)}")
+                self.log(f"    Bestanden ongewijzigd: {len(target.unchanged_files)}")
+                if target.stale_files:
+                    action = "verwijderd" if self.prune else "gevonden (verwijder met --prune)"
+                    self.log(f"    Verouderde bestanden {action}: {len(target.stale_files)}")
+                if target.failed_files:
+                    self.log(f"    Bestanden mislukt: {len(target.failed_files)}", "ERROR")
             
             if self.dry_run:
                 self.log("\nDit was een dry-run. Voer opnieuw uit zonder --dry-run om op te halen.", "DRY-RUN")
             
+            failed = [target for target in self.targets if not target.ok]
+            if failed:
+                self.log(f"{len(failed)} van {len(self.targets)} target(s) niet (volledig) bijgewerkt", "ERROR")
+                return 1
             return 0
-            
+        
         except Exception as e:
             self.log(f"Fout tijdens fetch: {e}", "ERROR")
             raise
@@ -486,8 +1068,22 @@ Voorbeelden:
   # Update scripts directory (inclusief fetch-agents.py zelf)
   python fetch-agents.py --update-scripts
   
+  # Verwijder bestanden van agents die niet meer in de bron bestaan
+  python fetch-agents.py --prune
+  
   # Gebruik andere bron
   python fetch-agents.py --source https://github.com/other/repo.git
+  
+  # Lokale bare repository als bron, eigen mirror locatie
+  python fetch-agents.py --source /srv/git/agent-capabilities.git --mirror-dir /tmp/mirrors
+  
+  # Uit een release bundle (offline, geen git nodig)
+  python fetch-agents.py --bundle /media/usb/agent-capabilities-1a2b3c4d5e6f.tar.gz
+  python fetch-agents.py --bundle https://example.org/releases/agent-capabilities-latest.tar.gz --agents cdm-architect
+  
+  # Verdeel over meerdere workspaces (één bron checkout, parallel toegepast)
+  python fetch-agents.py --target ../project-a --target ../project-b
+  python fetch-agents.py --targets-file workspaces.txt --jobs 16
         """
     )
     
@@ -504,22 +1100,57 @@ Voorbeelden:
                        default="https://github.com/hans-blok/agent-capabilities.git",
                        help='Bron repository URL (default: agent-capabilities)')
     
-    parser.add_argument('--target', default=None,
-                       help='Target workspace directory (default: current directory)')
+    parser.add_argument('--target', action='append', default=None,
+                       help='Target workspace directory; herhaalbaar (default: current directory)')
+    
+    parser.add_argument('--targets-file', type=Path, default=None,
+                       help='Bestand met target workspace directories, één per regel (# voor commentaar, relatief t.o.v. het bestand)')
+    
+    parser.add_argument('--jobs', type=int, default=8,
+                       help='Aantal targets dat parallel bijgewerkt wordt (default: 8)')
+    
+    parser.add_argument('--copy-workers', type=int, default=None,
+                       help=f'Aantal threads voor het kopiëren van bestanden, gedeeld door alle targets (default: {DEFAULT_COPY_WORKERS})')
     
     parser.add_argument('--platform', default='github-actions',
                        help='Pipeline platform om op te halen (github-actions, gitlab-ci)')
     
+    parser.add_argument('--mirror-dir', type=Path, default=None,
+                       help='Directory voor bron mirrors (default: AGENT_MIRROR_DIR of ~/.cache/agent-capabilities/mirrors)')
+    
+    parser.add_argument('--bundle', default=None,
+                       help='Haal op uit een release bundle (pad of URL, zie publish-bundle.py) in plaats van git')
+    
+    parser.add_argument('--no-mirror', action='store_true',
+                       help='Gebruik geen persistente mirror; kloon eenmalig naar een temp directory')
+    
+    parser.add_argument('--prune', action='store_true',
+                       help=f'Verwijder eerder opgehaalde bestanden waarvan de bron niet meer bestaat (zie {LOCK_FILE})')
+    
     args = parser.parse_args()
     
-    target = Path(args.target).resolve() if args.target else Path.cwd()
+    targets = [Path(target) for target in args.target or []]
+    if args.targets_file:
+        for line in args.targets_file.read_text(encoding='utf-8').splitlines():
+            line = line.strip()
+            if line and not line.startswith('#'):
+                # Relative paths are relative to the targets file
+                targets.append(args.targets_file.parent / line)
+    # Resolve and de-duplicate, keeping the given order
+    targets = list(dict.fromkeys(target.resolve() for target in targets)) or [Path.cwd()]
     
     fetcher = AgentFetcher(
-        target, 
+        targets, 
         source_url=args.source, 
         dry_run=args.dry_run, 
         update_scripts=args.update_scripts,
-        platform=args.platform
+        platform=args.platform,
+        mirror_dir=args.mirror_dir,
+        use_mirror=not args.no_mirror,
+        prune=args.prune,
+        bundle=args.bundle,
+        jobs=args.jobs,
+        copy_workers=args.copy_workers
     )
     return fetcher.run(agent_names=args.agents)
 
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+hash_utils.py
+
+Gedeelde hash helpers voor de scripts (build cache, checkpoints, bundle manifest).
+
+fetch-agents.py gebruikt deze module bewust niet: dat script moet los in een
+workspace kunnen draaien en heeft daarom een eigen kopie.
+
+GEBRUIK (als module):
+  from hash_utils import file_sha256
+
+  digest = file_sha256(Path("agent-componenten/workflows/hypothesis-to-cdm.workflow.yaml"))
+
+Versie: 1.0
+Datum: 18-10-2026
+"""
+
+import hashlib
+from pathlib import Path
+
+
+def file_sha256(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
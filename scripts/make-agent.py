@@ -10,6 +10,18 @@ VOORWAARDEN:
 
 GEBRUIK:
   python scripts-agent-ecosysteem/make-agent.py --agent-name "founding-hypothesis-owner"
+  python scripts-agent-ecosysteem/make-agent.py --agent-name "founding-hypothesis-owner" --subprocess
+  python scripts-agent-ecosysteem/make-agent.py --agents cdm-architect service-architect --jobs 4
+  python scripts-agent-ecosysteem/make-agent.py --all
+  python scripts-agent-ecosysteem/make-agent.py --all --force
+
+  Builds zijn incrementeel: het buildplan bevat een buildCache blok met hashes van het
+  charter, de builder scripts (inclusief gedeelde modules zoals yaml_utils.py) en de
+  plan inputs. Zonder wijzigingen worden de prompt, runner, orchestration en agent
+  definitie niet opnieuw geschreven. --force negeert de cache.
+
+  De builders (prompt, runner, orchestration) draaien standaard in-process via hun
+  build(plan) functie. Met --subprocess draait elke builder in een eigen interpreter.
 
 Agent: make-agent.py
 Versie: 1.0
@@ -17,15 +29,50 @@ Datum: 04-01-2026
 """
 
 import argparse
+import hashlib
+import importlib.util
+import io
 import json
 import os
-import re
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional
 import subprocess
-import yaml
+
+from agent_index import AgentIndex
+from charter_parser import parse_charter
+from hash_utils import file_sha256
+
+
+BUILDER_SCRIPTS = ["prompt-builder.py", "runner-builder.py", "orchestration-builder.py"]
+
+# Shared modules imported by the builders; they shape the generated bytes as well
+# (charter parsing, YAML dump options), so they are part of the build cache key
+SHARED_MODULES = ["charter_parser.py", "yaml_utils.py"]
+
+# Plan keys that do not influence the generated artifacts
+VOLATILE_PLAN_KEYS = ("generatedOn", "buildCache")
+
+
+# Builder modules loaded in this process, keyed on script path
+_builder_modules = {}
+
+
+def load_builder_module(script_path: Path):
+    """Import a builder script as module (once per process)."""
+    key = str(script_path.resolve())
+    if key not in _builder_modules:
+        module_name = "builder_" + script_path.stem.replace('-', '_')
+        spec = importlib.util.spec_from_file_location(module_name, script_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        if not hasattr(module, "build"):
+            raise AttributeError(f"Builder script heeft geen build(plan) functie: {script_path}")
+        _builder_modules[key] = module
+    return _builder_modules[key]
 
 
 class AgentMaker:
@@ -33,7 +80,9 @@ class AgentMaker:
     
     def __init__(self, agent_name: str, repo_root: Optional[str] = None, 
                  charter_root: str = "https://github.com/hans-blok/standard.git",
-                 local_charter_clone: Optional[str] = None):
+                 local_charter_clone: Optional[str] = None,
+                 use_subprocess: bool = False,
+                 force: bool = False):
         """Initialize the agent maker."""
         # Strip phase prefix from agent_name if present (e.g., "u05.layout-optimizer" -> "layout-optimizer")
         # This allows users to specify either "layout-optimizer" or "u05.layout-optimizer"
@@ -49,6 +98,9 @@ class AgentMaker:
         self.repo_root = Path(repo_root) if repo_root else Path.cwd()
         self.charter_root = charter_root
         self.local_charter_clone = local_charter_clone
+        self.use_subprocess = use_subprocess
+        self.force = force
+        self.skipped = False
         self.plan = None
     
     def log(self, message: str, prefix: str = "INFO"):
@@ -89,45 +141,43 @@ class AgentMaker:
             self.log(f"Kon charter repository niet updaten: {e}", "WARNING")
     
     def resolve_charter_path(self) -> Path:
-        """Find the charter file for the given agent name."""
+        """Find the charter file for the given agent name via the agent index."""
         # Charters are now local in governance/agent-charters/
         charters_path = self.repo_root / "governance" / "agent-charters"
         
         if not charters_path.exists():
             raise FileNotFoundError(f"Charter directory niet gevonden: {charters_path}")
         
-        # Search for file matching ".<phase>.<agentname>.agent.charter"
-        # We don't know the phase yet, so search for any file ending with the agent name
-        pattern = f"*.{self.agent_name}.agent.charter"
-        matches = list(charters_path.glob(pattern))
+        entry = AgentIndex(self.repo_root).lookup(self.agent_name)
         
-        if not matches:
+        if not entry or not entry["charter"]:
             raise FileNotFoundError(
                 f"Geen charter gevonden voor AgentName '{self.agent_name}' "
-                f"onder {charters_path} (pattern: {pattern})."
+                f"onder {charters_path} (pattern: *.{self.agent_name}.agent.charter)."
             )
         
-        return matches[0]
+        return self.repo_root / entry["charter"]
     
     def get_phase_from_charter_path(self, charter_path: Path) -> str:
         """Extract phase from charter path."""
-        # New naming convention: .<phase>.<name>.agent.charter
+        # Naming convention: <phase>.<name>.agent.charter (legacy: .<phase>.<name>.agent.charter)
         filename = charter_path.stem  # Without extension
         parts_name = filename.split('.')
         
-        # Format: .<phase>.<name>.agent (charter_path.stem removes last extension)
-        # Example: .u95.python-script-schrijver.agent -> ['', 'u95', 'python-script-schrijver', 'agent']
-        if len(parts_name) >= 3 and parts_name[0] == '':
-            # The phase is the second element (after leading dot)
-            return parts_name[1]  # The phase part
+        # Format: <phase>.<name>.agent (charter_path.stem removes last extension)
+        # Example: u95.python-script-schrijver.agent -> ['u95', 'python-script-schrijver', 'agent']
+        if parts_name and parts_name[0] == '':
+            # Legacy format with leading dot
+            parts_name = parts_name[1:]
+        if len(parts_name) >= 3 and parts_name[0]:
+            return parts_name[0]  # The phase part
         
         raise ValueError(f"Kan phase niet bepalen uit charter naam: {charter_path.name}")
     
     def validate_phase_from_charter_content(self, charter_path: Path, expected_phase: str) -> bool:
         """Validate phase by reading SAFe Phase Alignment section from charter content."""
         try:
-            with open(charter_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            charter = parse_charter(charter_path)
             
             # Map phase prefixes to SAFe phase names
             phase_mapping = {
@@ -171,15 +221,13 @@ class AgentMaker:
             
             # For utility agents, check for "Utility (U) agent" in the section
             if phase_prefix.startswith('u'):
-                if 'Utility (U) agent' in content or 'utility-agent' in content:
+                if charter.is_utility:
                     self.log(f"✓ Charter fase validatie geslaagd: Utility Agent", "SUCCESS")
                     return True
             
             # Check if the expected phase has "✅ Ja" in the SAFe Phase Alignment table
-            # Look for pattern like "| B. Architectuur | ✅ Ja"
-            pattern = rf'\|\s*{re.escape(expected_safe_phase)}\s*\|[^|]*✅\s*Ja'
-            
-            if re.search(pattern, content):
+            # Look for a row like "| B. Architectuur | ✅ Ja ☐ Nee | ..."
+            if charter.supports_phase(expected_safe_phase):
                 self.log(f"✓ Charter fase validatie geslaagd: {expected_safe_phase}", "SUCCESS")
                 return True
             else:
@@ -230,14 +278,65 @@ class AgentMaker:
             ],
             "runtime": {
                 "llmProvider": "anthropic",
-                "model": "claude-sonnet",
-                "adapter": "Invoke-LLM (stub in runner)"
+                "model": "claude-sonnet-4-5",
+                "adapter": "agent_runtime"
             },
             "generatedOn": datetime.now().isoformat()
         }
         
         return plan
     
+    def compute_build_cache(self, plan: Dict) -> Dict:
+        """Compute content hashes of everything that determines the generated artifacts."""
+        scripts_dir = self.repo_root / "scripts"
+        builder_hashes = {}
+        # make-agent.py itself generates the agent definition
+        for script_name in BUILDER_SCRIPTS + SHARED_MODULES + ["make-agent.py"]:
+            script_path = scripts_dir / script_name
+            builder_hashes[script_name] = file_sha256(script_path) if script_path.exists() else None
+        
+        # Hash paths relative to the repo root so the cache key is the same on every machine
+        repo_root = self.repo_root.resolve()
+        plan_inputs = {}
+        for key, value in plan.items():
+            if key in VOLATILE_PLAN_KEYS or key == "repoRoot":
+                continue
+            if key.endswith("Path") and isinstance(value, str):
+                try:
+                    value = Path(value).resolve().relative_to(repo_root).as_posix()
+                except ValueError:
+                    pass  # Outside the repo: keep as is
+            plan_inputs[key] = value
+        plan_hash = hashlib.sha256(
+            json.dumps(plan_inputs, sort_keys=True, ensure_ascii=False).encode('utf-8')
+        ).hexdigest()
+        
+        return {
+            "charterHash": file_sha256(Path(plan["charterPath"])),
+            "builderHashes": builder_hashes,
+            "planHash": plan_hash
+        }
+    
+    def load_existing_plan(self, plan_path: Path) -> Optional[Dict]:
+        """Load a previously written build plan, if any."""
+        if not plan_path.exists():
+            return None
+        try:
+            with open(plan_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            self.log(f"Bestaand build plan onleesbaar, opnieuw bouwen: {e}", "WARNING")
+            return None
+    
+    def is_up_to_date(self, plan: Dict, existing_plan: Optional[Dict]) -> bool:
+        """Check whether the existing build matches the cache key and all artifacts exist."""
+        if self.force or not existing_plan:
+            return False
+        if existing_plan.get("buildCache") != plan["buildCache"]:
+            return False
+        artifact_keys = ["promptPath", "runnerPath", "orchestrationPath", "agentDefinitionPath"]
+        return all(Path(plan[key]).exists() for key in artifact_keys)
+    
     def write_plan_json(self, plan: Dict):
         """Write the build plan to a JSON file."""
         plan_path = Path(plan["buildPlanPath"])
@@ -248,8 +347,26 @@ class AgentMaker:
         
         self.log(f"Build plan geschreven naar: {plan_path}")
     
+    def run_builder(self, script_name: str):
+        """Run a builder in-process, or as subprocess when use_subprocess is set."""
+        if self.use_subprocess:
+            self.invoke_builder(script_name, self.plan["buildPlanPath"])
+            return
+        
+        script_path = self.repo_root / "scripts" / script_name
+        if not script_path.exists():
+            raise FileNotFoundError(f"Builder script ontbreekt: {script_path}")
+        
+        self.log(f"Aanroepen builder (in-process): {script_name}")
+        module = load_builder_module(script_path)
+        try:
+            module.build(self.plan)
+        except Exception as e:
+            self.log(f"Builder fout: {e}", "ERROR")
+            raise RuntimeError(f"Builder {script_name} gefaald: {e}") from e
+    
     def invoke_builder(self, script_name: str, plan_path: str):
-        """Invoke a builder script."""
+        """Invoke a builder script in a separate Python process."""
         scripts_dir = self.repo_root / "scripts"
         script_path = scripts_dir / script_name
         
@@ -296,12 +413,21 @@ class AgentMaker:
             
             # Create build plan
             self.plan = self.create_build_plan()
+            self.plan["buildCache"] = self.compute_build_cache(self.plan)
+            
+            existing_plan = self.load_existing_plan(Path(self.plan["buildPlanPath"]))
+            if self.is_up_to_date(self.plan, existing_plan):
+                # Keep the existing plan (and its generatedOn) so nothing is rewritten
+                self.plan = existing_plan
+                self.skipped = True
+                self.log(f"Agent ongewijzigd, build overgeslagen: {self.plan['agentId']} (gebruik --force om te forceren)", "SUCCESS")
+                return 0
+            
             self.write_plan_json(self.plan)
             
             # Invoke builders
-            self.invoke_builder("prompt-builder.py", self.plan["buildPlanPath"])
-            self.invoke_builder("runner-builder.py", self.plan["buildPlanPath"])
-            self.invoke_builder("orchestration-builder.py", self.plan["buildPlanPath"])
+            for script_name in BUILDER_SCRIPTS:
+                self.run_builder(script_name)
             
             # Generate agent definition
             self.generate_agent_definition()
@@ -361,6 +487,78 @@ Activeer via:
             f.write(content)
         
         self.log(f"Agent definitie geschreven: {agent_def_path.relative_to(self.repo_root)}")
+
+
+def list_charter_agents(repo_root: Path) -> List[str]:
+    """List all agent names that have a charter in governance/agent-charters/."""
+    charters_path = repo_root / "governance" / "agent-charters"
+    if not charters_path.exists():
+        raise FileNotFoundError(f"Charter directory niet gevonden: {charters_path}")
+    
+    return AgentIndex(repo_root).names(with_charter=True)
+
+
+def build_agent_worker(agent_name: str, repo_root: str, use_subprocess: bool,
+                       force: bool = False) -> Dict:
+    """Build one agent in a pool worker; console output is captured and returned."""
+    output = io.StringIO()
+    result = {"agent": agent_name, "success": False, "skipped": False, "error": None}
+    with redirect_stdout(output):
+        try:
+            maker = AgentMaker(agent_name=agent_name, repo_root=repo_root,
+                               use_subprocess=use_subprocess, force=force)
+            result["success"] = maker.run() == 0
+            result["skipped"] = maker.skipped
+        except Exception as e:
+            result["error"] = str(e)
+    result["output"] = output.getvalue()
+    return result
+
+
+def build_agents(agent_names: List[str], repo_root: Path, jobs: Optional[int],
+                 use_subprocess: bool, force: bool = False) -> int:
+    """Build several agents concurrently on a process pool and report per agent."""
+    failed = []
+    skipped = []
+    print(f"[INFO] Bouwen van {len(agent_names)} agent(s) met {jobs or os.cpu_count()} worker(s)")
+    
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {
+            pool.submit(build_agent_worker, name, str(repo_root), use_subprocess, force): name
+            for name in agent_names
+        }
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                # Worker process itself crashed
+                result = {"agent": name, "success": False, "error": str(e), "output": ""}
+            
+            print(f"===== {name} =====")
+            if result["output"]:
+                print(result["output"].rstrip())
+            if not result["success"]:
+                failed.append(name)
+            elif result.get("skipped"):
+                skipped.append(name)
+    
+    print("")
+    print("Samenvatting:")
+    for name in agent_names:
+        if name in failed:
+            status = "FAILED"
+        elif name in skipped:
+            status = "UNCHANGED"
+        else:
+            status = "OK"
+        print(f"  [{status}] {name}")
+    print(f"Gebouwd: {len(agent_names) - len(failed) - len(skipped)}, "
+          f"ongewijzigd: {len(skipped)}, gefaald: {len(failed)} (totaal {len(agent_names)})")
+    
+    return 1 if failed else 0
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -368,11 +566,30 @@ def main():
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
     
-    parser.add_argument("--agent-name", required=True, help="De naam van de agent (bv. 'founding-hypothesis-owner').")
+    selection = parser.add_mutually_exclusive_group(required=True)
+    selection.add_argument("--agent-name", help="De naam van de agent (bv. 'founding-hypothesis-owner').")
+    selection.add_argument("--agents", nargs='+', help="Bouw meerdere agents parallel.")
+    selection.add_argument("--all", action="store_true",
+                           help="Bouw alle agents met een charter in governance/agent-charters/.")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="Aantal parallelle workers voor --agents/--all (default: aantal CPU's).")
+    parser.add_argument("--subprocess", action="store_true",
+                        help="Draai elke builder in een eigen Python proces (isolatie) i.p.v. in-process.")
+    parser.add_argument("--force", action="store_true",
+                        help="Negeer de build cache en genereer alle artefacten opnieuw.")
     
     args = parser.parse_args()
     
-    maker = AgentMaker(agent_name=args.agent_name)
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs moet minimaal 1 zijn")
+    
+    if args.all or args.agents:
+        repo_root = Path.cwd()
+        agent_names = list_charter_agents(repo_root) if args.all else args.agents
+        return build_agents(agent_names, repo_root, args.jobs, args.subprocess, args.force)
+    
+    maker = AgentMaker(agent_name=args.agent_name, use_subprocess=args.subprocess,
+                       force=args.force)
     
     return maker.run()
 
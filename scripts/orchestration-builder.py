@@ -16,7 +16,8 @@ import json
 import sys
 from pathlib import Path
 from datetime import datetime
-import yaml
+
+from yaml_utils import dump
 
 
 def log(message: str, prefix: str = "INFO"):
@@ -107,7 +108,20 @@ def write_orchestration(orch_path: Path, content: dict):
     orch_path.parent.mkdir(parents=True, exist_ok=True)
     
     with open(orch_path, 'w', encoding='utf-8') as f:
-        yaml.dump(content, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+        dump(content, f)
+
+
+def build(plan: dict) -> Path:
+    """Build the orchestration for an already loaded build plan (in-process API)."""
+    log("Genereren orchestration configuratie...")
+    orch_config = generate_orchestration(plan)
+    
+    orch_path = Path(plan['orchestrationPath'])
+    log(f"Schrijven orchestration: {orch_path}")
+    write_orchestration(orch_path, orch_config)
+    
+    log(f"Orchestration builder voltooid voor: {plan['agentName']}", "SUCCESS")
+    return orch_path
 
 
 def main():
@@ -122,15 +136,7 @@ def main():
         log(f"Laden build plan: {plan_path}")
         
         plan = load_plan(plan_path)
-        
-        log("Genereren orchestration configuratie...")
-        orch_config = generate_orchestration(plan)
-        
-        orch_path = Path(plan['orchestrationPath'])
-        log(f"Schrijven orchestration: {orch_path}")
-        write_orchestration(orch_path, orch_config)
-        
-        log(f"Orchestration builder voltooid voor: {plan['agentName']}", "SUCCESS")
+        build(plan)
         return 0
         
     except Exception as e:
@@ -9,21 +9,46 @@ GEBRUIK:
   python scripts/pipeline-builder.py --agent-name "founding-hypothesis-owner" --platforms github-actions,gitlab-ci
   python scripts/pipeline-builder.py --regenerate-all --platforms github-actions,gitlab-ci
 
+DEFINITIES:
+  Een definitie heeft óf 'steps' (één job), óf 'jobs' met per job 'needs', 'steps'
+  en optioneel 'artifacts' (name/path). 'setup' stappen (checkout, python,
+  dependencies) draaien aan het begin van elke job. Jobs zonder onderlinge needs
+  draaien parallel; een job krijgt de artifacts van zijn needs terug op hetzelfde
+  pad. 'cache' regelt de pip cache (default gesleuteld op requirements.txt;
+  'cache: false' zet hem uit).
+  GitLab CI: elke job krijgt een stage naar zijn diepte in de needs-graaf
+  (agent-1, agent-2, ...) en 'needs' voor DAG uitvoering; de pip cache is een
+  'cache:' blok met key op de dependency bestanden.
+
+Bij --regenerate-all wordt elke definitie één keer geparsed; de vertaling per
+definitie × platform loopt parallel in een process pool (--workers). Output
+bestanden worden atomair geschreven (temp bestand + rename), en alleen als de
+inhoud (SHA-256) echt veranderd is. De YAML output (yaml_utils.dump) is
+byte-stabiel: vaste sleutelvolgorde, UTF-8 en '\n' regeleinden op elk platform.
+
 Agent: pipeline-builder (u94)
 Versie: 1.0
 Datum: 09-01-2026
 """
 
 import argparse
+import hashlib
+import os
 import sys
-from pathlib import Path
-from typing import Dict, List
-import yaml
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path, PurePosixPath
+from typing import Dict, List, Optional, Tuple
+
+from yaml_utils import YAMLError, dump, load_file
 
 
 class PipelineGenerator:
     """Base class voor platform-specifieke pipeline generators."""
     
+    # Job name for definitions without 'jobs' (one job with all steps)
+    DEFAULT_JOB = 'run-agent'
+    
     def translate(self, definition: Dict) -> str:
         """Vertaal platform-agnostische definitie naar platform-specifiek."""
         raise NotImplementedError("Subclasses moeten translate() implementeren")
@@ -36,41 +61,153 @@ class PipelineGenerator:
             if action == 'run':
                 script_lines.extend(step.get('command', '').strip().split('\n'))
         return script_lines
+    
+    def _jobs(self, definition: Dict) -> List[Tuple[str, Dict]]:
+        """
+        Jobs van de definitie in topologische volgorde (needs eerst).
+        
+        Elke job heeft 'needs', 'setup' (de gedeelde 'setup' stappen van de definitie,
+        die elke job opnieuw uitvoert), 'steps' en optioneel 'artifacts'. Een definitie
+        met alleen 'steps' is één job (DEFAULT_JOB).
+        """
+        if 'jobs' not in definition:
+            return [(self.DEFAULT_JOB, {'needs': [], 'setup': [], 'steps': definition.get('steps', [])})]
+        
+        setup = list(definition.get('setup') or [])
+        jobs = {}
+        for job_id, job in (definition.get('jobs') or {}).items():
+            job = dict(job or {})
+            job['needs'] = list(job.get('needs') or [])
+            job['setup'] = setup
+            job['steps'] = list(job.get('steps') or [])
+            jobs[job_id] = job
+        
+        for job_id, job in jobs.items():
+            unknown = [need for need in job['needs'] if need not in jobs]
+            if unknown:
+                raise ValueError(f"Job '{job_id}' heeft onbekende needs: {', '.join(unknown)}")
+        
+        ordered: List[Tuple[str, Dict]] = []
+        done = set()
+        while len(ordered) < len(jobs):
+            ready = [job_id for job_id, job in jobs.items()
+                     if job_id not in done and all(need in done for need in job['needs'])]
+            if not ready:
+                raise ValueError(f"Cyclische needs tussen jobs: {', '.join(j for j in jobs if j not in done)}")
+            for job_id in ready:
+                ordered.append((job_id, jobs[job_id]))
+                done.add(job_id)
+        return ordered
+    
+    def _cache_key_files(self, definition: Dict) -> List[str]:
+        """
+        Bestanden waarop de dependency cache gesleuteld wordt; leeg als caching uit staat.
+        
+        'cache: false' zet caching uit; 'cache: {key-files: [...]}' kiest andere bestanden
+        (voor GitLab CI maximaal twee).
+        """
+        cache = definition.get('cache', {})
+        if cache is False or (isinstance(cache, dict) and cache.get('pip') is False):
+            return []
+        if isinstance(cache, dict) and cache.get('key-files'):
+            return list(cache['key-files'])
+        return ['requirements.txt']
+    
+    def _artifact_dir(self, path: str) -> str:
+        """Directory waarin een artifact teruggezet wordt: het pad zelf of de parent van een bestand."""
+        if path.endswith('/'):
+            return path
+        parent = str(PurePosixPath(path).parent)
+        return '.' if parent == '' else parent
 
 
 class GitHubActionsGenerator(PipelineGenerator):
     """Genereert een GitHub Actions workflow."""
     
+    def _translate_step(self, step: Dict, cache_key_files: List[str]) -> Optional[Dict]:
+        """Vertaal één platform-agnostische stap naar een GitHub Actions step."""
+        action = step.get('action')
+        step_id = step.get('id')
+        
+        if action == 'checkout':
+            return {
+                'name': step_id,
+                'uses': 'actions/checkout@v4'
+            }
+        elif action == 'setup-python':
+            with_config = dict(step.get('with') or {})
+            if cache_key_files:
+                # Built-in pip cache of setup-python, keyed on the dependency files
+                with_config.setdefault('cache', 'pip')
+                with_config.setdefault('cache-dependency-path', '\n'.join(cache_key_files))
+            return {
+                'name': step_id,
+                'uses': 'actions/setup-python@v5',
+                'with': with_config
+            }
+        elif action == 'run':
+            return {
+                'name': step_id,
+                'run': step.get('command')
+            }
+        elif action == 'upload-artifact':
+            return {
+                'name': step_id,
+                'uses': 'actions/upload-artifact@v4',
+                'with': step.get('with')
+            }
+        return None
+    
+    def _translate_steps(self, steps: List[Dict], cache_key_files: List[str]) -> List[Dict]:
+        """Vertaal stappen; onbekende acties vallen weg."""
+        translated = [self._translate_step(step, cache_key_files) for step in steps]
+        return [step for step in translated if step]
+    
+    def _job_steps(self, job: Dict, jobs: Dict[str, Dict], cache_key_files: List[str]) -> List[Dict]:
+        """Steps van één job, met download van de artifacts van zijn needs en upload van die van hemzelf."""
+        # Artifacts of the needed jobs, after checkout (which cleans the workspace)
+        downloads = []
+        for need in job['needs']:
+            artifact = jobs[need].get('artifacts')
+            if artifact:
+                downloads.append({
+                    'name': f"download-{artifact['name']}",
+                    'uses': 'actions/download-artifact@v4',
+                    'with': {
+                        'name': artifact['name'],
+                        'path': self._artifact_dir(artifact['path'])
+                    }
+                })
+        steps = (self._translate_steps(job['setup'], cache_key_files) + downloads
+                 + self._translate_steps(job['steps'], cache_key_files))
+        
+        artifact = job.get('artifacts')
+        if artifact:
+            steps.append({
+                'name': f"upload-{artifact['name']}",
+                'uses': 'actions/upload-artifact@v4',
+                'with': {
+                    'name': artifact['name'],
+                    'path': artifact['path']
+                }
+            })
+        return steps
+    
     def translate(self, definition: Dict) -> str:
         """Generate GitHub Actions YAML."""
-        steps = []
+        cache_key_files = self._cache_key_files(definition)
+        runner = definition.get('environment', {}).get('runner', 'ubuntu-latest')
         
-        for step in definition.get('steps', []):
-            action = step.get('action')
-            step_id = step.get('id')
-            
-            if action == 'checkout':
-                steps.append({
-                    'name': step_id,
-                    'uses': 'actions/checkout@v4'
-                })
-            elif action == 'setup-python':
-                steps.append({
-                    'name': step_id,
-                    'uses': 'actions/setup-python@v5',
-                    'with': step.get('with')
-                })
-            elif action == 'run':
-                steps.append({
-                    'name': step_id,
-                    'run': step.get('command')
-                })
-            elif action == 'upload-artifact':
-                steps.append({
-                    'name': step_id,
-                    'uses': 'actions/upload-artifact@v4',
-                    'with': step.get('with')
-                })
+        jobs = self._jobs(definition)
+        by_id = dict(jobs)
+        
+        workflow_jobs = {}
+        for job_id, job in jobs:
+            workflow_job = {'runs-on': runner}
+            if job['needs']:
+                workflow_job['needs'] = job['needs']
+            workflow_job['steps'] = self._job_steps(job, by_id, cache_key_files)
+            workflow_jobs[job_id] = workflow_job
 
         workflow = {
             'name': definition.get('name'),
@@ -79,19 +216,14 @@ class GitHubActionsGenerator(PipelineGenerator):
                     'inputs': definition.get('trigger', {}).get('inputs', {})
                 }
             },
-            'jobs': {
-                'run-agent': {
-                    'runs-on': definition.get('environment', {}).get('runner', 'ubuntu-latest'),
-                    'steps': steps
-                }
-            }
+            'jobs': workflow_jobs
         }
         
         # Add notifications if defined
         notifications = definition.get('notifications', {})
         if 'on-failure' in notifications and 'slack' in notifications['on-failure']:
             slack_config = notifications['on-failure']['slack']
-            workflow['jobs']['run-agent']['steps'].append({
+            notify_step = {
                 'name': 'Notify on Failure',
                 'if': 'failure()',
                 'uses': 'slackapi/slack-github-action@v1.25.0',
@@ -99,51 +231,115 @@ class GitHubActionsGenerator(PipelineGenerator):
                     'channel-id': slack_config.get('channel'),
                     'slack-message': slack_config.get('message')
                 }
-            })
+            }
+            if len(jobs) == 1:
+                workflow_jobs[jobs[0][0]]['steps'].append(notify_step)
+            else:
+                # One job that runs when any job failed
+                workflow_jobs['notify-failure'] = {
+                    'runs-on': runner,
+                    'needs': [job_id for job_id, _ in jobs],
+                    'if': 'failure()',
+                    'steps': [notify_step]
+                }
 
-        return yaml.dump(workflow, sort_keys=False, indent=2)
+        return dump(workflow)
 
 
 class GitLabCIGenerator(PipelineGenerator):
     """Genereert een GitLab CI pipeline."""
     
+    # Single-job pipelines keep their one 'agent' stage
+    DEFAULT_STAGE = 'agent'
+    PIP_CACHE_DIR = '.cache/pip'
+    # GitLab rejects cache:key:files with more entries
+    MAX_CACHE_KEY_FILES = 2
+    
+    def _stage_levels(self, jobs: List[Tuple[str, Dict]]) -> Dict[str, int]:
+        """Stage nummer per job: de lengte van het langste needs-pad ernaartoe."""
+        levels: Dict[str, int] = {}
+        for job_id, job in jobs:  # Topological order: needs come first
+            levels[job_id] = max((levels[need] + 1 for need in job['needs']), default=0)
+        return levels
+    
+    def _job_artifacts(self, job: Dict) -> Optional[Dict]:
+        """Artifacts van een job: 'artifacts' van de job, anders een upload-artifact stap."""
+        artifact = job.get('artifacts')
+        for step in job['steps']:
+            if step.get('action') == 'upload-artifact':
+                artifact = step.get('with', {})
+        if not artifact:
+            return None
+        return {
+            'name': artifact.get('name'),
+            'paths': [artifact.get('path')]
+        }
+    
     def translate(self, definition: Dict) -> str:
         """Generate GitLab CI YAML."""
-        script = self._steps_to_script(definition.get('steps', []))
+        jobs = self._jobs(definition)
+        multi_job = 'jobs' in definition
+        levels = self._stage_levels(jobs)
         
-        job_name = definition.get('name', 'agent-job').lower().replace(' ', '-')
+        if multi_job:
+            job_names = {job_id: job_id for job_id, _ in jobs}
+            stage_names = [f"{self.DEFAULT_STAGE}-{level + 1}" for level in range(max(levels.values(), default=0) + 1)]
+        else:
+            job_names = {jobs[0][0]: definition.get('name', 'agent-job').lower().replace(' ', '-')}
+            stage_names = [self.DEFAULT_STAGE]
         
-        pipeline = {
-            job_name: {
-                'stage': 'agent',
-                'image': f"python:{definition.get('environment', {}).get('python-version', '3.11')}",
-                'rules': [{'if': '$CI_PIPELINE_SOURCE == "web"'}],
-                'script': script
-            }
-        }
+        pipeline = {'stages': stage_names}
         
-        # Artifacts
-        for step in definition.get('steps', []):
-            if step.get('action') == 'upload-artifact':
-                pipeline[job_name]['artifacts'] = {
-                    'name': step.get('with', {}).get('name'),
-                    'paths': [step.get('with', {}).get('path')]
+        # pip cache shared by all jobs, keyed on the dependency files
+        cache_key_files = self._cache_key_files(definition)
+        if len(cache_key_files) > self.MAX_CACHE_KEY_FILES:
+            raise ValueError(f"GitLab CI staat maximaal {self.MAX_CACHE_KEY_FILES} cache key-files toe, "
+                             f"gekregen: {', '.join(cache_key_files)}")
+        if cache_key_files:
+            pipeline['variables'] = {'PIP_CACHE_DIR': f"$CI_PROJECT_DIR/{self.PIP_CACHE_DIR}"}
+            pipeline['default'] = {
+                'cache': {
+                    'key': {'files': cache_key_files},
+                    'paths': [f"{self.PIP_CACHE_DIR}/"]
                 }
+            }
         
-        # Notifications
         notifications = definition.get('notifications', {})
+        slack_config = None
         if 'on-failure' in notifications and 'slack' in notifications['on-failure']:
             slack_config = notifications['on-failure']['slack']
-            pipeline[job_name]['after_script'] = [
-                f"if [ $CI_JOB_STATUS == 'failed' ]; then "
-                f"apk add --no-cache curl; "
-                f"curl -X POST -H 'Content-type: application/json' "
-                f"--data '{{\"text\":\"{slack_config.get('message')}\"}}' "
-                f"$SLACK_WEBHOOK_URL; "
-                f"fi"
-            ]
+        
+        for job_id, job in jobs:
+            pipeline_job = {
+                'stage': stage_names[levels[job_id]],
+                'image': f"python:{definition.get('environment', {}).get('python-version', '3.11')}",
+            }
+            if multi_job:
+                # needs makes the pipeline a DAG: a job starts as soon as its needs are done
+                # (and gets their artifacts); [] starts it right away
+                pipeline_job['needs'] = [job_names[need] for need in job['needs']]
+            pipeline_job['rules'] = [{'if': '$CI_PIPELINE_SOURCE == "web"'}]
+            pipeline_job['script'] = self._steps_to_script(job['setup'] + job['steps'])
+            
+            # Artifacts
+            artifacts = self._job_artifacts(job)
+            if artifacts:
+                pipeline_job['artifacts'] = artifacts
+            
+            # Notifications
+            if slack_config:
+                pipeline_job['after_script'] = [
+                    f"if [ $CI_JOB_STATUS == 'failed' ]; then "
+                    f"apk add --no-cache curl; "
+                    f"curl -X POST -H 'Content-type: application/json' "
+                    f"--data '{{\"text\":\"{slack_config.get('message')}\"}}' "
+                    f"$SLACK_WEBHOOK_URL; "
+                    f"fi"
+                ]
+            
+            pipeline[job_names[job_id]] = pipeline_job
 
-        return yaml.dump(pipeline, sort_keys=False, indent=2)
+        return dump(pipeline)
 
 
 PLATFORM_GENERATORS = {
@@ -151,15 +347,28 @@ PLATFORM_GENERATORS = {
     'gitlab-ci': GitLabCIGenerator,
 }
 
+# Platform -> extension of the generated file
+PLATFORM_EXTENSIONS = {
+    'github-actions': 'workflow.yml',
+    'gitlab-ci': 'gitlab-ci.yml',
+}
+
+
+def translate_definition(platform: str, pipeline: Dict) -> str:
+    """Vertaal één geparsede definitie voor één platform (draait in een worker proces)."""
+    return PLATFORM_GENERATORS[platform]().translate(pipeline)
+
 
 class PipelineBuilder:
     """Bouwt platform-specifieke pipelines voor agents."""
     
-    def __init__(self, repo_root: Path = None):
+    def __init__(self, repo_root: Path = None, workers: Optional[int] = None):
         """Initialize the pipeline builder."""
         self.repo_root = repo_root or Path.cwd()
+        self.workers = workers or os.cpu_count() or 1
         self.definitions_dir = self.repo_root / 'agent-componenten' / 'pipelines' / 'definitions'
         self.output_dir = self.repo_root / 'agent-componenten' / 'pipelines' / 'generated'
+        self.counts = {'created': 0, 'updated': 0, 'unchanged': 0}
     
     def log(self, message: str, prefix: str = "INFO"):
         """Log a message with prefix."""
@@ -173,41 +382,119 @@ class PipelineBuilder:
         color = colors.get(prefix, "")
         print(f"{color}[{prefix}] {message}{reset}")
     
-    def generate_for_agent(self, agent_name: str, phase: str, platforms: List[str]):
-        """Genereert platform-specifieke pipelines voor een agent."""
-        definition_path = self.definitions_dir / f"{phase}.{agent_name}.pipeline.yml"
+    def load_definition(self, definition_path: Path) -> Optional[Dict]:
+        """Parse een pipeline definitie; None (met melding) als die geen 'pipeline' bevat."""
+        definition = load_file(definition_path)
         
-        if not definition_path.exists():
-            self.log(f"Geen pipeline definitie gevonden voor {agent_name} op {definition_path}", "WARNING")
-            return False
-
-        with open(definition_path, 'r', encoding='utf-8') as f:
-            definition = yaml.safe_load(f)
-
-        success = True
+        if not isinstance(definition, dict) or 'pipeline' not in definition:
+            self.log(f"Geen 'pipeline' sectie in {definition_path.name}", "ERROR")
+            return None
+        return definition
+    
+    def write_output(self, output_path: Path, content: str) -> str:
+        """
+        Schrijf een gegenereerd bestand, alleen als de inhoud veranderd is.
+        
+        Vergelijkt de SHA-256 met het bestand op schijf; schrijft atomair (temp bestand
+        in dezelfde directory + rename) en in binary mode, zodat regeleinden niet per
+        platform verschillen. Geeft 'created', 'updated' of 'unchanged' terug.
+        """
+        data = content.encode('utf-8')
+        if output_path.exists():
+            if hashlib.sha256(output_path.read_bytes()).digest() == hashlib.sha256(data).digest():
+                return 'unchanged'
+            status = 'updated'
+        else:
+            status = 'created'
+        
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=str(output_path.parent), prefix=f".{output_path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_name, output_path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+        return status
+    
+    def generate(self, definitions: List[Tuple[str, str, Dict]], platforms: List[str]) -> Dict[Tuple[str, str], bool]:
+        """
+        Genereer pipelines voor (agent_name, phase, definition) × platforms.
+        
+        De vertalingen lopen parallel in een process pool; het schrijven gebeurt in
+        dit proces. Geeft per (agent_name, phase) terug of alle platforms gelukt zijn.
+        """
+        results = {(agent_name, phase): True for agent_name, phase, _ in definitions}
+        
+        valid_platforms = []
         for platform in platforms:
             if platform not in PLATFORM_GENERATORS:
                 self.log(f"Geen generator voor platform '{platform}'. Overgeslagen.", "WARNING")
-                continue
-            
+            else:
+                valid_platforms.append(platform)
+        
+        tasks = [(agent_name, phase, platform, definition['pipeline'])
+                 for agent_name, phase, definition in definitions
+                 for platform in valid_platforms]
+        
+        def handle(agent_name: str, phase: str, platform: str, translate):
             try:
-                generator = PLATFORM_GENERATORS[platform]()
-                platform_yaml = generator.translate(definition['pipeline'])
-                
-                ext = 'workflow.yml' if platform == 'github-actions' else 'gitlab-ci.yml'
-                output_path = self.output_dir / platform / f"{phase}.{agent_name}.{ext}"
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-                
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    f.write(platform_yaml)
-                
-                self.log(f"Generated {platform} pipeline: {output_path.relative_to(self.repo_root)}", "SUCCESS")
+                platform_yaml = translate()
+                output_path = self.output_dir / platform / f"{phase}.{agent_name}.{PLATFORM_EXTENSIONS[platform]}"
+                status = self.write_output(output_path, platform_yaml)
+                self.counts[status] += 1
+                if status == 'unchanged':
+                    self.log(f"Unchanged {platform} pipeline: {output_path.relative_to(self.repo_root)}")
+                else:
+                    label = "Generated" if status == 'created' else "Updated"
+                    self.log(f"{label} {platform} pipeline: {output_path.relative_to(self.repo_root)}", "SUCCESS")
             except Exception as e:
                 self.log(f"Fout bij genereren {platform} pipeline voor {agent_name}: {e}", "ERROR")
-                success = False
+                results[(agent_name, phase)] = False
+        
+        workers = min(self.workers, len(tasks))
+        pool = None
+        if workers > 1:
+            try:
+                pool = ProcessPoolExecutor(max_workers=workers)
+            except (OSError, NotImplementedError) as e:
+                self.log(f"Process pool niet beschikbaar, sequentieel genereren: {e}", "WARNING")
+        
+        if pool is None:
+            for agent_name, phase, platform, pipeline in tasks:
+                handle(agent_name, phase, platform, lambda: translate_definition(platform, pipeline))
+            return results
         
+        with pool:
+            futures = {pool.submit(translate_definition, platform, pipeline): (agent_name, phase, platform)
+                       for agent_name, phase, platform, pipeline in tasks}
+            for future in as_completed(futures):
+                agent_name, phase, platform = futures[future]
+                handle(agent_name, phase, platform, future.result)
+        return results
+    
+    def generate_for_agent(self, agent_name: str, phase: str, platforms: List[str]):
+        """Genereert platform-specifieke pipelines voor een agent."""
+        definition_path = self.definitions_dir / f"{phase}.{agent_name}.pipeline.yml"
+        
+        if not definition_path.exists():
+            self.log(f"Geen pipeline definitie gevonden voor {agent_name} op {definition_path}", "WARNING")
+            return False
+        
+        definition = self.load_definition(definition_path)
+        if definition is None:
+            return False
+        
+        success = self.generate([(agent_name, phase, definition)], platforms)[(agent_name, phase)]
+        self.log_counts()
         return success
     
+    def log_counts(self):
+        """Log hoeveel bestanden nieuw, bijgewerkt en ongewijzigd zijn."""
+        self.log(f"Bestanden: {self.counts['created']} nieuw, {self.counts['updated']} bijgewerkt, "
+                 f"{self.counts['unchanged']} ongewijzigd")
+    
     def regenerate_all(self, platforms: List[str]):
         """Regenereert alle pipelines voor de opgegeven platforms."""
         if not self.definitions_dir.exists():
@@ -222,7 +509,8 @@ class PipelineBuilder:
         
         self.log(f"Gevonden {len(definition_files)} pipeline definitie(s)", "INFO")
         
-        success_count = 0
+        # Parse every definition once; generation then fans out over definitions × platforms
+        definitions = []
         for definition_file in definition_files:
             # Parse filename: <phase>.<name>.pipeline.yml
             parts = definition_file.stem.split('.')
@@ -234,10 +522,19 @@ class PipelineBuilder:
             # Handle names with dots (e.g., d1.service-architect)
             agent_name = '.'.join(parts[1:-1])  # Everything between phase and 'pipeline'
             
-            if self.generate_for_agent(agent_name, phase, platforms):
-                success_count += 1
+            try:
+                definition = self.load_definition(definition_file)
+            except (OSError, YAMLError) as e:
+                self.log(f"Fout bij lezen {definition_file.name}: {e}", "ERROR")
+                continue
+            if definition is not None:
+                definitions.append((agent_name, phase, definition))
+        
+        results = self.generate(definitions, platforms)
+        success_count = sum(1 for ok in results.values() if ok)
         
         self.log(f"Succesvol {success_count}/{len(definition_files)} pipeline(s) gegenereerd", "SUCCESS")
+        self.log_counts()
         return success_count == len(definition_files)
 
 
@@ -279,6 +576,11 @@ Voorbeelden:
         type=Path,
         help="Root directory van de repository (default: current directory)"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Aantal worker processen voor het genereren (default: aantal CPU's)"
+    )
     
     args = parser.parse_args()
     
@@ -286,7 +588,7 @@ Voorbeelden:
     platforms_list = [p.strip() for p in args.platforms.split(',')]
     
     # Initialize builder
-    builder = PipelineBuilder(repo_root=args.repo_root)
+    builder = PipelineBuilder(repo_root=args.repo_root, workers=args.workers)
     
     # Regenerate all or single agent
     if args.regenerate_all:
@@ -17,6 +17,8 @@ import sys
 from pathlib import Path
 from datetime import datetime
 
+from charter_parser import parse_charter
+
 
 def log(message: str, prefix: str = "INFO"):
     """Log a message with prefix."""
@@ -41,12 +43,8 @@ def load_plan(plan_path: Path) -> dict:
 
 
 def read_charter(charter_path: Path) -> str:
-    """Read the charter content."""
-    if not charter_path.exists():
-        raise FileNotFoundError(f"Charter niet gevonden: {charter_path}")
-    
-    with open(charter_path, 'r', encoding='utf-8') as f:
-        return f.read()
+    """Read the charter content (parsed once per process via charter_parser)."""
+    return parse_charter(charter_path).text
 
 
 def generate_prompt(plan: dict, charter_content: str) -> str:
@@ -65,48 +63,6 @@ Charter: {charter_url}
     return prompt
 
 
-def _extract_charter_sections(charter: str) -> dict:
-    """Extract key sections from charter markdown."""
-    sections = {}
-    lines = charter.split('\n')
-    current_section = None
-    current_content = []
-    
-    for line in lines:
-        # Detect section headers (## heading)
-        if line.startswith('## '):
-            # Save previous section
-            if current_section:
-                sections[current_section] = '\n'.join(current_content).strip()
-            
-            # Start new section
-            header = line[3:].strip().lower()
-            if 'doel' in header:
-                current_section = 'doel'
-            elif 'scope' in header:
-                current_section = 'scope'
-            elif 'input' in header:
-                current_section = 'input'
-            elif 'output' in header:
-                current_section = 'output'
-            elif 'werkwijze' in header or 'werking' in header:
-                current_section = 'werkwijze'
-            elif 'bevoegdheid' in header:
-                current_section = 'bevoegdheden'
-            else:
-                current_section = None
-            
-            current_content = []
-        elif current_section:
-            current_content.append(line)
-    
-    # Save last section
-    if current_section:
-        sections[current_section] = '\n'.join(current_content).strip()
-    
-    return sections
-
-
 def write_prompt(prompt_path: Path, content: str):
     """Write the prompt file."""
     prompt_path.parent.mkdir(parents=True, exist_ok=True)
@@ -115,6 +71,24 @@ def write_prompt(prompt_path: Path, content: str):
         f.write(content)
 
 
+def build(plan: dict) -> Path:
+    """Build the prompt for an already loaded build plan (in-process API)."""
+    charter_path = Path(plan['charterPath'])
+    
+    log(f"Lezen charter: {charter_path}")
+    charter_content = read_charter(charter_path)
+    
+    log("Genereren prompt...")
+    prompt_content = generate_prompt(plan, charter_content)
+    
+    prompt_path = Path(plan['promptPath'])
+    log(f"Schrijven prompt: {prompt_path}")
+    write_prompt(prompt_path, prompt_content)
+    
+    log(f"Prompt builder voltooid voor: {plan['agentName']}", "SUCCESS")
+    return prompt_path
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(description='Builder voor agent prompt bestanden')
@@ -127,19 +101,7 @@ def main():
         log(f"Laden build plan: {plan_path}")
         
         plan = load_plan(plan_path)
-        charter_path = Path(plan['charterPath'])
-        
-        log(f"Lezen charter: {charter_path}")
-        charter_content = read_charter(charter_path)
-        
-        log("Genereren prompt...")
-        prompt_content = generate_prompt(plan, charter_content)
-        
-        prompt_path = Path(plan['promptPath'])
-        log(f"Schrijven prompt: {prompt_path}")
-        write_prompt(prompt_path, prompt_content)
-        
-        log(f"Prompt builder voltooid voor: {plan['agentName']}", "SUCCESS")
+        build(plan)
         return 0
         
     except Exception as e:
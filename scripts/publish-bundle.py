@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+publish-bundle.py
+
+Maakt een release bundle van deze repository voor distributie zonder git.
+
+De bundle is één gecomprimeerd archief (tar.gz of zip) met agent-componenten/,
+scripts/, .github/copilot/ en governance/agent-charters/ plus een manifest (bundle-manifest.json, altijd het
+eerste bestand in het archief) met per bestand de SHA-256 en grootte en per agent
+de bijbehorende componenten. Naast het archief komt een <archief>.sha256 bestand
+(sha256sum formaat) voor verificatie van het archief zelf.
+
+In een git repository bevat de bundle precies de getrackte bestanden van de huidige
+commit (git ls-files); bij niet-gecommitte of untracked bestanden in die paden
+weigert het script te publiceren.
+
+fetch-agents.py --bundle <pad of URL> leest de bundle als stream, haalt alleen de
+gevraagde agents eruit en controleert elk bestand tegen het manifest.
+
+GEBRUIK:
+  # Bundle in dist/ (naam op basis van de huidige commit)
+  python scripts/publish-bundle.py
+
+  # Zip formaat, andere output directory
+  python scripts/publish-bundle.py --format zip --output-dir /srv/releases
+
+Versie: 1.0
+Datum: 18-10-2026
+"""
+
+import argparse
+import io
+import json
+import os
+import subprocess
+import sys
+import tarfile
+import zipfile
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from agent_index import AgentIndex, INDEX_RELATIVE_PATH
+from hash_utils import file_sha256
+
+
+# Same paths as the sparse checkout of fetch-agents.py
+BUNDLE_PATHS = ["agent-componenten", "scripts", ".github/copilot", "governance/agent-charters"]
+
+MANIFEST_NAME = "bundle-manifest.json"
+MANIFEST_VERSION = 1
+
+# Never part of a bundle
+EXCLUDED_DIRS = {"__pycache__", ".pytest_cache", ".mypy_cache"}
+EXCLUDED_SUFFIXES = (".pyc", ".pyo", ".tmp")
+
+
+class BundlePublisher:
+    """Builds a release bundle with integrity manifest from the repository."""
+    
+    def __init__(self, repo_root: Path, output_dir: Path, archive_format: str = "tar.gz",
+                 name: Optional[str] = None):
+        """Initialize the publisher."""
+        self.repo_root = repo_root
+        self.output_dir = output_dir
+        self.archive_format = archive_format
+        self.name = name
+    
+    def log(self, message: str, prefix: str = "INFO"):
+        """Log a message with prefix."""
+        colors = {
+            "INFO": "\033[96m",
+            "SUCCESS": "\033[92m",
+            "WARNING": "\033[93m",
+            "ERROR": "\033[91m"
+        }
+        reset = "\033[0m"
+        color = colors.get(prefix, "")
+        print(f"{color}[{prefix}] {message}{reset}")
+    
+    def git_commit(self) -> Optional[str]:
+        """Current commit of the repository, or None outside git."""
+        try:
+            result = subprocess.run(["git", "rev-parse", "HEAD"], cwd=str(self.repo_root),
+                                    capture_output=True, text=True, check=True)
+        except (OSError, subprocess.CalledProcessError):
+            return None
+        return result.stdout.strip()
+    
+    def git_changes(self) -> List[str]:
+        """Uncommitted or untracked paths under BUNDLE_PATHS (git status --porcelain)."""
+        result = subprocess.run(["git", "status", "--porcelain", "--untracked-files=all", "--", *BUNDLE_PATHS],
+                                cwd=str(self.repo_root), capture_output=True, text=True, check=True)
+        return [line[3:] for line in result.stdout.splitlines() if line.strip()]
+    
+    def git_files(self) -> List[str]:
+        """Tracked files under BUNDLE_PATHS (git ls-files), sorted."""
+        result = subprocess.run(["git", "ls-files", "-z", "--", *BUNDLE_PATHS],
+                                cwd=str(self.repo_root), capture_output=True, text=True, check=True)
+        return sorted(path for path in result.stdout.split('\0') if path)
+    
+    def collect_files(self) -> List[str]:
+        """Repository-relative paths of all files in BUNDLE_PATHS outside git (directory walk), sorted."""
+        index_path = INDEX_RELATIVE_PATH.as_posix()
+        files = []
+        for rel_dir in BUNDLE_PATHS:
+            directory = self.repo_root / rel_dir
+            if not directory.is_dir():
+                self.log(f"Directory niet gevonden, overgeslagen: {rel_dir}", "WARNING")
+                continue
+            for root, dirnames, filenames in os.walk(directory):
+                dirnames[:] = sorted(d for d in dirnames if d not in EXCLUDED_DIRS)
+                for filename in filenames:
+                    if filename.endswith(EXCLUDED_SUFFIXES):
+                        continue
+                    rel_path = (Path(root) / filename).relative_to(self.repo_root).as_posix()
+                    if rel_path != index_path:  # Local, derived from directory mtimes
+                        files.append(rel_path)
+        return sorted(files)
+    
+    def agent_components(self, files: List[str]) -> Dict[str, List[str]]:
+        """Agent name -> bundled component paths (all platforms), from the agent index."""
+        bundled = set(files)
+        agents = {}
+        for name, entry in AgentIndex(self.repo_root, persist=False).data["agents"].items():
+            paths = [entry[kind] for kind in ('prompt', 'agent', 'runner', 'orchestration', 'buildplan')]
+            paths.extend(entry["pipelines"].values())
+            paths = sorted(path for path in paths if path in bundled)
+            if paths:
+                agents[name] = paths
+        return agents
+    
+    def build_manifest(self, files: List[str], commit: Optional[str]) -> Dict:
+        """Manifest with commit, per-agent components and SHA-256/size per file."""
+        return {
+            "version": MANIFEST_VERSION,
+            "created": datetime.now().isoformat(),
+            "commit": commit,
+            "agents": self.agent_components(files),
+            "files": {
+                rel_path: {
+                    "sha256": file_sha256(self.repo_root / rel_path),
+                    "size": (self.repo_root / rel_path).stat().st_size
+                }
+                for rel_path in files
+            }
+        }
+    
+    def write_tar(self, archive_path: Path, manifest_data: bytes, files: List[str]):
+        """Write a tar.gz with the manifest as first member, so readers can stream it."""
+        with tarfile.open(archive_path, "w:gz") as tar:
+            info = tarfile.TarInfo(MANIFEST_NAME)
+            info.size = len(manifest_data)
+            info.mtime = int(datetime.now().timestamp())
+            info.mode = 0o644
+            tar.addfile(info, io.BytesIO(manifest_data))
+            for rel_path in files:
+                tar.add(self.repo_root / rel_path, arcname=rel_path, recursive=False)
+    
+    def write_zip(self, archive_path: Path, manifest_data: bytes, files: List[str]):
+        """Write a zip with the manifest as first entry."""
+        with zipfile.ZipFile(archive_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr(MANIFEST_NAME, manifest_data)
+            for rel_path in files:
+                archive.write(self.repo_root / rel_path, arcname=rel_path)
+    
+    def run(self) -> int:
+        """Build the bundle and its checksum file."""
+        commit = self.git_commit()
+        if commit:
+            # The bundle is labelled with the commit, so it must contain exactly that commit
+            changes = self.git_changes()
+            if changes:
+                self.log(f"Niet-gecommitte wijzigingen in de bundle paden ({len(changes)}), bijvoorbeeld: "
+                         f"{', '.join(changes[:5])}", "ERROR")
+                self.log("Commit of verwijder ze eerst; de bundle moet overeenkomen met commit "
+                         f"{commit[:12]}", "ERROR")
+                return 1
+            files = self.git_files()
+        else:
+            self.log("Geen git repository; bundle zonder commit uit de working tree", "WARNING")
+            files = self.collect_files()
+        if not files:
+            self.log("Geen bestanden gevonden voor de bundle", "ERROR")
+            return 1
+        
+        name = self.name or f"agent-capabilities-{commit[:12] if commit else datetime.now().strftime('%Y%m%d%H%M%S')}"
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        archive_path = self.output_dir / f"{name}.{self.archive_format}"
+        
+        manifest = self.build_manifest(files, commit)
+        manifest_data = json.dumps(manifest, indent=2, ensure_ascii=False).encode('utf-8')
+        
+        # Write next to the final name and rename, so a half-written bundle is never published
+        tmp_path = archive_path.with_name(archive_path.name + ".tmp")
+        if self.archive_format == "zip":
+            self.write_zip(tmp_path, manifest_data, files)
+        else:
+            self.write_tar(tmp_path, manifest_data, files)
+        os.replace(tmp_path, archive_path)
+        
+        archive_hash = file_sha256(archive_path)
+        checksum_path = archive_path.with_name(archive_path.name + ".sha256")
+        checksum_path.write_text(f"{archive_hash}  {archive_path.name}\n", encoding='utf-8')
+        
+        self.log(f"Bundle: {archive_path}", "SUCCESS")
+        self.log(f"  Bestanden: {len(files)}, agents: {len(manifest['agents'])}")
+        self.log(f"  Grootte: {archive_path.stat().st_size / 1024:.1f} KB")
+        self.log(f"  Commit: {commit or 'onbekend'}")
+        self.log(f"  SHA-256: {archive_hash} ({checksum_path.name})")
+        return 0
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Maak een release bundle (tar.gz/zip met SHA-256 manifest) voor fetch-agents.py --bundle',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Voorbeelden:
+  # Bundle in dist/
+  python scripts/publish-bundle.py
+
+  # Zip formaat met vaste naam
+  python scripts/publish-bundle.py --format zip --name agent-capabilities-latest
+
+  # Ophalen in een workspace
+  python scripts/fetch-agents.py --bundle dist/agent-capabilities-<commit>.tar.gz
+        """
+    )
+    
+    parser.add_argument('--repo-root', type=Path, default=None,
+                        help='Root directory van de repository (default: parent van scripts/)')
+    
+    parser.add_argument('--output-dir', type=Path, default=None,
+                        help='Directory voor de bundle (default: <repo-root>/dist)')
+    
+    parser.add_argument('--format', choices=['tar.gz', 'zip'], default='tar.gz',
+                        help='Archief formaat (default: tar.gz)')
+    
+    parser.add_argument('--name', default=None,
+                        help='Bestandsnaam zonder extensie (default: agent-capabilities-<commit>)')
+    
+    args = parser.parse_args()
+    
+    repo_root = (args.repo_root or Path(__file__).resolve().parent.parent).resolve()
+    publisher = BundlePublisher(
+        repo_root,
+        output_dir=args.output_dir or repo_root / "dist",
+        archive_format=args.format,
+        name=args.name
+    )
+    return publisher.run()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
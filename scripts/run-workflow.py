@@ -2,39 +2,249 @@
 """
 run-workflow.py
 
-Orchestreert een workflow van meerdere agents in sequence.
+Orchestreert een workflow van meerdere agents als DAG.
 Met 1 commando een founding hypothesis schrijven en een CDM maken.
 
 GEBRUIK:
   python scripts/run-workflow.py --workflow hypothesis-to-cdm --input "Een platform voor online cursussen"
   python scripts/run-workflow.py --workflow hypothesis-to-cdm --input-file concept.txt --output-dir ./output
+  python scripts/run-workflow.py --workflow hypothesis-to-cdm --input "..." --no-cache
+  python scripts/run-workflow.py --workflow cdm-to-design --input-file cdm.md --max-workers 2
+  python scripts/run-workflow.py --resume hypothesis-to-cdm-20260109-101500
+  python scripts/run-workflow.py --workflow cdm-to-design --input-file cdm.md --executor worker
+  python scripts/run-workflow.py --workflow hypothesis-to-cdm --input-dir concepts/ --batch-workers 8
+  python scripts/run-workflow.py --workflow hypothesis-to-cdm --input-dir concepts/ --deadline 900
+
+Workflows worden gedeclareerd in agent-componenten/workflows/<naam>.workflow.yaml.
+Elke stap noemt een agent (<fase>.<naam>), zijn output bestand en optioneel de
+stappen waarvan hij afhangt (needs). Stappen zonder onderlinge afhankelijkheid
+draaien parallel, begrensd door --max-workers.
+
+Elke run schrijft een checkpoint manifest (workflow-checkpoint.json) met per stap
+de status en SHA-256 van input en output. --resume <workflow_id> hergebruikt de
+workflow directory en voert alleen gefaalde of ongeldig geworden stappen opnieuw uit.
+
+De uitvoering draait op één asyncio event loop: stappen zijn taken, runners
+async subprocessen, en semaphores begrenzen het aantal gelijktijdige runners
+(--max-workers) en workflows (--batch-workers). Annuleren (Ctrl+C, deadline)
+stopt lopende runners en markeert hun stappen als geannuleerd. De sync methoden
+(run_workflow, run_batch) zijn dunne wrappers rond de *_async varianten.
+
+Met --executor worker draaien stappen in persistente worker processen
+(runner-worker.py) die runners als module importeren, in plaats van per stap
+een nieuwe interpreter te starten. Een crashende runner blijft geïsoleerd.
+
+Runner output (stdout en stderr) wordt regel voor regel doorgestuurd zodra hij
+binnenkomt, met de stap als prefix. Output statistieken komen uit de resultaat
+metadata van de runner (--result-file), niet uit het opnieuw lezen van de output.
+
+Timeouts en retries worden per workflow (defaults) en per stap gedeclareerd:
+  defaults: {timeout: 300, retries: {max_attempts: 3, backoff_seconds: 5}}
+Een gefaalde of getimede poging wordt herhaald met exponentiële backoff met
+jitter. Een deadline (workflow 'deadline' of --deadline, in seconden per run)
+begrenst alle pogingen; daarna worden resterende stappen geannuleerd. Door de
+deadline gestopte stappen krijgen status 'cancelled' (error 'deadline'), worden
+nooit herhaald en staan apart in de samenvatting (steps_cancelled).
+
+workflow-summary.json bevat per stap metrics (wall time, CPU tijd en piek RSS van
+het runner proces, input/output bytes, cache hit/miss, exit code) en totalen
+per workflow. CPU en RSS komen uit de resultaat metadata van de runner; in
+worker mode meet de worker CPU tijd per job en zijn eigen piek RSS.
+
+Batch mode (--input-dir / --input-glob) voert de workflow uit voor elk input
+bestand, met maximaal --batch-workers workflows tegelijk en elk in een eigen
+workflow directory onder <output-dir>/<workflow>-batch-<timestamp>/. Het aantal
+gelijktijdig draaiende runners blijft begrensd door --max-workers.
+batch-summary.json bevat per item status, duur en output groottes.
 
 Workflow: hypothesis-to-cdm
   1. Founding Hypothesis Owner (a1) - schrijft founding hypothesis
   2. CDM Architect (b1) - maakt canonical data model op basis van hypothesis
 
+Runner resultaten worden gecached (zie agent_runtime.py); een herhaalde run met
+identieke input komt direct uit de cache. --no-cache slaat de cache over.
+
 Agent: workflow-orchestrator (u96)
-Versie: 1.0
-Datum: 09-01-2026
+Versie: 2.0
+Datum: 18-10-2026
 """
 
 import argparse
+import asyncio
+import glob
 import json
-import subprocess
+import itertools
+import os
+import random
+import re
 import sys
+import tempfile
+import time
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 
+from yaml_utils import load_file
+from hash_utils import file_sha256
+
+
+INITIAL_INPUT = "initial"
+CHECKPOINT_FILE = "workflow-checkpoint.json"
+BATCH_SUMMARY_FILE = "batch-summary.json"
+
+# Step execution policy; workflow 'defaults' and per-step keys override these
+DEFAULT_POLICY = {
+    "timeout": 300,            # Seconds per attempt
+    "max_attempts": 1,
+    "backoff_seconds": 5,      # Delay before the 2nd attempt; doubles per attempt
+    "max_backoff_seconds": 60,
+    "jitter": 0.5              # Fraction of the delay that is randomized
+}
+# Failures worth another attempt; a missing runner or a configuration error is not
+RETRYABLE_ERRORS = ("timeout", "exit_code", "missing_output")
+# Runner exit code for configuration errors (agent_runtime.EXIT_CONFIG_ERROR)
+EXIT_CONFIG_ERROR = 78
+# Error kind of steps stopped by the workflow deadline (status 'cancelled', never retried)
+DEADLINE_ERROR = "deadline"
+# Longest runner output line the stream readers accept
+STREAM_LINE_LIMIT = 2 ** 20
+
+
+async def read_line(stream: asyncio.StreamReader, stream_name: str) -> bytes:
+    """readline() that reports a line over STREAM_LINE_LIMIT clearly instead of asyncio's ValueError."""
+    try:
+        return await stream.readline()
+    except ValueError:
+        # LimitOverrunError: asyncio has already dropped the buffered part of the line
+        raise RuntimeError(
+            f"Runner output regel op {stream_name} is langer dan {STREAM_LINE_LIMIT // 1024} KB "
+            f"(STREAM_LINE_LIMIT); schrijf grote output naar het output bestand"
+        ) from None
+
+
+class RunnerWorker:
+    """Client for one persistent runner-worker.py process."""
+    
+    def __init__(self, process: asyncio.subprocess.Process):
+        """Wrap a started worker process."""
+        self.process = process
+        self.job_ids = itertools.count(1)
+    
+    @classmethod
+    async def start(cls, worker_script: Path) -> "RunnerWorker":
+        """Start a worker process."""
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, str(worker_script),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            limit=STREAM_LINE_LIMIT
+        )
+        return cls(process)
+    
+    def alive(self) -> bool:
+        """True while the worker process is running."""
+        return self.process.returncode is None
+    
+    async def run(self, runner_path: Path, argv: List[str], timeout: float,
+                  on_line: Callable[[str, str], None]) -> Tuple[int, Dict]:
+        """Run a runner in the worker, passing output lines to on_line; returns (exit code, usage)."""
+        job_id = next(self.job_ids)
+        job = {"id": job_id, "runner": str(runner_path), "argv": argv}
+        self.process.stdin.write((json.dumps(job) + "\n").encode('utf-8'))
+        await self.process.stdin.drain()
+        try:
+            return await asyncio.wait_for(self.collect(job_id, on_line), timeout)
+        except BaseException:
+            # Timeout, cancellation or unreadable output: the job cannot be interrupted
+            # inside the worker and its pipe state is unknown, so the worker is replaced
+            await self.kill()
+            raise
+    
+    async def collect(self, job_id: int, on_line: Callable[[str, str], None]) -> Tuple[int, Dict]:
+        """Forward output messages of a job until its result arrives."""
+        while True:
+            line = await read_line(self.process.stdout, "stdout")
+            if not line:
+                on_line(f"Worker proces beëindigd (exit code {await self.process.wait()})", "stderr")
+                return -1, {}
+            try:
+                message = json.loads(line)
+            except ValueError:
+                on_line(line.decode('utf-8', errors='replace').rstrip('\n'), "stdout")
+                continue
+            if message.get("type") == "output":
+                on_line(message.get("line", ""), "stdout")
+            elif message.get("type") == "result" and message.get("id") == job_id:
+                if message.get("error"):
+                    on_line(message["error"], "stderr")
+                return message.get("exit_code", 1), message.get("usage", {})
+    
+    async def kill(self):
+        """Terminate the worker process."""
+        if self.alive():
+            self.process.kill()
+        await self.process.wait()
+    
+    async def close(self):
+        """Let the worker finish by closing its stdin."""
+        try:
+            self.process.stdin.close()
+            await asyncio.wait_for(self.process.wait(), 10)
+        except (OSError, asyncio.TimeoutError):
+            await self.kill()
+
+
+class WorkerPool:
+    """Bounded pool of persistent runner workers, started on demand."""
+    
+    def __init__(self, worker_script: Path, size: int):
+        """Initialize an empty pool."""
+        self.worker_script = worker_script
+        self.size = size
+        self.idle = asyncio.Queue()
+        self.started = 0
+        self.workers = []
+    
+    async def acquire(self) -> RunnerWorker:
+        """Take an idle worker, starting a new one while below the pool size."""
+        if self.idle.empty() and self.started < self.size:
+            self.started += 1
+            worker = await RunnerWorker.start(self.worker_script)
+            self.workers.append(worker)
+            return worker
+        return await self.idle.get()
+    
+    async def release(self, worker: RunnerWorker):
+        """Return a worker; a crashed or killed worker is replaced by a fresh one."""
+        if not worker.alive():
+            worker = await RunnerWorker.start(self.worker_script)
+            self.workers.append(worker)
+        self.idle.put_nowait(worker)
+    
+    async def close(self):
+        """Stop all workers."""
+        await asyncio.gather(*(worker.close() for worker in self.workers if worker.alive()))
+
 
 class WorkflowOrchestrator:
     """Orchestreert workflows van meerdere agents."""
     
-    def __init__(self, repo_root: Path = None, output_dir: Path = None):
+    def __init__(self, repo_root: Path = None, output_dir: Path = None, use_cache: bool = True,
+                 max_workers: int = 4, executor: str = "subprocess", deadline: Optional[float] = None):
         """Initialize the workflow orchestrator."""
         self.repo_root = repo_root or Path.cwd()
+        self.use_cache = use_cache
+        self.max_workers = max_workers
+        self.executor = executor
+        # Seconds per workflow run; overrides the workflow's own 'deadline'
+        self.deadline = deadline
+        self.worker_pool = None
         self.output_dir = output_dir or (self.repo_root / "output" / "workflows")
         self.runners_dir = self.repo_root / "agent-componenten" / "runners"
+        self.workflows_dir = self.repo_root / "agent-componenten" / "workflows"
+        # Bounds concurrently executing runners across all workflows on the event loop;
+        # created on first use, inside the loop
+        self.runner_slots = None
     
     def log(self, message: str, prefix: str = "INFO"):
         """Log a message with prefix."""
@@ -48,150 +258,756 @@ class WorkflowOrchestrator:
         reset = "\033[0m"
         color = colors.get(prefix, "")
         timestamp = datetime.now().strftime("%H:%M:%S")
-        print(f"{color}[{timestamp}] [{prefix}] {message}{reset}")
+        print(f"{color}[{timestamp}] [{prefix}] {message}{reset}", flush=True)
     
-    def run_agent(self, agent_phase: str, agent_name: str, input_file: Path, 
-                  output_file: Path) -> bool:
-        """Run a single agent with input and capture output."""
+    def run(self, coroutine: Awaitable) -> bool:
+        """Run an orchestrator coroutine on a new event loop and stop the workers afterwards."""
+        async def main():
+            try:
+                return await coroutine
+            finally:
+                await self.close()
+        return asyncio.run(main())
+    
+    async def close(self):
+        """Stop persistent runner workers, if any were started."""
+        if self.worker_pool:
+            await self.worker_pool.close()
+            self.worker_pool = None
+        self.runner_slots = None
+    
+    async def execute_runner(self, runner_path: Path, argv: List[str], timeout: float,
+                             on_line: Callable[[str, str], None]) -> Tuple[int, Dict]:
+        """Execute a runner as subprocess or in a persistent worker, streaming its output; returns (exit code, usage)."""
+        if self.runner_slots is None:
+            self.runner_slots = asyncio.Semaphore(self.max_workers)
+        async with self.runner_slots:
+            if self.executor == "worker":
+                if self.worker_pool is None:
+                    worker_script = Path(__file__).resolve().parent / "runner-worker.py"
+                    self.worker_pool = WorkerPool(worker_script, self.max_workers)
+                worker = await self.worker_pool.acquire()
+                try:
+                    return await worker.run(runner_path, argv, timeout, on_line)
+                finally:
+                    await self.worker_pool.release(worker)
+            return await self.execute_subprocess(runner_path, argv, timeout, on_line)
+    
+    async def execute_subprocess(self, runner_path: Path, argv: List[str], timeout: float,
+                                 on_line: Callable[[str, str], None]) -> Tuple[int, Dict]:
+        """Run a runner as async subprocess; killed on timeout, cancellation or a reader error."""
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, str(runner_path), *argv,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            # Child output must reach us per line, not per pipe buffer
+            env={**os.environ, "PYTHONUNBUFFERED": "1"},
+            limit=STREAM_LINE_LIMIT
+        )
+        
+        async def forward(stream: asyncio.StreamReader, stream_name: str):
+            while True:
+                line = await read_line(stream, stream_name)
+                if not line:
+                    break
+                on_line(line.decode('utf-8', errors='replace').rstrip('\r\n'), stream_name)
+        
+        # Separate tasks: a failing gather() does not cancel its other children
+        tasks = [asyncio.ensure_future(forward(process.stdout, "stdout")),
+                 asyncio.ensure_future(forward(process.stderr, "stderr")),
+                 asyncio.ensure_future(process.wait())]
+        try:
+            await asyncio.wait_for(asyncio.gather(*tasks), timeout)
+        finally:
+            # Timeout, cancellation or a reader error: never leave the runner or its readers behind
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        # CPU time and peak RSS come from the runner's own result metadata
+        return process.returncode, {}
+    
+    def stream_printer(self, label: str) -> Callable[[str, str], None]:
+        """Line callback that prints runner output immediately, prefixed with the step label."""
+        def print_line(line: str, stream_name: str):
+            marker = "!" if stream_name == "stderr" else " "
+            print(f"  {marker}[{label}] {line}", flush=True)
+        return print_line
+    
+    def list_workflows(self) -> List[str]:
+        """Names of the workflows declared in agent-componenten/workflows/."""
+        if not self.workflows_dir.exists():
+            return []
+        return sorted(p.name[:-len(".workflow.yaml")] for p in self.workflows_dir.glob("*.workflow.yaml"))
+    
+    def load_workflow(self, workflow_name: str) -> Dict:
+        """Load and validate a workflow definition; steps get resolved inputs."""
+        workflow_path = self.workflows_dir / f"{workflow_name}.workflow.yaml"
+        if not workflow_path.exists():
+            raise FileNotFoundError(f"Workflow definitie niet gevonden: {workflow_path}")
+        
+        definition = (load_file(workflow_path) or {}).get('workflow')
+        
+        if not definition or not definition.get('steps'):
+            raise ValueError(f"Workflow '{workflow_name}' bevat geen steps: {workflow_path}")
+        
+        definition.setdefault('name', workflow_name)
+        defaults = self.resolve_policy(DEFAULT_POLICY, definition.get('defaults'), workflow_name)
+        if definition.get('deadline') is not None and float(definition['deadline']) <= 0:
+            raise ValueError(f"Workflow '{workflow_name}': deadline moet positief zijn")
+        step_ids = set()
+        for number, step in enumerate(definition['steps'], start=1):
+            for key in ('id', 'agent', 'output'):
+                if not step.get(key):
+                    raise ValueError(f"Stap {number} in workflow '{workflow_name}' mist '{key}'")
+            if step['id'] in step_ids or step['id'] == INITIAL_INPUT:
+                raise ValueError(f"Ongeldige of dubbele stap id '{step['id']}' in workflow '{workflow_name}'")
+            if '.' not in step['agent']:
+                raise ValueError(f"Agent '{step['agent']}' moet de vorm <fase>.<naam> hebben")
+            step_ids.add(step['id'])
+            step['number'] = number
+            step['phase'], step['agent_name'] = step['agent'].split('.', 1)
+            step['needs'] = list(step.get('needs') or [])
+            # Inputs: outputs of the needed steps, or the initial input for root steps
+            step['inputs'] = list(step.get('inputs') or step['needs'] or [INITIAL_INPUT])
+            step['policy'] = self.resolve_policy(defaults, step, f"{workflow_name}/{step['id']}")
+        
+        for step in definition['steps']:
+            for ref in step['needs'] + step['inputs']:
+                if ref != INITIAL_INPUT and ref not in step_ids:
+                    raise ValueError(f"Stap '{step['id']}' verwijst naar onbekende stap '{ref}'")
+            for ref in step['inputs']:
+                if ref != INITIAL_INPUT and ref not in step['needs']:
+                    # An input from another step is an implicit dependency
+                    step['needs'].append(ref)
+        
+        self.topological_order(definition['steps'])
+        return definition
+    
+    def resolve_policy(self, base: Dict, overrides: Optional[Dict], context: str) -> Dict:
+        """Merge timeout/retry settings over a base policy and validate them."""
+        policy = dict(base)
+        overrides = overrides or {}
+        retries = overrides.get('retries') or {}
+        if not isinstance(retries, dict):
+            raise ValueError(f"{context}: 'retries' moet een mapping zijn")
+        if overrides.get('timeout') is not None:
+            policy['timeout'] = overrides['timeout']
+        for key in ('max_attempts', 'backoff_seconds', 'max_backoff_seconds', 'jitter'):
+            if retries.get(key) is not None:
+                policy[key] = retries[key]
+        
+        try:
+            policy['timeout'] = float(policy['timeout'])
+            policy['max_attempts'] = int(policy['max_attempts'])
+            for key in ('backoff_seconds', 'max_backoff_seconds', 'jitter'):
+                policy[key] = float(policy[key])
+        except (TypeError, ValueError):
+            raise ValueError(f"{context}: timeout en retries moeten numeriek zijn")
+        if policy['timeout'] <= 0 or policy['max_attempts'] < 1 or not 0 <= policy['jitter'] <= 1:
+            raise ValueError(f"{context}: timeout > 0, max_attempts >= 1 en 0 <= jitter <= 1 vereist")
+        return policy
+    
+    def backoff_delay(self, policy: Dict, attempt: int) -> float:
+        """Exponential backoff with jitter before attempt number attempt + 1."""
+        delay = min(policy['max_backoff_seconds'], policy['backoff_seconds'] * 2 ** (attempt - 1))
+        return delay * (1 - policy['jitter'] * random.random())
+    
+    def remaining_time(self, run: Dict) -> Optional[float]:
+        """Seconds left until the workflow deadline; None without a deadline."""
+        if run.get('deadline') is None:
+            return None
+        return run['deadline'] - time.monotonic()
+    
+    def topological_order(self, steps: List[Dict]) -> List[str]:
+        """Return step ids in dependency order; raises ValueError on a cycle."""
+        remaining = {step['id']: set(step['needs']) for step in steps}
+        order = []
+        while remaining:
+            ready = [step_id for step_id, needs in remaining.items() if not needs]
+            if not ready:
+                raise ValueError(f"Cyclische afhankelijkheid tussen stappen: {', '.join(sorted(remaining))}")
+            for step_id in ready:
+                order.append(step_id)
+                del remaining[step_id]
+            for needs in remaining.values():
+                needs.difference_update(ready)
+        return order
+    
+    async def run_agent(self, agent_phase: str, agent_name: str, input_files: List[Path],
+                        output_file: Path, label: Optional[str] = None,
+                        metrics: Optional[Dict] = None, timeout: float = DEFAULT_POLICY["timeout"]) -> bool:
+        """Run a single agent with input, streaming its output; fills metrics when given."""
+        metrics = metrics if metrics is not None else {}
+        metrics.update({
+            "error": None,
+            "exit_code": None,
+            "wall_seconds": None,
+            "cpu_seconds": None,
+            "peak_rss_kb": None,
+            "input_bytes": sum(f.stat().st_size for f in input_files if f.exists()),
+            "output_bytes": None,
+            "cache": None
+        })
         runner_file = f"{agent_phase}.{agent_name}.py"
         runner_path = self.runners_dir / runner_file
         
         if not runner_path.exists():
             self.log(f"Runner niet gevonden: {runner_path}", "ERROR")
+            metrics["error"] = "runner_not_found"
             return False
         
         self.log(f"Uitvoeren: {agent_name}", "STEP")
-        self.log(f"  Input:  {input_file.name}", "INFO")
+        self.log(f"  Input:  {', '.join(f.name for f in input_files)}", "INFO")
         self.log(f"  Output: {output_file.name}", "INFO")
         
+        argv = ["--input-files", *[str(f) for f in input_files],
+                "--output-file", str(output_file)]
+        
+        # --no-cache and --result-file only exist in runners built on agent_runtime;
+        # older runners would exit with an argparse error (and be retried)
+        uses_runtime = self.runner_uses_runtime(runner_path)
+        if not self.use_cache and uses_runtime:
+            argv.append("--no-cache")
+        
+        result_path = None
+        if uses_runtime:
+            fd, result_name = tempfile.mkstemp(prefix=f".{output_file.stem}.", suffix=".result.json",
+                                               dir=str(output_file.parent))
+            os.close(fd)
+            result_path = Path(result_name)
+            argv.extend(["--result-file", str(result_path)])
+        
+        started = time.perf_counter()
         try:
-            # Run agent runner with input file
-            result = subprocess.run(
-                [sys.executable, str(runner_path), 
-                 "--input-files", str(input_file),
-                 "--output-file", str(output_file)],
-                capture_output=True,
-                text=True,
-                timeout=300  # 5 minutes timeout
+            # Run agent runner; stdout/stderr are printed line by line while it runs
+            returncode, usage = await self.execute_runner(
+                runner_path, argv,
+                timeout=timeout,
+                on_line=self.stream_printer(label or agent_name)
             )
+            metrics["wall_seconds"] = round(time.perf_counter() - started, 3)
+            metrics["exit_code"] = returncode
+            metrics.update(usage)
             
-            # Always log stdout/stderr for debugging
-            if result.stdout:
-                print(result.stdout)
-            
-            if result.returncode != 0:
-                self.log(f"Agent gefaald met exit code {result.returncode}", "ERROR")
-                if result.stderr:
-                    print(result.stderr)
+            if returncode == EXIT_CONFIG_ERROR:
+                self.log("Agent gestopt door een configuratiefout (provider/model); geen nieuwe poging", "ERROR")
+                metrics["error"] = "config"
+                return False
+            if returncode != 0:
+                self.log(f"Agent gefaald met exit code {returncode}", "ERROR")
+                metrics["error"] = "exit_code"
                 return False
             
             if not output_file.exists():
                 self.log(f"Output bestand niet aangemaakt: {output_file}", "ERROR")
+                metrics["error"] = "missing_output"
                 return False
             
-            # Read and log excerpt
-            with open(output_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                lines = content.split('\n')
-                self.log(f"✓ Output gegenereerd: {len(lines)} regels, {len(content)} tekens", "SUCCESS")
+            result = self.read_result(result_path)
+            for key in ("cpu_seconds", "peak_rss_kb"):
+                if metrics[key] is None:
+                    metrics[key] = result.get(key)
+            metrics["cache"] = result.get('cache')
+            metrics["output_bytes"] = result.get('output_bytes', output_file.stat().st_size)
+            lines, chars = self.output_stats(output_file, result)
+            self.log(f"✓ Output gegenereerd: {lines} regels, {chars} tekens ({metrics['wall_seconds']:.2f}s)", "SUCCESS")
             
             return True
-            
-        except subprocess.TimeoutExpired:
-            self.log(f"Agent timeout na 5 minuten", "ERROR")
+        
+        except asyncio.TimeoutError:
+            metrics["wall_seconds"] = round(time.perf_counter() - started, 3)
+            metrics["error"] = "timeout"
+            self.log(f"Agent timeout na {timeout:.0f}s", "ERROR")
             return False
         except Exception as e:
+            metrics["error"] = "exception"
             self.log(f"Fout bij uitvoeren agent: {e}", "ERROR")
             return False
+        finally:
+            if result_path:
+                result_path.unlink(missing_ok=True)
     
-    def run_hypothesis_to_cdm(self, initial_input: str) -> bool:
-        """
-        Workflow: Founding Hypothesis → CDM
+    def runner_uses_runtime(self, runner_path: Path) -> bool:
+        """True for runners built on agent_runtime (which provides --no-cache and --result-file)."""
+        with open(runner_path, 'r', encoding='utf-8') as f:
+            return any('add_runtime_arguments' in line for line in f)
+    
+    def read_result(self, result_path: Optional[Path]) -> Dict:
+        """Result metadata written by the runner via --result-file; empty if unavailable."""
+        if not result_path or not result_path.exists() or not result_path.stat().st_size:
+            return {}
+        try:
+            with open(result_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except ValueError:
+            return {}
+    
+    def output_stats(self, output_file: Path, result: Dict) -> Tuple[int, int]:
+        """Lines and characters of an output: from the runner's result metadata, else one streamed pass."""
+        if 'output_lines' in result and 'output_chars' in result:
+            return result['output_lines'], result['output_chars']
         
-        1. Founding Hypothesis Owner: concept → founding hypothesis
-        2. CDM Architect: founding hypothesis → canonical data model
-        """
-        workflow_id = f"hypothesis-to-cdm-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
-        workflow_dir = self.output_dir / workflow_id
-        workflow_dir.mkdir(parents=True, exist_ok=True)
+        # Older runners: count in chunks instead of holding the whole file
+        lines, chars = 1, 0
+        with open(output_file, 'r', encoding='utf-8') as f:
+            for chunk in iter(lambda: f.read(65536), ''):
+                lines += chunk.count('\n')
+                chars += len(chunk)
+        return lines, chars
+    
+    def step_input_files(self, step: Dict, run: Dict) -> List[Path]:
+        """Input files of a step: the initial input and/or outputs of other steps."""
+        return [run['input_file'] if ref == INITIAL_INPUT else run['dir'] / run['steps_by_id'][ref]['output']
+                for ref in step['inputs']]
+    
+    def checkpoint_path(self, workflow_dir: Path) -> Path:
+        """Path of the per-step checkpoint manifest of a workflow run."""
+        return workflow_dir / CHECKPOINT_FILE
+    
+    def load_checkpoint(self, workflow_dir: Path) -> Dict:
+        """Load the checkpoint manifest of an existing workflow run."""
+        checkpoint_path = self.checkpoint_path(workflow_dir)
+        if not checkpoint_path.exists():
+            raise FileNotFoundError(f"Geen checkpoint manifest gevonden: {checkpoint_path}")
+        with open(checkpoint_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    def write_checkpoint(self, run: Dict):
+        """Atomically write the checkpoint manifest of a run."""
+        checkpoint_path = self.checkpoint_path(run['dir'])
+        tmp_path = checkpoint_path.with_name(checkpoint_path.name + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(run['checkpoint'], f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, checkpoint_path)
+    
+    def record_step(self, step: Dict, run: Dict, status: str, metrics: Optional[Dict] = None):
+        """Record the outcome of a step, with input/output hashes and metrics, in the checkpoint."""
+        entry = {"status": status, "output": step['output'], "updated": datetime.now().isoformat()}
+        if metrics:
+            entry["metrics"] = metrics
+        if status == "completed":
+            entry["input_sha256"] = {f.name: file_sha256(f) for f in self.step_input_files(step, run)}
+            entry["output_sha256"] = file_sha256(run['dir'] / step['output'])
+        run['checkpoint']['steps'][step['id']] = entry
+        self.write_checkpoint(run)
+    
+    def valid_checkpointed_steps(self, steps: List[Dict], run: Dict) -> set:
+        """Steps whose checkpoint is still valid: completed, unchanged output and inputs, valid needs."""
+        valid = set()
+        recorded = run['checkpoint'].get('steps', {})
+        for step_id in self.topological_order(steps):
+            step = run['steps_by_id'][step_id]
+            entry = recorded.get(step_id)
+            if not entry or entry.get("status") != "completed" or entry.get("output") != step['output']:
+                continue
+            if not set(step['needs']) <= valid:
+                continue  # An upstream step is re-executed, so this one is invalidated
+            output_file = run['dir'] / step['output']
+            if not output_file.exists() or file_sha256(output_file) != entry.get("output_sha256"):
+                self.log(f"Checkpoint ongeldig (output gewijzigd of ontbreekt): {step_id}", "WARNING")
+                continue
+            input_files = self.step_input_files(step, run)
+            current_inputs = {f.name: file_sha256(f) for f in input_files if f.exists()}
+            if len(current_inputs) != len(input_files) or current_inputs != entry.get("input_sha256"):
+                self.log(f"Checkpoint ongeldig (input gewijzigd): {step_id}", "WARNING")
+                continue
+            valid.add(step_id)
+        return valid
+    
+    async def run_step(self, step: Dict, run: Dict) -> bool:
+        """Run one workflow step, retrying transient failures per its policy within the deadline."""
+        self.log(f"STAP {step['number']}/{len(run['steps_by_id'])}: {step['id']} ({step['agent']})", "STEP")
+        self.record_step(step, run, "running")
+        policy = step['policy']
+        metrics = {}
+        status = "failed"
         
-        self.log("=" * 70, "INFO")
-        self.log(f"WORKFLOW: Founding Hypothesis → CDM", "INFO")
-        self.log(f"ID: {workflow_id}", "INFO")
-        self.log(f"Output: {workflow_dir.relative_to(self.repo_root)}", "INFO")
-        self.log("=" * 70, "INFO")
+        try:
+            for attempt in range(1, policy['max_attempts'] + 1):
+                timeout = policy['timeout']
+                remaining = self.remaining_time(run)
+                if remaining is not None:
+                    if remaining <= 0:
+                        self.log(f"Deadline verstreken; stap {step['id']} geannuleerd", "WARNING")
+                        metrics = {"attempt": attempt, "error": DEADLINE_ERROR}
+                        status = "cancelled"
+                        break
+                    timeout = min(timeout, remaining)
+                # The attempt is cut short by the workflow deadline, not by the step's own timeout
+                clipped_by_deadline = timeout < policy['timeout']
+                
+                metrics = {"attempt": attempt}
+                if await self.run_agent(step['phase'], step['agent_name'], self.step_input_files(step, run),
+                                        run['dir'] / step['output'], label=run['label_prefix'] + step['id'],
+                                        metrics=metrics, timeout=timeout):
+                    status = "completed"
+                    break
+                if metrics["error"] == "timeout" and clipped_by_deadline:
+                    self.log(f"Deadline verstreken tijdens {step['id']}; stap geannuleerd", "WARNING")
+                    metrics["error"] = DEADLINE_ERROR
+                    status = "cancelled"
+                    break
+                if metrics["error"] not in RETRYABLE_ERRORS or attempt == policy['max_attempts']:
+                    break
+                
+                delay = self.backoff_delay(policy, attempt)
+                remaining = self.remaining_time(run)
+                if remaining is not None and remaining <= delay:
+                    self.log(f"Geen tijd voor nieuwe poging binnen de deadline: {step['id']}", "WARNING")
+                    break
+                self.log(f"Poging {attempt}/{policy['max_attempts']} van {step['id']} gefaald; "
+                         f"opnieuw over {delay:.1f}s", "WARNING")
+                await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.record_step(step, run, "cancelled", metrics)
+            raise
+        
+        self.record_step(step, run, status, metrics)
+        return status == "completed"
+    
+    async def execute_dag(self, steps: List[Dict], run: Dict, completed: Optional[set] = None) -> bool:
+        """Start each step as a task as soon as its needs are done; runner slots bound the concurrency."""
+        completed = set(completed or ())
+        pending = {step['id']: step for step in steps if step['id'] not in completed}
+        running: Dict[asyncio.Task, Dict] = {}
+        failed = False
+        deadline_passed = False
+        
+        try:
+            while pending or running:
+                remaining = self.remaining_time(run)
+                if remaining is not None and remaining <= 0 and pending and not (failed or deadline_passed):
+                    self.log("Deadline verstreken; geen nieuwe stappen meer gestart", "WARNING")
+                    deadline_passed = True
+                if not (failed or deadline_passed):
+                    ready = [step for step in pending.values() if set(step['needs']) <= completed]
+                    for step in ready:
+                        del pending[step['id']]
+                        running[asyncio.create_task(self.run_step(step, run))] = step
+                
+                if not running:
+                    break
+                
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    step = running.pop(task)
+                    try:
+                        success = task.result()
+                    except Exception as e:
+                        self.log(f"Fout in stap {step['id']}: {e}", "ERROR")
+                        success = False
+                    if success:
+                        completed.add(step['id'])
+                    elif run['checkpoint']['steps'].get(step['id'], {}).get('status') == "cancelled":
+                        # Stopped by the deadline: not a failure of the step itself
+                        deadline_passed = True
+                    else:
+                        # Stop scheduling new steps; running steps are allowed to finish
+                        failed = True
+        except asyncio.CancelledError:
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+            raise
         
-        # Create initial input file
+        if failed:
+            skipped = [step_id for step_id in pending]
+            if skipped:
+                self.log(f"Niet uitgevoerd door eerdere fout: {', '.join(skipped)}", "WARNING")
+        elif deadline_passed:
+            # Steps the deadline kept from starting are cancelled, not failed
+            for step in pending.values():
+                self.record_step(step, run, "cancelled", {"attempt": 0, "error": DEADLINE_ERROR})
+            if pending:
+                self.log(f"Geannuleerd door deadline: {', '.join(pending)}", "WARNING")
+        return not (failed or deadline_passed)
+    
+    def run_workflow(self, workflow_name: Optional[str], initial_input: Optional[str],
+                     resume_id: Optional[str] = None) -> bool:
+        """Run (or resume) a declared workflow; synchronous wrapper around run_workflow_async."""
+        return self.run(self.run_workflow_async(workflow_name, initial_input, resume_id=resume_id))
+    
+    async def run_workflow_async(self, workflow_name: Optional[str], initial_input: Optional[str],
+                                 resume_id: Optional[str] = None, workflow_id: Optional[str] = None,
+                                 output_dir: Optional[Path] = None) -> bool:
+        """Run (or resume) a declared workflow and write workflow-summary.json."""
+        # Batch items pass their own workflow_id; it prefixes their streamed output
+        label_prefix = f"{workflow_id}/" if workflow_id else ""
+        output_dir = output_dir or self.output_dir
+        if resume_id:
+            workflow_id = resume_id
+            workflow_dir = output_dir / workflow_id
+            if not workflow_dir.is_dir():
+                raise FileNotFoundError(f"Workflow run niet gevonden: {workflow_dir}")
+            checkpoint = self.load_checkpoint(workflow_dir)
+            if workflow_name and workflow_name != checkpoint['workflow']:
+                raise ValueError(f"Workflow run {workflow_id} hoort bij '{checkpoint['workflow']}', niet bij '{workflow_name}'")
+            workflow_name = checkpoint['workflow']
+        else:
+            workflow_id = workflow_id or f"{workflow_name}-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+            workflow_dir = output_dir / workflow_id
+            workflow_dir.mkdir(parents=True, exist_ok=True)
+            checkpoint = {"workflow": workflow_name, "workflow_id": workflow_id, "steps": {}}
+        
+        definition = self.load_workflow(workflow_name)
+        steps = definition['steps']
         input_file = workflow_dir / "0-initial-concept.txt"
-        with open(input_file, 'w', encoding='utf-8') as f:
-            f.write(initial_input)
-        self.log(f"Initial input opgeslagen: {input_file.name}", "INFO")
+        run = {
+            "workflow": workflow_name,
+            "workflow_id": workflow_id,
+            "dir": workflow_dir,
+            "input_file": input_file,
+            "steps_by_id": {step['id']: step for step in steps},
+            "checkpoint": checkpoint,
+            "label_prefix": label_prefix,
+            "deadline": None
+        }
         
-        # Step 1: Founding Hypothesis Owner
-        self.log("", "INFO")
-        self.log("STAP 1/2: Founding Hypothesis Owner", "STEP")
-        self.log("-" * 70, "INFO")
-        hypothesis_file = workflow_dir / "1-founding-hypothesis.md"
-        if not self.run_agent("a1", "founding-hypothesis-owner", input_file, hypothesis_file):
-            return False
+        try:
+            output_display = workflow_dir.relative_to(self.repo_root)
+        except ValueError:
+            output_display = workflow_dir
         
-        # Step 2: CDM Architect
-        self.log("", "INFO")
-        self.log("STAP 2/2: CDM Architect", "STEP")
-        self.log("-" * 70, "INFO")
-        cdm_file = workflow_dir / "2-canonical-data-model.md"
-        if not self.run_agent("b1", "cdm-architect", hypothesis_file, cdm_file):
-            return False
+        self.log("=" * 70, "INFO")
+        self.log(f"WORKFLOW: {definition.get('title', workflow_name)}", "INFO")
+        self.log(f"ID: {workflow_id}{' (hervat)' if resume_id else ''}", "INFO")
+        self.log(f"Output: {output_display}", "INFO")
+        self.log("=" * 70, "INFO")
+        
+        started = time.perf_counter()
+        deadline = self.deadline if self.deadline is not None else definition.get('deadline')
+        if deadline is not None:
+            run['deadline'] = time.monotonic() + float(deadline)
+            self.log(f"Deadline: {float(deadline):.0f}s", "INFO")
+        completed = set()
+        if resume_id:
+            if not input_file.exists():
+                raise FileNotFoundError(f"Initial input ontbreekt in workflow run: {input_file}")
+            with open(input_file, 'r', encoding='utf-8') as f:
+                initial_input = f.read()
+            completed = self.valid_checkpointed_steps(steps, run)
+            rerun = [step['id'] for step in steps if step['id'] not in completed]
+            self.log(f"Geldige checkpoints: {', '.join(sorted(completed)) or 'geen'}", "INFO")
+            self.log(f"Opnieuw uit te voeren: {', '.join(rerun) or 'geen'}", "INFO")
+        else:
+            # Create initial input file
+            with open(input_file, 'w', encoding='utf-8') as f:
+                f.write(initial_input)
+            self.log(f"Initial input opgeslagen: {input_file.name}", "INFO")
+            self.write_checkpoint(run)
+        
+        succeeded = await self.execute_dag(steps, run, completed)
         
-        # Create workflow summary
+        # Create workflow summary (also for a failed or cancelled run, so the outcome per step is on disk)
         summary_file = workflow_dir / "workflow-summary.json"
+        steps_summary = []
+        artifacts = {"0_initial_input": str(input_file.name)}
+        for step in steps:
+            step_inputs = [f.name for f in self.step_input_files(step, run)]
+            recorded = checkpoint['steps'].get(step['id'], {})
+            steps_summary.append({
+                "step": step['number'],
+                "agent": step['agent_name'],
+                "phase": step['phase'],
+                "input": step_inputs[0] if len(step_inputs) == 1 else step_inputs,
+                "output": step['output'],
+                "description": step.get('description', ''),
+                "status": recorded.get('status', "not_started"),
+                # Steps kept from a checkpoint report the metrics of the run that produced them
+                "reused": step['id'] in completed,
+                "metrics": recorded.get('metrics', {})
+            })
+            artifacts[step.get('artifact') or f"{step['number']}_{step['id'].replace('-', '_')}"] = step['output']
+        artifacts["summary"] = str(summary_file.name)
+        
         summary = {
-            "workflow": "hypothesis-to-cdm",
+            "workflow": workflow_name,
             "workflow_id": workflow_id,
             "timestamp": datetime.now().isoformat(),
+            "status": self.workflow_status(steps_summary),
             "initial_input_preview": initial_input[:200] + ("..." if len(initial_input) > 200 else ""),
-            "steps": [
-                {
-                    "step": 1,
-                    "agent": "founding-hypothesis-owner",
-                    "phase": "a1",
-                    "input": str(input_file.name),
-                    "output": str(hypothesis_file.name),
-                    "description": "Schrijft founding hypothesis op basis van initieel concept"
-                },
-                {
-                    "step": 2,
-                    "agent": "cdm-architect",
-                    "phase": "b1",
-                    "input": str(hypothesis_file.name),
-                    "output": str(cdm_file.name),
-                    "description": "Maakt canonical data model op basis van hypothesis"
-                }
-            ],
-            "artifacts": {
-                "0_initial_input": str(input_file.name),
-                "1_founding_hypothesis": str(hypothesis_file.name),
-                "2_canonical_data_model": str(cdm_file.name),
-                "summary": str(summary_file.name)
-            }
+            "steps": steps_summary,
+            "totals": self.summary_totals(steps_summary, time.perf_counter() - started),
+            "artifacts": artifacts
         }
         
         with open(summary_file, 'w', encoding='utf-8') as f:
             json.dump(summary, f, indent=2, ensure_ascii=False)
         
+        if not succeeded:
+            self.log(f"Samenvatting: {summary_file}", "INFO")
+            self.log(f"Hervat met: --resume {workflow_id}", "INFO")
+            return False
+        
         self.log("", "INFO")
         self.log("=" * 70, "SUCCESS")
         self.log("WORKFLOW VOLTOOID!", "SUCCESS")
         self.log("=" * 70, "SUCCESS")
         self.log("", "INFO")
         self.log("Gegenereerde artefacten:", "INFO")
-        self.log(f"  📝 {hypothesis_file.name}", "INFO")
-        self.log(f"  📊 {cdm_file.name}", "INFO")
+        for step in steps:
+            self.log(f"  📝 {step['output']}", "INFO")
         self.log(f"  📋 {summary_file.name}", "INFO")
         self.log("", "INFO")
         self.log(f"Volledige output: {workflow_dir}", "INFO")
         
         return True
+    
+    def workflow_status(self, steps_summary: List[Dict]) -> str:
+        """Overall status: failed if a step failed, cancelled if the deadline stopped steps, else completed."""
+        statuses = {entry['status'] for entry in steps_summary}
+        if "failed" in statuses:
+            return "failed"
+        if statuses - {"completed"}:
+            return "cancelled"
+        return "completed"
+    
+    def summary_totals(self, steps_summary: List[Dict], wall_seconds: float) -> Dict:
+        """Workflow totals over the steps executed in this run."""
+        executed = [entry for entry in steps_summary
+                    if not entry['reused'] and entry['status'] != "not_started"
+                    and entry['metrics'].get('attempt')]
+        
+        def count(status):
+            return sum(1 for entry in steps_summary if entry['status'] == status)
+        
+        def values(key):
+            return [entry['metrics'][key] for entry in executed if entry['metrics'].get(key) is not None]
+        
+        slowest = max(executed, key=lambda entry: entry['metrics'].get('wall_seconds') or 0, default=None)
+        caches = values('cache')
+        return {
+            "wall_seconds": round(wall_seconds, 3),
+            "steps_executed": len(executed),
+            "steps_reused": sum(1 for entry in steps_summary if entry['reused']),
+            "steps_failed": count("failed"),
+            # Stopped by the workflow deadline; reported apart from failures and never retried
+            "steps_cancelled": count("cancelled"),
+            "steps_not_started": count("not_started"),
+            "step_wall_seconds": round(sum(values('wall_seconds')), 3),
+            "cpu_seconds": round(sum(values('cpu_seconds')), 3),
+            "peak_rss_kb": max(values('peak_rss_kb'), default=None),
+            "input_bytes": sum(values('input_bytes')),
+            "output_bytes": sum(values('output_bytes')),
+            "cache_hits": caches.count("hit"),
+            "cache_misses": caches.count("miss"),
+            "slowest_step": slowest['agent'] if slowest else None
+        }
+    
+    async def run_batch_item(self, workflow_name: str, input_file: Path, workflow_id: str,
+                             batch_dir: Path) -> Dict:
+        """Run the workflow for one batch input and return its batch summary entry."""
+        item = {
+            "input": str(input_file),
+            "workflow_id": workflow_id,
+            "status": "failed",
+            "duration_seconds": 0.0,
+            "outputs": {},
+            "error": None
+        }
+        start = time.monotonic()
+        try:
+            with open(input_file, 'r', encoding='utf-8') as f:
+                initial_input = f.read()
+            success = await self.run_workflow_async(workflow_name, initial_input, workflow_id=workflow_id,
+                                                    output_dir=batch_dir)
+            item["status"] = "completed" if success else "failed"
+        except Exception as e:
+            self.log(f"Fout in batch item {workflow_id}: {e}", "ERROR")
+            item["error"] = str(e)
+        item["duration_seconds"] = round(time.monotonic() - start, 3)
+        
+        workflow_dir = batch_dir / workflow_id
+        summary_file = workflow_dir / "workflow-summary.json"
+        if item["error"] is None and summary_file.exists():
+            with open(summary_file, 'r', encoding='utf-8') as f:
+                summary = json.load(f)
+            # Distinguishes runs stopped by the deadline ('cancelled') from failed runs
+            item["status"] = summary.get("status", item["status"])
+            item["totals"] = summary.get("totals", {})
+        try:
+            for step in self.load_workflow(workflow_name)['steps']:
+                output_file = workflow_dir / step['output']
+                if output_file.exists():
+                    item["outputs"][step['output']] = output_file.stat().st_size
+        except (FileNotFoundError, ValueError):
+            pass
+        return item
+    
+    def run_batch(self, workflow_name: str, input_files: List[Path], batch_workers: int) -> bool:
+        """Run a workflow for many inputs; synchronous wrapper around run_batch_async."""
+        return self.run(self.run_batch_async(workflow_name, input_files, batch_workers))
+    
+    async def run_batch_async(self, workflow_name: str, input_files: List[Path], batch_workers: int) -> bool:
+        """Run a workflow for many inputs, each in its own workflow directory, and write batch-summary.json."""
+        # Validate the workflow once, before fanning out
+        self.load_workflow(workflow_name)
+        
+        batch_id = f"{workflow_name}-batch-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+        batch_dir = self.output_dir / batch_id
+        batch_dir.mkdir(parents=True, exist_ok=True)
+        
+        # One workflow directory per input, named after the input file
+        workflow_ids = []
+        for number, input_file in enumerate(input_files, 1):
+            slug = re.sub(r'[^A-Za-z0-9_-]+', '-', input_file.stem).strip('-') or "input"
+            workflow_ids.append(f"{number:03d}-{slug}")
+        
+        self.log("=" * 70, "INFO")
+        self.log(f"BATCH: {workflow_name} ({len(input_files)} inputs, {batch_workers} parallel)", "INFO")
+        self.log(f"Output: {batch_dir}", "INFO")
+        self.log("=" * 70, "INFO")
+        
+        start = time.monotonic()
+        batch_slots = asyncio.Semaphore(batch_workers)
+        
+        async def run_item(input_file: Path, workflow_id: str) -> Dict:
+            async with batch_slots:
+                return await self.run_batch_item(workflow_name, input_file, workflow_id, batch_dir)
+        
+        items = await asyncio.gather(*(run_item(input_file, workflow_id)
+                                       for input_file, workflow_id in zip(input_files, workflow_ids)))
+        
+        succeeded = sum(1 for item in items if item["status"] == "completed")
+        summary = {
+            "workflow": workflow_name,
+            "batch_id": batch_id,
+            "timestamp": datetime.now().isoformat(),
+            "duration_seconds": round(time.monotonic() - start, 3),
+            "total": len(items),
+            "completed": succeeded,
+            "failed": len(items) - succeeded,
+            "items": items
+        }
+        summary_file = batch_dir / BATCH_SUMMARY_FILE
+        with open(summary_file, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2, ensure_ascii=False)
+        
+        self.log("", "INFO")
+        self.log("=" * 70, "SUCCESS" if succeeded == len(items) else "WARNING")
+        self.log(f"BATCH VOLTOOID: {succeeded}/{len(items)} geslaagd in {summary['duration_seconds']:.1f}s",
+                 "SUCCESS" if succeeded == len(items) else "WARNING")
+        self.log("=" * 70, "SUCCESS" if succeeded == len(items) else "WARNING")
+        for item in items:
+            status = "✓" if item["status"] == "completed" else "✗"
+            self.log(f"  {status} {item['workflow_id']} ({item['duration_seconds']:.1f}s)", "INFO")
+        self.log(f"Batch samenvatting: {summary_file}", "INFO")
+        if succeeded != len(items):
+            self.log(f"Hervat een item met: --output-dir {batch_dir} --resume <workflow_id>", "INFO")
+        
+        return succeeded == len(items)
+    
+    def run_hypothesis_to_cdm(self, initial_input: str) -> bool:
+        """
+        Workflow: Founding Hypothesis → CDM
+
+        1. Founding Hypothesis Owner: concept → founding hypothesis
+        2. CDM Architect: founding hypothesis → canonical data model
+        """
+        return self.run_workflow("hypothesis-to-cdm", initial_input)
 
 
 def main():
@@ -200,26 +1016,34 @@ def main():
         description='Orchestreert workflows van meerdere agents',
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
-Workflows:
+Workflows (agent-componenten/workflows/<naam>.workflow.yaml):
   hypothesis-to-cdm    Van concept naar founding hypothesis en CDM
-  
+  cdm-to-design        Van CDM naar logisch/technisch datamodel en service ontwerp
+
 Voorbeelden:
   # Met directe input
   python scripts/run-workflow.py --workflow hypothesis-to-cdm --input "Een platform voor online cursussen"
-  
+
   # Met input file
   python scripts/run-workflow.py --workflow hypothesis-to-cdm --input-file concept.txt
-  
+
   # Met custom output directory
   python scripts/run-workflow.py --workflow hypothesis-to-cdm --input "..." --output-dir ./output
+
+  # Batch: elk bestand in een directory (of glob) als aparte workflow run
+  python scripts/run-workflow.py --workflow hypothesis-to-cdm --input-dir concepts/ --batch-workers 8
+  python scripts/run-workflow.py --workflow hypothesis-to-cdm --input-glob "concepts/**/*.txt"
 """
     )
     
     parser.add_argument(
         "--workflow",
-        required=True,
-        choices=["hypothesis-to-cdm"],
-        help="De workflow om uit te voeren"
+        help="De workflow om uit te voeren (naam van een agent-componenten/workflows/*.workflow.yaml)"
+    )
+    parser.add_argument(
+        "--resume",
+        metavar="WORKFLOW_ID",
+        help="Hervat een eerdere run in <output-dir>/<WORKFLOW_ID>; alleen gefaalde of ongeldige stappen draaien opnieuw"
     )
     parser.add_argument(
         "--input",
@@ -230,6 +1054,21 @@ Voorbeelden:
         type=Path,
         help="Pad naar input bestand"
     )
+    parser.add_argument(
+        "--input-dir",
+        type=Path,
+        help="Batch: voer de workflow uit voor elk bestand in deze directory"
+    )
+    parser.add_argument(
+        "--input-glob",
+        help="Batch: voer de workflow uit voor elk bestand dat matcht (bv. 'concepts/**/*.txt')"
+    )
+    parser.add_argument(
+        "--batch-workers",
+        type=int,
+        default=4,
+        help="Batch: maximaal aantal parallel uitgevoerde workflows (default: 4)"
+    )
     parser.add_argument(
         "--output-dir",
         type=Path,
@@ -240,15 +1079,66 @@ Voorbeelden:
         type=Path,
         help="Root directory van de repository (default: current directory)"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Gebruik de runner result cache niet"
+    )
+    parser.add_argument(
+        "--executor",
+        choices=["subprocess", "worker"],
+        default="subprocess",
+        help="subprocess: nieuw Python proces per stap; worker: persistente worker processen die runners als module importeren"
+    )
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        metavar="SECONDS",
+        help="Maximale duur per workflow run; daarna worden resterende stappen geannuleerd (overschrijft 'deadline' uit de workflow)"
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=4,
+        help="Maximaal aantal parallel uitgevoerde stappen (default: 4)"
+    )
     
     args = parser.parse_args()
     
     # Validate input
-    if not args.input and not args.input_file:
-        parser.error("--input of --input-file is vereist")
+    batch = bool(args.input_dir or args.input_glob)
+    if not args.workflow and not args.resume:
+        parser.error("--workflow of --resume is vereist")
+    if batch and (args.resume or args.input or args.input_file):
+        parser.error("--input-dir/--input-glob kan niet samen met --resume, --input of --input-file")
+    if not batch and not args.resume and not args.input and not args.input_file:
+        parser.error("--input, --input-file, --input-dir of --input-glob is vereist")
+    if args.max_workers < 1:
+        parser.error("--max-workers moet minimaal 1 zijn")
+    if args.batch_workers < 1:
+        parser.error("--batch-workers moet minimaal 1 zijn")
+    if args.deadline is not None and args.deadline <= 0:
+        parser.error("--deadline moet positief zijn")
     
-    # Read input
-    if args.input_file:
+    # Read input (bij --resume komt de input uit de bestaande workflow directory)
+    batch_inputs = []
+    initial_input = None
+    if batch:
+        if args.input_dir:
+            if not args.input_dir.is_dir():
+                print(f"[\033[91mERROR\033[0m] Input directory niet gevonden: {args.input_dir}")
+                return 1
+            batch_inputs.extend(p for p in sorted(args.input_dir.iterdir()) if p.is_file())
+        if args.input_glob:
+            batch_inputs.extend(Path(p) for p in sorted(glob.glob(args.input_glob, recursive=True))
+                                if Path(p).is_file())
+        batch_inputs = list(dict.fromkeys(batch_inputs))
+        if not batch_inputs:
+            print(f"[\033[91mERROR\033[0m] Geen input bestanden gevonden voor batch")
+            return 1
+    elif args.resume:
+        initial_input = None
+    elif args.input_file:
         if not args.input_file.exists():
             print(f"[\033[91mERROR\033[0m] Input bestand niet gevonden: {args.input_file}")
             return 1
@@ -260,15 +1150,30 @@ Voorbeelden:
     # Initialize orchestrator
     orchestrator = WorkflowOrchestrator(
         repo_root=args.repo_root,
-        output_dir=args.output_dir
+        output_dir=args.output_dir,
+        use_cache=not args.no_cache,
+        max_workers=args.max_workers,
+        executor=args.executor,
+        deadline=args.deadline
     )
     
-    # Run workflow
-    if args.workflow == "hypothesis-to-cdm":
-        success = orchestrator.run_hypothesis_to_cdm(initial_input)
-        return 0 if success else 1
+    available = orchestrator.list_workflows()
+    if args.workflow and args.workflow not in available:
+        parser.error(f"Onbekende workflow '{args.workflow}' (beschikbaar: {', '.join(available) or 'geen'})")
     
-    return 1
+    # Run workflow
+    try:
+        if batch:
+            success = orchestrator.run_batch(args.workflow, batch_inputs, args.batch_workers)
+        else:
+            success = orchestrator.run_workflow(args.workflow, initial_input, resume_id=args.resume)
+    except (FileNotFoundError, ValueError) as e:
+        orchestrator.log(f"Ongeldige workflow: {e}", "ERROR")
+        return 1
+    except KeyboardInterrupt:
+        orchestrator.log("Afgebroken; lopende stappen zijn geannuleerd", "WARNING")
+        return 130
+    return 0 if success else 1
 
 
 if __name__ == '__main__':
@@ -13,6 +13,7 @@ Datum: 04-01-2026
 
 import argparse
 import json
+import pprint
 import sys
 from pathlib import Path
 from datetime import datetime
@@ -40,116 +41,54 @@ def load_plan(plan_path: Path) -> dict:
         return json.load(f)
 
 
+def build_agent_config(plan: dict) -> dict:
+    """Select the plan fields a runner needs at runtime (workspace-relative)."""
+    return {
+        'agentId': plan['agentId'],
+        'agentName': plan['agentName'],
+        'phase': plan['phase'],
+        'prompt': Path(plan['promptPath']).name,
+        'charter': plan.get('charterUrl', plan['charterPath']),
+        'outputRoot': plan['outputRoot'],
+        'runtime': plan['runtime'],
+        'qualityGates': plan.get('qualityGates', [])
+    }
+
+
 def generate_runner(plan: dict) -> str:
     """Generate runner script content."""
     agent_name = plan['agentName']
     phase = plan['phase']
     timestamp = datetime.now().strftime('%Y-%m-%d')
+    agent_config = pprint.pformat(build_agent_config(plan), width=100, sort_dicts=False)
     
     runner = f'''#!/usr/bin/env python3
 """
 {agent_name}.py
 
 Runner script voor {agent_name} agent.
+De uitvoering (prompt + charter + input -> LLM provider) zit in agent_runtime.py.
 
 Agent: {plan['agentId']}
 Fase: {phase}
-Charter: {plan['charterPath']}
+Charter: {plan.get('charterUrl', plan['charterPath'])}
 Gegenereerd: {timestamp}
 """
 
 import argparse
-import json
 import sys
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Optional
-
-
-class {agent_name.replace('-', '_').title().replace('_', '')}Agent:
-    """Agent implementation for {agent_name}."""
-    
-    def __init__(self, args):
-        """Initialize the agent."""
-        self.args = args
-        self.output_root = Path("{plan['outputRoot']}")
-        self.charter_path = Path("{plan['charterPath']}")
-    
-    def log(self, message: str, msg_type: str = "INFO"):
-        """Log a message."""
-        colors = {{
-            "INFO": "\\033[96m",
-            "SUCCESS": "\\033[92m",
-            "WARNING": "\\033[93m",
-            "ERROR": "\\033[91m"
-        }}
-        reset = "\\033[0m"
-        color = colors.get(msg_type, "")
-        print(f"{{color}}[{{msg_type}}] {{message}}{{reset}}")
-    
-    def validate_inputs(self):
-        """Validate input files."""
-        valid_files = []
-        for file_path in self.args.input_files:
-            path = Path(file_path)
-            if path.exists():
-                valid_files.append(str(path.resolve()))
-                self.log(f"Input bestand toegevoegd: {{file_path}}")
-            else:
-                self.log(f"Bestand niet gevonden: {{file_path}}", "WARNING")
-        
-        if not valid_files:
-            raise ValueError("Geen geldige input bestanden gevonden")
-        
-        self.args.input_files = valid_files
-    
-    def run(self) -> Dict:
-        """Execute the agent logic."""
-        try:
-            self.log(f"Starten {{agent_name}} agent...")
-            
-            # Validate inputs
-            self.validate_inputs()
-            
-            # PLACEHOLDER: Hier zou de daadwerkelijke agent logic komen
-            # Dit zou typisch een LLM call zijn met de prompt uit {plan['promptPath']}
-            
-            self.log("LET OP: Dit is een placeholder runner", "WARNING")
-            self.log("De daadwerkelijke agent-logica zou hier via LLM gebeuren", "WARNING")
-            
-            # Generate output
-            output_file = self.output_root / f"{{agent_name}}-{{datetime.now().strftime('%Y%m%d-%H%M%S')}}.md"
-            output_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            output_content = f"""# {{agent_name}} Output
-
-**Gegenereerd**: {{datetime.now().isoformat()}}
-**Input bestanden**: {{', '.join(self.args.input_files)}}
-
-## PLACEHOLDER
-
-Dit is placeholder output. De daadwerkelijke output zou gegenereerd worden
-door de LLM op basis van:
-- Charter: {{self.charter_path}}
-- Prompt: {plan['promptPath']}
-- Input bestanden
-"""
-            
-            output_file.write_text(output_content, encoding='utf-8')
-            self.log(f"Output geschreven naar: {{output_file}}", "SUCCESS")
-            
-            return {{
-                'status': 'Success',
-                'output_file': str(output_file),
-                'timestamp': datetime.now().isoformat()
-            }}
-            
-        except Exception as e:
-            self.log(f"Fout tijdens agent uitvoering: {{e}}", "ERROR")
-            raise
 
+# agent_runtime.py staat naast de runners
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from agent_runtime import (AgentRuntime, ConfigurationError, EXIT_CONFIG_ERROR, add_runtime_arguments,
+                           log, write_result)
 
-def main():
+
+AGENT_CONFIG = {agent_config}
+
+
+def main(argv=None):
     """Main entry point."""
     parser = argparse.ArgumentParser(
         description='Runner voor {agent_name} agent',
@@ -165,10 +104,26 @@ def main():
     parser.add_argument('-v', '--verbose', action='store_true',
                        help='Uitgebreide output')
     
-    args = parser.parse_args()
+    add_runtime_arguments(parser)
     
-    agent = {agent_name.replace('-', '_').title().replace('_', '')}Agent(args)
-    result = agent.run()
+    args = parser.parse_args(argv)
+    
+    runtime = AgentRuntime(AGENT_CONFIG, Path(__file__), provider=args.provider, model=args.model,
+                           use_cache=not args.no_cache)
+    try:
+        result = runtime.run(args.input_files, args.output_file)
+    except ConfigurationError as e:
+        log(f"Configuratiefout: {{e}}", "ERROR")
+        return EXIT_CONFIG_ERROR
+    except Exception as e:
+        log(f"Fout tijdens agent uitvoering: {{e}}", "ERROR")
+        return 1
+    
+    if args.result_file:
+        write_result(args.result_file, result)
+    
+    if args.verbose:
+        log(f"Resultaat: {{result}}")
     
     return 0 if result['status'] == 'Success' else 1
 
@@ -194,6 +149,19 @@ def write_runner(runner_path: Path, content: str):
         pass
 
 
+def build(plan: dict) -> Path:
+    """Build the runner for an already loaded build plan (in-process API)."""
+    log("Genereren runner script...")
+    runner_content = generate_runner(plan)
+    
+    runner_path = Path(plan['runnerPath'])
+    log(f"Schrijven runner: {runner_path}")
+    write_runner(runner_path, runner_content)
+    
+    log(f"Runner builder voltooid voor: {plan['agentName']}", "SUCCESS")
+    return runner_path
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(description='Builder voor agent runner scripts')
@@ -206,15 +174,7 @@ def main():
         log(f"Laden build plan: {plan_path}")
         
         plan = load_plan(plan_path)
-        
-        log("Genereren runner script...")
-        runner_content = generate_runner(plan)
-        
-        runner_path = Path(plan['runnerPath'])
-        log(f"Schrijven runner: {runner_path}")
-        write_runner(runner_path, runner_content)
-        
-        log(f"Runner builder voltooid voor: {plan['agentName']}", "SUCCESS")
+        build(plan)
         return 0
         
     except Exception as e:
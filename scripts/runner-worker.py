@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+runner-worker.py
+
+Persistent worker proces voor run-workflow.py (--executor worker).
+
+Het worker proces blijft draaien en voert runners uit als geïmporteerde modules,
+zodat niet per stap een nieuwe interpreter gestart en alle imports opnieuw
+gedaan hoeven te worden. Een crashende runner neemt alleen dit worker proces
+mee; de orchestrator start dan een nieuwe worker.
+
+PROTOCOL (JSON per regel):
+  stdin  <- {"id": 1, "runner": "<pad naar runner.py>", "argv": ["--input-files", ...]}
+  stdout -> {"type": "output", "id": 1, "line": "..."}        (runner output, per regel)
+  stdout -> {"type": "result", "id": 1, "exit_code": 0, "error": null,
+             "usage": {"cpu_seconds": 0.05, "peak_rss_kb": 31000}}
+
+GEBRUIK:
+  Wordt gestart door run-workflow.py; niet bedoeld voor direct gebruik.
+
+Versie: 1.0
+Datum: 18-10-2026
+"""
+
+import importlib.util
+import json
+import os
+import sys
+import time
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import Dict, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+class OutputStream:
+    """File-like object that forwards every written line as an output message."""
+
+    def __init__(self, channel, job_id):
+        """Initialize the stream for one job."""
+        self.channel = channel
+        self.job_id = job_id
+        self.buffer = ""
+
+    def write(self, text: str) -> int:
+        """Buffer text and emit complete lines."""
+        self.buffer += text
+        while '\n' in self.buffer:
+            line, self.buffer = self.buffer.split('\n', 1)
+            send(self.channel, {"type": "output", "id": self.job_id, "line": line})
+        return len(text)
+
+    def flush(self):
+        """Flushing is a no-op; lines are sent as soon as they are complete."""
+
+    def close(self):
+        """Emit a trailing partial line, if any."""
+        if self.buffer:
+            send(self.channel, {"type": "output", "id": self.job_id, "line": self.buffer})
+            self.buffer = ""
+
+
+def send(channel, message: Dict):
+    """Write one protocol message."""
+    channel.write(json.dumps(message, ensure_ascii=False) + "\n")
+    channel.flush()
+
+
+# Imported runner modules, keyed on (path, mtime)
+_runner_modules = {}
+
+
+def load_runner(runner_path: Path):
+    """Import a runner script as module; re-import when the file changed."""
+    key = (str(runner_path.resolve()), runner_path.stat().st_mtime_ns)
+    if key not in _runner_modules:
+        module_name = "runner_" + runner_path.stem.replace('.', '_').replace('-', '_')
+        spec = importlib.util.spec_from_file_location(module_name, runner_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _runner_modules[key] = module
+    return _runner_modules[key]
+
+
+def job_usage(cpu_started: float) -> Dict:
+    """CPU time used since cpu_started and the worker's peak RSS so far."""
+    usage = {"cpu_seconds": round(time.process_time() - cpu_started, 3)}
+    if resource:
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in kilobytes on Linux, in bytes on macOS
+        usage["peak_rss_kb"] = max_rss // 1024 if sys.platform == "darwin" else max_rss
+    return usage
+
+
+def run_job(job: Dict, channel) -> Dict:
+    """Run one runner invocation with its output forwarded as protocol messages."""
+    stream = OutputStream(channel, job["id"])
+    cpu_started = time.process_time()
+    exit_code: Optional[int] = 1
+    error = None
+    runner_path = Path(job["runner"])
+
+    with redirect_stdout(stream), redirect_stderr(stream):
+        try:
+            module = load_runner(runner_path)
+            # Runners parse sys.argv when main() gets no arguments
+            sys.argv = [str(runner_path)] + list(job.get("argv", []))
+            exit_code = module.main()
+        except SystemExit as e:
+            exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        except Exception as e:
+            error = str(e)
+            traceback.print_exc()
+            exit_code = 1
+    stream.close()
+
+    return {"type": "result", "id": job["id"], "exit_code": exit_code or 0, "error": error,
+            "usage": job_usage(cpu_started)}
+
+
+def main():
+    """Main entry point: serve jobs from stdin until it is closed."""
+    # The protocol owns the real stdout; runner output is redirected per job
+    channel = os.fdopen(os.dup(sys.stdout.fileno()), 'w', encoding='utf-8')
+    sys.stdout = sys.stderr
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            job = json.loads(line)
+        except ValueError as e:
+            send(channel, {"type": "result", "id": None, "exit_code": 1, "error": f"Ongeldige job: {e}"})
+            continue
+        send(channel, run_job(job, channel))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+yaml_utils.py
+
+Gedeelde YAML laag voor de scripts: libyaml (C) loader en dumper als die
+beschikbaar zijn, anders de pure-Python varianten van PyYAML.
+
+Bestanden worden per proces één keer geparsed: load_file() onthoudt het resultaat
+per pad en parseert pas opnieuw als mtime of grootte veranderd is. Elke aanroep
+krijgt een eigen kopie, zodat aanpassingen door de aanroeper de cache niet raken.
+
+dump() schrijft zonder regelafbreking (onbeperkte breedte). Het afbreken van lange
+regels is het verschil tussen de C en de Python emitter; zonder afbreking geven
+beide dezelfde bytes en blijft gegenereerde output gelijk, met of zonder libyaml.
+
+GEBRUIK (als module):
+  from yaml_utils import dump, load_file, safe_load
+
+  definition = load_file(Path("agent-componenten/workflows/hypothesis-to-cdm.workflow.yaml"))
+  text = dump({"name": "voorbeeld"})
+
+Benchmark van beide paden: python scripts/benchmark-yaml.py
+
+Versie: 1.0
+Datum: 18-10-2026
+"""
+
+import copy
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import yaml
+
+try:
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+    LIBYAML = True
+except ImportError:  # PyYAML zonder libyaml
+    from yaml import SafeDumper, SafeLoader
+    LIBYAML = False
+
+YAMLError = yaml.YAMLError
+
+# Emit without line folding; the only output difference between the C and Python emitters
+DUMP_WIDTH = 2 ** 31 - 1
+
+# Parsed files keyed on resolved path: ((mtime_ns, size), data)
+_file_cache: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
+
+def safe_load(stream) -> Any:
+    """yaml.safe_load with the C loader when available."""
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def dump(data: Any, stream=None, **kwargs) -> Optional[str]:
+    """
+    Byte-stable YAML: insertion order, block style, UTF-8 as-is, '\\n' line breaks.
+
+    Extra keyword arguments override these defaults.
+    """
+    options = {
+        "Dumper": SafeDumper,
+        "sort_keys": False,
+        "indent": 2,
+        "default_flow_style": False,
+        "allow_unicode": True,
+        "line_break": "\n",
+        "width": DUMP_WIDTH,
+    }
+    options.update(kwargs)
+    return yaml.dump(data, stream, **options)
+
+
+def load_file(path: Path) -> Any:
+    """Parse a YAML file once per process; re-parse only when mtime or size changed."""
+    key = str(Path(path).resolve())
+    stat = os.stat(key)
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _file_cache.get(key)
+    if cached is None or cached[0] != signature:
+        with open(key, 'r', encoding='utf-8') as f:
+            cached = (signature, safe_load(f))
+        _file_cache[key] = cached
+    return copy.deepcopy(cached[1])
+
+
+def clear_cache():
+    """Forget all parsed files (e.g. between benchmark runs)."""
+    _file_cache.clear()